@@ -0,0 +1,122 @@
+# src/bench_startup.py
+# Startup benchmark: what a fresh per-short process pays before construct() runs.
+#
+#   python -m src.bench_startup                 # every stage, 5 runs each
+#   python -m src.bench_startup -n 9 bar vs     # only these templates
+#
+# Every run is a new interpreter (cold imports, warm OS file cache); medians are reported.
+# Results are appended to cache/bench/startup.jsonl and compared with the previous record,
+# so import-time regressions show up as a delta.
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.registry import PROJECT_ROOT, template_names
+
+BENCH_FILE = os.path.join(PROJECT_ROOT, "cache", "bench", "startup.jsonl")
+
+# runs inside the child; reports its own import time + whether pandas really got loaded
+_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+{stmt}
+t1 = time.perf_counter()
+pd = sys.modules.get("pandas")
+print(json.dumps({{"import_s": t1 - t0, "pandas": pd is not None and type(pd).__name__ != "_LazyModule"}}))
+"""
+
+
+def stages(names: List[str]) -> List[Tuple[str, str]]:
+    out = [
+        ("python", "pass"),
+        ("numpy", "import numpy"),
+        ("manim", "import manim"),
+        ("src.config", "import src.config"),
+    ]
+    out += [(f"template:{n}", f"from src.registry import load_scene; load_scene({n!r})") for n in names]
+    return out
+
+
+def run_stage(stmt: str, runs: int) -> Dict:
+    walls: List[float] = []
+    imports: List[float] = []
+    pandas = False
+    for _ in range(max(1, runs)):
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(stmt=stmt)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        wall = time.perf_counter() - t0
+        if proc.returncode != 0:
+            err = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            return {"error": err}
+        rec = json.loads(proc.stdout.strip().splitlines()[-1])
+        walls.append(wall)
+        imports.append(rec["import_s"])
+        pandas = pandas or bool(rec["pandas"])
+    return {
+        "wall_ms": round(statistics.median(walls) * 1000, 1),
+        "import_ms": round(statistics.median(imports) * 1000, 1),
+        "pandas": pandas,
+    }
+
+
+def _last_record(path: str) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [ln for ln in f if ln.strip()]
+        return json.loads(lines[-1]) if lines else None
+    except Exception:
+        return None
+
+
+def _append_record(path: str, record: Dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.bench_startup", description="Per-process startup benchmark.")
+    parser.add_argument("templates", nargs="*", help="template names (default: all)")
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("--no-save", action="store_true", help="don't append to the history file")
+    args = parser.parse_args(argv)
+
+    names = args.templates or template_names()
+    prev = (_last_record(BENCH_FILE) or {}).get("stages", {})
+    results: Dict[str, Dict] = {}
+
+    print(f"{'stage':<22}{'wall ms':>10}{'import ms':>11}{'pandas':>8}{'Δ wall':>10}")
+    for label, stmt in stages(names):
+        r = run_stage(stmt, args.runs)
+        results[label] = r
+        if "error" in r:
+            print(f"{label:<22}  ERROR: {r['error']}")
+            continue
+        delta = ""
+        if "wall_ms" in prev.get(label, {}):
+            delta = f"{r['wall_ms'] - prev[label]['wall_ms']:+.1f}"
+        print(f"{label:<22}{r['wall_ms']:>10.1f}{r['import_ms']:>11.1f}{'yes' if r['pandas'] else 'no':>8}{delta:>10}")
+
+    if not args.no_save:
+        _append_record(
+            BENCH_FILE,
+            {"time": time.strftime("%Y-%m-%d %H:%M:%S"), "python": sys.version.split()[0], "runs": args.runs, "stages": results},
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,477 @@
+# src/cache_manager.py
+# One manager for every on-disk cache: sizes, access times, budgets, LRU eviction, stats.
+#
+# Manim and our own caches only ever add files (media/Tex, media/texts, partial movies,
+# cache/images, cache/data), so render boxes fill up. Each artifact class below has a byte
+# budget, and everything together has a global one. The manager keeps one OrderedDict per
+# class (oldest access first): a touch/put is a dict move, an eviction pops the head, and
+# the global pass merges class heads through a heap — no directory scan on the hot path.
+#
+# Access times come from cache/manager/access.log (appended on hits/puts, folded on load),
+# not from atime (noatime mounts). Files nobody reported are aged by mtime.
+#
+#   python -m src.cache_manager              # per-class usage + hit/miss/evict stats
+#   python -m src.cache_manager --enforce    # rescan and evict down to the budgets
+#   python -m src.cache_manager --clear tex  # drop one class
+#
+# Renders in progress (several per box under src/render_server.py) mark the directories
+# they are still writing (partial movies, play checkpoints) in cache/manager/active/;
+# eviction skips files inside them, so a sibling's enforce() can't break their final concat.
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import heapq
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from src.config import CACHE_DIR
+except Exception:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+MANAGER_DIR = os.path.join(CACHE_DIR, "manager")
+ACCESS_LOG = os.path.join(MANAGER_DIR, "access.log")
+STATS_LOG = os.path.join(MANAGER_DIR, "stats.jsonl")
+ACTIVE_DIR = os.path.join(MANAGER_DIR, "active")
+
+MB = 1024 * 1024
+GLOBAL_BUDGET = 2048 * MB
+
+
+def _media_dir(name: str) -> Callable[[], str]:
+    def root() -> str:
+        from manim import config  # only when a media class is actually scanned
+
+        return str(config.get_dir(name))
+
+    return root
+
+
+def _videos_dir() -> str:
+    return os.path.join(_media_dir("media_dir")(), "videos")
+
+
+@dataclass(frozen=True)
+class ArtifactClass:
+    name: str
+    root: Callable[[], str]
+    budget: int
+    suffixes: Tuple[str, ...] = ()  # empty = every file under root
+    under: str = ""  # only files inside a directory with this name
+    store: bool = False  # one packed store that evicts internally (src.text_store)
+
+
+CLASSES: Dict[str, ArtifactClass] = {
+    c.name: c
+    for c in (
+        ArtifactClass("text_svgs", _media_dir("text_dir"), 64 * MB, (".svg",)),
+        ArtifactClass("tex", _media_dir("tex_dir"), 64 * MB),
+        ArtifactClass("partial_movies", _videos_dir, 1024 * MB, under="partial_movie_files"),
+        ArtifactClass("images", lambda: os.path.join(CACHE_DIR, "images"), 512 * MB, (".npy",)),
+        ArtifactClass("datasets", lambda: os.path.join(CACHE_DIR, "data"), 512 * MB, (".npz",)),
+        ArtifactClass("text_paths", lambda: os.path.join(CACHE_DIR, "text_paths"), 256 * MB, store=True),
+        ArtifactClass("renders", lambda: os.path.join(CACHE_DIR, "renders"), 1024 * MB, (".mp4", ".mov", ".webm", ".gif")),
+        ArtifactClass("segments", lambda: os.path.join(CACHE_DIR, "segments"), 1024 * MB, (".mp4", ".mov", ".webm", ".gif")),
+        ArtifactClass("checkpoints", lambda: os.path.join(CACHE_DIR, "checkpoints"), 1024 * MB, (".mp4", ".mov", ".webm", ".gif")),
+    )
+}
+
+_KEEP = {"partial_movie_file_list.txt", "index.jsonl", ".lock", ".prewarm_manifest"}
+_COUNTERS = ("hits", "misses", "puts", "evictions", "evicted_bytes")
+
+
+def _walk(cls: ArtifactClass) -> Iterator[Tuple[str, os.stat_result]]:
+    try:
+        root = cls.root()
+    except Exception:
+        return
+    for dirpath, _, files in os.walk(root):
+        if cls.under and cls.under not in dirpath.split(os.sep):
+            continue
+        for fn in files:
+            if fn in _KEEP or fn.endswith(".tmp") or (cls.suffixes and not fn.endswith(cls.suffixes)):
+                continue
+            path = os.path.join(dirpath, fn)
+            try:
+                yield path, os.stat(path)
+            except OSError:
+                pass
+
+
+# ============================================================
+# ✅ ACTIVE RENDERS (never evicted from)
+# ============================================================
+def _alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill(pid, 0) would terminate it; stale markers are replaced per pid
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # EPERM: exists, not ours
+    return True
+
+
+@contextmanager
+def rendering(*dirs: Optional[str]):
+    """Marks dirs as written by a render in this process until the block exits."""
+    marker = os.path.join(ACTIVE_DIR, f"{os.getpid()}.json")
+    try:
+        os.makedirs(ACTIVE_DIR, exist_ok=True)
+        tmp = f"{marker}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([os.path.abspath(d) for d in dirs if d], f)
+        os.replace(tmp, marker)
+    except OSError:
+        pass
+    try:
+        yield
+    finally:
+        try:
+            os.remove(marker)
+        except OSError:
+            pass
+
+
+def active_dirs() -> Tuple[str, ...]:
+    """Directories of renders in progress (markers of dead processes are dropped)."""
+    out = []
+    try:
+        names = os.listdir(ACTIVE_DIR)
+    except OSError:
+        return ()
+    for fn in names:
+        if not fn.endswith(".json"):
+            continue
+        path = os.path.join(ACTIVE_DIR, fn)
+        try:
+            pid = int(fn[: -len(".json")])
+        except ValueError:
+            continue
+        if not _alive(pid):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                out.extend(os.path.join(str(d), "") for d in json.load(f))
+        except (OSError, ValueError):
+            pass  # being replaced right now
+    return tuple(out)
+
+
+class CacheManager:
+    def __init__(self, classes: Optional[Dict[str, ArtifactClass]] = None, global_budget: int = GLOBAL_BUDGET):
+        self.classes = dict(classes or CLASSES)
+        self.global_budget = int(global_budget)
+        # class -> path -> (size, last access), oldest first
+        self._lru: Dict[str, "OrderedDict[str, Tuple[int, float]]"] = {c: OrderedDict() for c in self.classes}
+        self._bytes: Dict[str, int] = {c: 0 for c in self.classes}
+        self.counters: Dict[str, Dict[str, int]] = {c: dict.fromkeys(_COUNTERS, 0) for c in self.classes}
+        self._loaded = False
+
+    # ---------------- state ----------------
+    def _read_log(self) -> Dict[str, float]:
+        seen: Dict[str, float] = {}
+        try:
+            with open(ACCESS_LOG, "r", encoding="utf-8") as f:
+                for line in f:
+                    t, _, path = line.rstrip("\n").partition("\t")
+                    try:
+                        seen[path] = max(seen.get(path, 0.0), float(t))
+                    except ValueError:
+                        pass  # torn line
+        except OSError:
+            pass
+        return seen
+
+    def scan(self) -> None:
+        """Rebuilds the per-class LRU from disk + the access log. O(files); not on the hot path."""
+        seen = self._read_log()
+        for name, cls in self.classes.items():
+            items = [(max(seen.get(p, 0.0), st.st_mtime), p, st.st_size) for p, st in _walk(cls)]
+            items.sort()
+            lru = self._lru[name] = OrderedDict((p, (size, t)) for t, p, size in items)
+            self._bytes[name] = sum(size for size, _ in lru.values())
+        self._loaded = True
+
+    def _ensure(self) -> None:
+        if not self._loaded:
+            self.scan()
+
+    def _log(self, path: str, t: float) -> None:
+        try:
+            os.makedirs(MANAGER_DIR, exist_ok=True)
+            with open(ACCESS_LOG, "a", encoding="utf-8") as f:  # short O_APPEND lines: no lock needed
+                f.write(f"{t:.3f}\t{path}\n")
+        except OSError:
+            pass
+
+    # ---------------- hot path ----------------
+    def note(self, cls: str, hit: bool) -> None:
+        """Counts a lookup without tracking a file (stores with their own LRU, in-memory memos)."""
+        self.counters[cls]["hits" if hit else "misses"] += 1
+
+    def hit(self, cls: str, path: str) -> None:
+        self.note(cls, True)
+        t = time.time()
+        self._log(path, t)
+        entry = self._lru[cls].get(path) if self._loaded else None
+        if entry is not None:
+            self._lru[cls][path] = (entry[0], t)
+            self._lru[cls].move_to_end(path)
+
+    def miss(self, cls: str) -> None:
+        self.note(cls, False)
+
+    def put(self, cls: str, path: str) -> None:
+        """A new artifact was written; evicts this class (and globally) if over budget."""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        self._ensure()
+        t = time.time()
+        self._log(path, t)
+        lru = self._lru[cls]
+        old = lru.pop(path, None)
+        self._bytes[cls] += size - (old[0] if old else 0)
+        lru[path] = (size, t)
+        self.counters[cls]["puts"] += 1
+        self._evict_class(cls)
+        self._evict_global()
+
+    # ---------------- eviction ----------------
+    def _evict_one(self, cls: str, protected: Tuple[str, ...] = (), held: Optional[List] = None) -> None:
+        """Deletes the class's oldest file; files it must keep are parked in `held` (bytes still counted)."""
+        path, entry = self._lru[cls].popitem(last=False)
+        if protected and path.startswith(protected):
+            if held is not None:
+                held.append((path, entry))  # a render in progress still needs it
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            if held is not None:
+                held.append((path, entry))  # in use (Windows)
+            return
+        self._bytes[cls] -= entry[0]
+        self.counters[cls]["evictions"] += 1
+        self.counters[cls]["evicted_bytes"] += entry[0]
+
+    def _unpark(self, cls: str, held: List) -> None:
+        """Puts parked entries back at the old end of the LRU, in their original order."""
+        lru = self._lru[cls]
+        for path, entry in reversed(held):
+            lru[path] = entry
+            lru.move_to_end(path, last=False)
+
+    def _evict_class(self, cls: str) -> None:
+        spec = self.classes[cls]
+        if spec.store:
+            if self._bytes[cls] > spec.budget:
+                self._compact_store(cls, spec.budget)
+            return
+        if not (self._lru[cls] and self._bytes[cls] > spec.budget):
+            return
+        protected = active_dirs()
+        held: List = []
+        while self._lru[cls] and self._bytes[cls] > spec.budget:
+            self._evict_one(cls, protected, held)
+        self._unpark(cls, held)
+
+    def _compact_store(self, cls: str, target: int) -> None:
+        from src.text_store import get_store
+
+        store = get_store()
+        if store is None:
+            return
+        self.counters[cls]["evictions"] += store.compact(int(target * 0.75))
+        self.scan_class(cls)
+
+    def scan_class(self, cls: str) -> None:
+        items = sorted((st.st_mtime, p, st.st_size) for p, st in _walk(self.classes[cls]))
+        self._lru[cls] = OrderedDict((p, (size, t)) for t, p, size in items)
+        self._bytes[cls] = sum(size for _, _, size in items)
+
+    def _evict_global(self) -> None:
+        total = sum(self._bytes.values())
+        if total <= self.global_budget:
+            return
+        # oldest head across the file classes first; stores only shrink to their own budget
+        heap = [(next(iter(lru.values()))[1], c) for c, lru in self._lru.items() if lru and not self.classes[c].store]
+        heapq.heapify(heap)
+        protected = active_dirs()
+        held: Dict[str, List] = {c: [] for c in self._lru}
+        while heap and total > self.global_budget:
+            _, c = heapq.heappop(heap)
+            before = self._bytes[c]
+            self._evict_one(c, protected, held[c])
+            total -= before - self._bytes[c]
+            if self._lru[c]:
+                heapq.heappush(heap, (next(iter(self._lru[c].values()))[1], c))
+        for c, parked in held.items():
+            self._unpark(c, parked)
+
+    def enforce(self) -> Dict[str, int]:
+        """Rescans, evicts every class to its budget and then to the global one; returns evictions per class."""
+        before = {c: v["evictions"] for c, v in self.counters.items()}
+        self.scan()
+        for cls in self.classes:
+            self._evict_class(cls)
+        self._evict_global()
+        self._rewrite_log()
+        return {c: self.counters[c]["evictions"] - before[c] for c in self.classes}
+
+    def _rewrite_log(self) -> None:
+        """Drops log lines for files that are gone (the log would otherwise grow forever)."""
+        lines = [f"{t:.3f}\t{p}\n" for lru in self._lru.values() for p, (_, t) in lru.items()]
+        try:
+            os.makedirs(MANAGER_DIR, exist_ok=True)
+            tmp = f"{ACCESS_LOG}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp, ACCESS_LOG)
+        except OSError:
+            pass
+
+    def clear(self, cls: str) -> int:
+        self.scan_class(cls)
+        n = len(self._lru[cls])
+        protected = active_dirs()
+        held: List = []
+        while self._lru[cls]:
+            self._evict_one(cls, protected, held)
+        self._unpark(cls, held)
+        return n - len(held)
+
+    # ---------------- stats ----------------
+    def flush_stats(self) -> None:
+        """Appends this process's counters to stats.jsonl (summed by stats())."""
+        rec = {c: v for c, v in self.counters.items() if any(v.values())}
+        if not rec:
+            return
+        try:
+            os.makedirs(MANAGER_DIR, exist_ok=True)
+            with open(STATS_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"t": round(time.time(), 3), "pid": os.getpid(), "classes": rec}) + "\n")
+        except OSError:
+            return
+        self.counters = {c: dict.fromkeys(_COUNTERS, 0) for c in self.classes}
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per class: files, bytes, budget + hit/miss/put/evict counters (all processes, flushed)."""
+        self._ensure()
+        out = {
+            c: {"files": len(self._lru[c]), "bytes": self._bytes[c], "budget": self.classes[c].budget, **self.counters[c]}
+            for c in self.classes
+        }
+        try:
+            with open(STATS_LOG, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    for c, vals in rec.get("classes", {}).items():
+                        for k, v in vals.items():
+                            if c in out and k in out[c]:
+                                out[c][k] += int(v)
+        except OSError:
+            pass
+        return out
+
+
+# ============================================================
+# ✅ PROCESS-WIDE INSTANCE
+# ============================================================
+_MANAGER: Optional[CacheManager] = None
+
+
+def manager() -> CacheManager:
+    global _MANAGER
+    if _MANAGER is None:
+        _MANAGER = CacheManager()
+        atexit.register(_MANAGER.flush_stats)
+    return _MANAGER
+
+
+def cache_hit(cls: str, path: str) -> None:
+    manager().hit(cls, path)
+
+
+def cache_miss(cls: str) -> None:
+    manager().miss(cls)
+
+
+def cache_put(cls: str, path: str) -> None:
+    try:
+        manager().put(cls, path)
+    except Exception:
+        pass  # bookkeeping must never fail a render
+
+
+def install_manim_hooks() -> None:
+    """Counts Manim's partial-movie cache hits/misses (its reuse check is a plain exists())."""
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    orig = SceneFileWriter.is_already_cached
+    if getattr(orig, "_cache_manager", False):
+        return
+
+    def is_already_cached(self, hash_invocation: str) -> bool:
+        cached = orig(self, hash_invocation)
+        if hasattr(self, "partial_movie_directory") and not hash_invocation.startswith("uncached_"):
+            from manim import config
+
+            path = os.path.join(str(self.partial_movie_directory), f"{hash_invocation}{config['movie_file_extension']}")
+            if cached:
+                cache_hit("partial_movies", path)
+            else:
+                cache_miss("partial_movies")
+        return cached
+
+    is_already_cached._cache_manager = True
+    SceneFileWriter.is_already_cached = is_already_cached
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.cache_manager", description="Cache usage, budgets and eviction.")
+    parser.add_argument("--enforce", action="store_true", help="evict down to the budgets")
+    parser.add_argument("--clear", choices=sorted(CLASSES), default=None, help="delete one artifact class")
+    args = parser.parse_args(argv)
+
+    m = manager()
+    if args.clear:
+        print(f"{args.clear}: removed {m.clear(args.clear)} files")
+    if args.enforce:
+        evicted = m.enforce()
+        print("evicted: " + (", ".join(f"{c}={n}" for c, n in evicted.items() if n) or "nothing"))
+
+    print(f"{'class':<16}{'files':>8}{'MB':>10}{'budget MB':>11}{'hits':>8}{'misses':>8}{'evicted':>9}")
+    total = 0
+    for c, s in m.stats().items():
+        total += s["bytes"]
+        print(
+            f"{c:<16}{s['files']:>8}{s['bytes'] / MB:>10.1f}{s['budget'] / MB:>11.0f}"
+            f"{s['hits']:>8}{s['misses']:>8}{s['evictions']:>9}"
+        )
+    print(f"{'total':<16}{'':>8}{total / MB:>10.1f}{m.global_budget / MB:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# src/checkpoint.py
+# Crash-safe play journal: a render that dies late resumes from its last finished play.
+#
+# Every play()/wait() that actually encodes frames is journalled under the render's full
+# fingerprint (src/render_cache.py: code + data + config + assets):
+#   cache/checkpoints/<fingerprint>/journal.jsonl     {"i": play index, "t": scene clock, "file": ...}
+#   cache/checkpoints/<fingerprint>/play_NNNNN.<ext>  copy of that play's partial movie
+# A journal line is written (and fsync'd) only after its file is complete, so a killed
+# worker leaves at worst one play to redo.
+#
+# Resume = replay. The scene state the rest of the video needs (tracker values, score
+# counters, bin contents, what is on screen) is rebuilt by running construct() again with
+# the journalled plays under Manim's skip_animations: same fingerprint + seeded streams
+# (src/rng.py) -> the same state at every play, without pickling mobjects. A play whose
+# clock no longer matches the journal cuts the journal there and renders from that point.
+#
+# That only holds when updaters are functions of elapsed time: a replayed play runs under
+# skip_animations, so a dt-driven updater steps once per play instead of once per frame.
+# Scenes whose state depends on per-frame sampling set `resumable = False` and always
+# render from the first play.
+# registry.render() drops the journal once the movie is written.
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from typing import Dict, Optional
+
+from manim import config
+
+try:
+    from src.config import CACHE_DIR
+except Exception:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+CHECKPOINT_DIR = os.path.join(CACHE_DIR, "checkpoints")
+
+
+class Journal:
+    def __init__(self, fp: str):
+        self.fp = fp
+        self.dir = os.path.join(CHECKPOINT_DIR, fp)
+        self.path = os.path.join(self.dir, "journal.jsonl")
+        self.entries: Dict[int, Dict] = {}  # play index -> {"t", "file"}
+        self.resumed = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a kill mid-write
+                    if "cut" in rec:
+                        self.entries = {i: e for i, e in self.entries.items() if i < rec["cut"]}
+                    else:
+                        self.entries[int(rec["i"])] = {"t": rec["t"], "file": rec["file"]}
+        except OSError:
+            pass
+
+    def _append(self, rec: Dict) -> None:
+        os.makedirs(self.dir, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def get(self, index: int, t: float) -> Optional[str]:
+        """Journalled movie for play `index` starting at clock t, or None (cuts on divergence)."""
+        entry = self.entries.get(index)
+        if entry is None:
+            return None
+        path = os.path.join(self.dir, entry["file"])
+        if entry["t"] != t or not os.path.isfile(path):
+            self.cut(index)
+            return None
+        return path
+
+    def record(self, index: int, t: float, src: str) -> None:
+        name = f"play_{index:05d}{os.path.splitext(src)[1]}"
+        dst = os.path.join(self.dir, name)
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            tmp = f"{dst}.{os.getpid()}.tmp"
+            shutil.copy2(src, tmp)  # Manim reuses uncached_NNNNN names on the next render
+            os.replace(tmp, dst)
+            self._append({"i": index, "t": t, "file": name})
+        except OSError:
+            return  # no checkpoint for this play; the render itself is unaffected
+        self.entries[index] = {"t": t, "file": name}
+
+    def cut(self, index: int) -> None:
+        self.entries = {i: e for i, e in self.entries.items() if i < index}
+        try:
+            self._append({"cut": index})
+        except OSError:
+            pass
+
+
+def clear(fp: str) -> None:
+    shutil.rmtree(os.path.join(CHECKPOINT_DIR, fp), ignore_errors=True)
+
+
+def _active(renderer) -> bool:
+    # -s / -n runs and segment-cache hits (src/segments.py) already skip: leave those alone
+    return (
+        bool(config.write_to_movie)
+        and hasattr(renderer, "file_writer")
+        and not getattr(renderer, "_original_skipping_status", True)
+    )
+
+
+def checkpointed(scene_cls: type, fp: str) -> type:
+    """Same scene (same output name) whose plays are journalled / resumed under fp."""
+    if not getattr(scene_cls, "resumable", True):
+        return scene_cls
+
+    class Checkpointed(scene_cls):
+        def play(self, *args, **kwargs):
+            renderer = self.renderer
+            if not _active(renderer):
+                return super().play(*args, **kwargs)
+            if not hasattr(self, "_journal"):
+                self._journal = Journal(fp)
+            writer = renderer.file_writer
+            index = renderer.num_plays
+            t = round(float(renderer.time), 4)
+
+            saved = self._journal.get(index, t)
+            if saved is not None:
+                renderer._original_skipping_status = True  # play() resets skip_animations from this
+                try:
+                    super().play(*args, **kwargs)
+                finally:
+                    renderer._original_skipping_status = False
+                    renderer.skip_animations = False
+                writer.partial_movie_files.append(saved)
+                writer.sections[-1].partial_movie_files.append(saved)
+                self._journal.resumed += 1
+                return
+
+            start = len(writer.partial_movie_files)
+            super().play(*args, **kwargs)
+            files = [f for f in writer.partial_movie_files[start:] if f]
+            if files:
+                self._journal.record(index, t, files[-1])
+
+    Checkpointed.__name__ = Checkpointed.__qualname__ = scene_cls.__name__
+    return Checkpointed
@@ -89,6 +89,10 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
 OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+CACHE_DIR = os.path.join(BASE_DIR, "cache")  # decoded sprites, etc. (safe to delete)
+
+# seeds the global random / np.random (registry.render() re-seeds per render from its fingerprint)
+import src.rng  # noqa: E402,F401
 
 # -----------------------------------------
 # map setting
@@ -0,0 +1,224 @@
+# src/data/ingest.py
+# One ingestion path for every template: CSV + meta header parsed once, normalised by the
+# template's schema (src/data/schemas.py), cached as columnar NPZ.
+#
+# Cache key = (schema name, schema version, file hash). A batch that renders the same CSV in
+# several templates/processes parses it once; later loads are a plain np.load. Bump a schema's
+# version whenever its normalize() changes, or old cache files will keep being served.
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.cache_manager import cache_hit, cache_miss, cache_put
+from src.lazy import lazy_import
+
+pd = lazy_import("pandas")  # imported on first use (src/lazy.py)
+
+try:
+    from src.config import CACHE_DIR
+except Exception:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "cache")
+
+DATA_CACHE_DIR = os.path.join(CACHE_DIR, "data")
+INGEST_VERSION = 1  # NPZ layout itself (not per schema)
+
+META_LINES = "lines"  # "#KEY=VALUE" on every leading '#' line (race)
+META_FIRST_LINE = "first_line"  # "#K=V,K=V,..." on the first line (map, donut, sort, butterfly)
+
+
+# ============================================================
+# ✅ FILE HASH (shared with the sprite cache)
+# ============================================================
+# (abs path, mtime_ns, size) -> sha1 of the file bytes (avoid re-hashing inside one process)
+_HASH_MEMO: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(path: str) -> str:
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    memo_key = (path, st.st_mtime_ns, st.st_size)
+    digest = _HASH_MEMO.get(memo_key)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        _HASH_MEMO[memo_key] = digest
+    return digest
+
+
+# ============================================================
+# ✅ META HEADER
+# ============================================================
+def parse_meta(path: str, style: str = META_FIRST_LINE) -> Dict[str, str]:
+    """
+    Raw meta from the CSV header (keys upper-cased, no defaults; templates merge their own).
+    Never raises: a missing/unreadable file is just "no meta".
+    """
+    meta: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if style == META_LINES:
+                for raw in f:
+                    line = raw.strip()
+                    if not line:
+                        continue
+                    if not line.startswith("#"):
+                        break
+                    k, sep, v = line[1:].strip().partition("=")
+                    if sep and k.strip() and v.strip():
+                        meta[k.strip().upper()] = v.strip()
+            else:
+                first = f.readline().strip()
+                if first.startswith("#"):
+                    for part in first[1:].split(","):
+                        k, sep, v = part.strip().partition("=")
+                        if sep and k.strip():
+                            meta[k.strip().upper()] = v.strip()
+    except Exception:
+        pass
+    return meta
+
+
+# ============================================================
+# ✅ SCHEMA + DATASET
+# ============================================================
+@dataclass(frozen=True)
+class Schema:
+    name: str
+    version: int
+    normalize: Callable[[pd.DataFrame], pd.DataFrame]
+    meta_style: str = META_FIRST_LINE
+    comment: Optional[str] = "#"  # pd.read_csv(comment=...); None = no comment lines
+
+
+@dataclass
+class Dataset:
+    """Normalised table as typed column arrays (float64 / int64 / bool / str) + raw meta."""
+
+    meta: Dict[str, str]
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    source: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.columns.keys())
+
+    def matrix(self, names: Sequence[str]) -> np.ndarray:
+        """(rows, len(names)) float matrix of numeric columns."""
+        if not names:
+            return np.zeros((len(self), 0))
+        return np.column_stack([np.asarray(self.columns[n], dtype=float) for n in names])
+
+    def frame(self) -> pd.DataFrame:
+        """Fresh DataFrame copy (safe for templates that keep mutating their df)."""
+        return pd.DataFrame({k: np.array(v, copy=True) for k, v in self.columns.items()}, columns=self.names)
+
+    @classmethod
+    def from_frame(cls, meta: Dict[str, str], df: pd.DataFrame, source: Optional[str] = None) -> "Dataset":
+        return cls(meta=meta, columns=_to_columns(df), source=source)
+
+
+def _to_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    cols: Dict[str, np.ndarray] = {}
+    for c in df.columns:
+        s = df[c]
+        if pd.api.types.is_bool_dtype(s) or pd.api.types.is_numeric_dtype(s):
+            arr = s.to_numpy()
+        else:
+            arr = s.astype(str).to_numpy(dtype=str)
+        arr.setflags(write=False)
+        cols[str(c)] = arr
+    return cols
+
+
+# in-process: (name, version, digest) -> Dataset
+_MEMO: Dict[Tuple[str, int, str], Dataset] = {}
+
+
+def _cache_path(name: str, version: int, digest: str) -> str:
+    return os.path.join(DATA_CACHE_DIR, f"{name}_v{version}.{INGEST_VERSION}_{digest}.npz")
+
+
+def _read_npz(path: str, source: str) -> Dataset:
+    with np.load(path, allow_pickle=False) as z:
+        names = [str(n) for n in z["__names__"]]
+        meta = dict(zip((str(k) for k in z["__meta_k__"]), (str(v) for v in z["__meta_v__"])))
+        cols = {}
+        for i, n in enumerate(names):
+            arr = z[f"c{i}"]
+            arr.setflags(write=False)
+            cols[n] = arr
+    return Dataset(meta=meta, columns=cols, source=source)
+
+
+def _write_npz(path: str, ds: Dataset) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    arrays = {f"c{i}": np.asarray(a) for i, a in enumerate(ds.columns.values())}
+    arrays["__names__"] = np.array(ds.names, dtype=str)
+    arrays["__meta_k__"] = np.array(list(ds.meta.keys()), dtype=str)
+    arrays["__meta_v__"] = np.array(list(ds.meta.values()), dtype=str)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)  # atomic: parallel workers never see half-written files
+
+
+def load_cached(path: str, name: str, version: int, build: Callable[[], Dataset]) -> Dataset:
+    """
+    build() result for this exact file, served from memory / NPZ when it was already
+    built under the same (name, version). `name` must encode every parameter of build().
+    """
+    digest = file_digest(path)
+    key = (name, version, digest)
+    ds = _MEMO.get(key)
+    if ds is not None:
+        return ds
+
+    npz_path = _cache_path(name, version, digest)
+    if os.path.exists(npz_path):
+        try:
+            ds = _read_npz(npz_path, path)
+            _MEMO[key] = ds
+            cache_hit("datasets", npz_path)
+            return ds
+        except Exception:
+            pass  # torn/corrupt entry -> rebuild below
+
+    cache_miss("datasets")
+    ds = build()
+    try:
+        _write_npz(npz_path, ds)
+        cache_put("datasets", npz_path)
+    except Exception:
+        pass
+    _MEMO[key] = ds
+    return ds
+
+
+def load_dataset(path: str, schema: Schema) -> Dataset:
+    """
+    CSV -> Dataset through the schema, served from memory / NPZ when this exact file
+    was already ingested with this schema version. Errors from normalize() propagate
+    (templates keep their own fallbacks).
+    """
+
+    def build() -> Dataset:
+        meta = parse_meta(path, schema.meta_style)
+        df = pd.read_csv(path, comment=schema.comment) if schema.comment else pd.read_csv(path)
+        return Dataset.from_frame(meta, schema.normalize(df), source=path)
+
+    return load_cached(path, schema.name, schema.version, build)
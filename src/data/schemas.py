@@ -0,0 +1,184 @@
+# src/data/schemas.py
+# Per-template CSV schemas for src/data/ingest.load_dataset().
+# normalize() holds exactly the cleanup each template used to run on every render.
+# Bump `version` whenever a normalize() changes (invalidates cached NPZ files).
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+import numpy as np
+
+from src.data.ingest import META_FIRST_LINE, META_LINES, Schema
+from src.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def _strip_columns(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+# --- race (scan_race.py): Year + one numeric column per series ---
+def _normalize_race(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    # year column = first column; rest numeric
+    if df.shape[1] < 2:
+        raise ValueError("race_data.csv must have at least 2 columns: Year + 1 series.")
+    for c in df.columns[1:]:
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0.0).astype(float)
+    df[df.columns[0]] = pd.to_numeric(df[df.columns[0]], errors="coerce").fillna(0.0).astype(float)
+    return df.dropna().reset_index(drop=True)
+
+
+# --- butterfly (butterfly_chart.py): Attribute, P1_Value, P2_Value ---
+def _normalize_butterfly(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    if not {"Attribute", "P1_Value", "P2_Value"}.issubset(set(df.columns)):
+        if len(df.columns) >= 3:
+            attr_col, p1_col, p2_col = df.columns[0], df.columns[1], df.columns[2]
+            df = df.rename(columns={attr_col: "Attribute", p1_col: "P1_Value", p2_col: "P2_Value"})
+        else:
+            raise ValueError(f"CSV columns mismatch. Found: {list(df.columns)}")
+
+    df["Attribute"] = df["Attribute"].astype(str).str.strip().str.upper()
+    df["P1_Value"] = pd.to_numeric(df["P1_Value"], errors="coerce").fillna(0.0).astype(float)
+    df["P2_Value"] = pd.to_numeric(df["P2_Value"], errors="coerce").fillna(0.0).astype(float)
+    df = df[df["Attribute"].astype(str).str.len() > 0]
+    return df.reset_index(drop=True)
+
+
+# --- bar (bar_chart.py): Name, Value (first two columns) ---
+def _normalize_bar(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    name_col, val_col = df.columns[0], df.columns[1]
+    return pd.DataFrame(
+        {
+            "Name": df[name_col].astype(str).str.strip(),
+            "Value": pd.to_numeric(df[val_col], errors="coerce").fillna(0.0).astype(float),
+        }
+    )
+
+
+# --- sort (sort_card.py): Image, Category, Reason (max 10 rows) ---
+def _normalize_sort(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    if "Reason" not in df.columns:
+        df["Reason"] = ["UNKNOWN"] * len(df)
+    if "Category" not in df.columns:
+        df["Category"] = [2] * len(df)
+    if "Image" not in df.columns:
+        df["Image"] = [""] * len(df)
+
+    def _cat(x):
+        try:
+            return int(float(x))
+        except Exception:
+            return 2
+
+    df["Category"] = df["Category"].apply(_cat).astype(np.int64)
+    df["Reason"] = df["Reason"].astype(str).fillna("UNKNOWN")
+    df["Image"] = df["Image"].astype(str).fillna("")
+    return df.head(10).reset_index(drop=True)  # max 10
+
+
+# --- vs (vs_card.py): Metric, P1_Value, P2_Value (display strings), Winner ---
+def _normalize_vs(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    df["Metric"] = df["Metric"].astype(str).str.strip().str.upper()
+    df["P1_Value"] = df["P1_Value"].astype(str).str.strip()
+    df["P2_Value"] = df["P2_Value"].astype(str).str.strip()
+    df = df[df["Metric"] != "NAN"]
+    df = df[df["Metric"] != ""]
+    df["Winner"] = pd.to_numeric(df["Winner"], errors="coerce").fillna(0).astype(int)
+    return df.reset_index(drop=True)
+
+
+# --- map (geo_universal.py): Country, Group, Value (+ any compare columns) ---
+def _normalize_map(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df.columns = [str(c).strip().title() for c in df.columns]
+    if "Country" not in df.columns:
+        raise ValueError("CSV must have column: Country")
+    if "Group" not in df.columns:
+        df["Group"] = "Global"
+    if "Value" not in df.columns:
+        df["Value"] = np.nan
+    df["Country"] = df["Country"].astype(str).str.strip()
+    df["Group"] = df["Group"].astype(str).str.strip()
+    return df
+
+
+# --- market (donut_breakdown.py): Category, Value, Color, Group (free-form headers) ---
+_HEX_RE = re.compile(r"^#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})$")
+
+
+def _loose_float(x) -> Optional[float]:
+    # "35%", "1,200", " 7 " -> float; blanks / junk / inf -> None
+    try:
+        if x is None:
+            return None
+        if isinstance(x, str) and x.strip() == "":
+            return None
+        if pd.isna(x):
+            return None
+        v = float(str(x).replace("%", "").replace(",", "").strip())
+        if not np.isfinite(v):
+            return None
+        return v
+    except Exception:
+        return None
+
+
+def _normalize_market(df: pd.DataFrame) -> pd.DataFrame:
+    df = _strip_columns(df)
+    cols_map = {c.lower().strip(): c for c in df.columns}
+
+    cat_col = cols_map.get("category") or cols_map.get("name") or cols_map.get("label") or df.columns[0]
+    val_col = cols_map.get("value") or cols_map.get("val") or cols_map.get("percent") or cols_map.get("pct") or (
+        df.columns[1] if len(df.columns) > 1 else df.columns[0]
+    )
+    col_col = cols_map.get("color") or cols_map.get("hex") or cols_map.get("colour")
+    grp_col = cols_map.get("group")
+    ord_col = cols_map.get("order")
+
+    d = pd.DataFrame({"Category": df[cat_col].astype(str).str.strip(), "Value": df[val_col].apply(_loose_float)})
+
+    if grp_col is None:
+        d["Group"] = "Default"
+    else:
+        # avoid "nan" strings
+        g = df[grp_col].where(~pd.isna(df[grp_col]), "Default").astype(str).str.strip()
+        d["Group"] = g.replace({"": "Default", "nan": "Default", "NaN": "Default", "None": "Default"})
+
+    if col_col is not None:
+        raw = [str(x).strip() for x in df[col_col].tolist()]
+        d["Color"] = [(x if _HEX_RE.match(x) else "") for x in raw]
+    else:
+        d["Color"] = ""  # empty = template presets / fallback
+
+    if ord_col is not None:
+        d["_Order"] = pd.to_numeric(df[ord_col], errors="coerce").fillna(10_000)
+
+    d = d.dropna(subset=["Value"]).copy()
+    d["Value"] = d["Value"].astype(float)
+    d = d[d["Value"] > 0]
+
+    if ord_col is not None:
+        d = d.sort_values(by=["_Order", "Value"], ascending=[True, False], kind="mergesort")
+    else:
+        d = d.sort_values(by=["Value"], ascending=False, kind="mergesort")
+
+    return d[["Category", "Value", "Color", "Group"]].reset_index(drop=True)
+
+
+RACE_SCHEMA = Schema("race", 1, _normalize_race, meta_style=META_LINES)
+BUTTERFLY_SCHEMA = Schema("butterfly", 1, _normalize_butterfly)
+BAR_SCHEMA = Schema("bar", 1, _normalize_bar)
+SORT_SCHEMA = Schema("sort", 1, _normalize_sort)
+VS_SCHEMA = Schema("vs", 1, _normalize_vs, comment=None)
+MAP_SCHEMA = Schema("map", 1, _normalize_map)
+MARKET_SCHEMA = Schema("market", 2, _normalize_market)
@@ -0,0 +1,284 @@
+# src/data/stream.py
+# Chunked ingestion for CSV exports too big to read in one go (race + map templates).
+#
+# The file is read in fixed-size chunks and folded into small running tables, so memory
+# follows the reduced result (periods x kept series, one row per country), not the row
+# count of the export. Results go through the same NPZ cache as load_dataset(), keyed by
+# the reduction parameters, so a big export is only streamed once per setting.
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.ingest import META_FIRST_LINE, META_LINES, Dataset, load_cached, parse_meta
+from src.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+STREAM_VERSION = 1
+STREAM_MIN_BYTES = 16 * 1024 * 1024  # smaller files: one plain read is faster
+STREAM_CHUNK_ROWS = 250_000
+STREAM_CANDIDATES = 4  # pass 1 keeps top_n * this many series for the exact pass 2
+
+AGG_LAST = "last"  # value at the latest timestamp inside the period (cumulative metrics)
+AGG_MEAN = "mean"
+AGG_SUM = "sum"
+AGG_MAX = "max"
+AGGS = (AGG_LAST, AGG_MEAN, AGG_SUM, AGG_MAX)
+
+RANK_FINAL = "final"  # value in the last period
+RANK_PEAK = "peak"  # best value over all periods
+RANKS = (RANK_FINAL, RANK_PEAK)
+
+_TIME_NAMES = ("year", "date", "time", "period")
+_SERIES_NAMES = ("name", "series", "entity", "label")
+
+
+def should_stream(path: str, min_bytes: int = STREAM_MIN_BYTES) -> bool:
+    try:
+        return os.path.getsize(path) >= min_bytes
+    except OSError:
+        return False
+
+
+# ============================================================
+# ✅ CHUNK READING + FOLDING
+# ============================================================
+def _header(path: str) -> List[str]:
+    return [str(c).strip() for c in pd.read_csv(path, comment="#", nrows=0).columns]
+
+
+def _chunks(path: str, chunk_rows: int, keep: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """Stripped-header chunks; `keep` limits parsing to those columns."""
+    usecols = None
+    if keep is not None:
+        wanted = set(keep)
+
+        def usecols(c):
+            return str(c).strip() in wanted
+
+    for chunk in pd.read_csv(path, comment="#", chunksize=max(1, int(chunk_rows)), usecols=usecols):
+        chunk.columns = [str(c).strip() for c in chunk.columns]
+        yield chunk
+
+
+def _n(col: str) -> str:
+    return f"__n__{col}"
+
+
+def _fold(df: pd.DataFrame, keys: List[str], agg: str, values: Sequence[str], firsts: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    One row per key. Works on raw rows and on already folded tables alike (every
+    reduction is associative), so chunk partials can be merged into the running table.
+    Needs "__t__" (row time / row number) for AGG_LAST and a _n(col) count per value.
+    """
+    how = {AGG_LAST: "last", AGG_MAX: "max"}.get(agg, "sum")  # mean = sum / n at the end
+    if agg == AGG_LAST:
+        df = df.sort_values("__t__", kind="stable")
+    spec = {c: how for c in values}
+    spec.update({_n(c): "sum" for c in values})
+    spec.update({c: "first" for c in firsts})
+    if agg == AGG_LAST:
+        spec["__t__"] = "max"
+    return df.groupby(keys, sort=False, as_index=False).agg(spec)
+
+
+def _merge(table: Optional[pd.DataFrame], part: pd.DataFrame, keys, agg, values, firsts=()) -> pd.DataFrame:
+    if table is None:
+        return part
+    return _fold(pd.concat([table, part], ignore_index=True), keys, agg, values, firsts)
+
+
+def _finish(table: pd.DataFrame, agg: str, values: Sequence[str]) -> pd.DataFrame:
+    table = table.copy()
+    for c in values:
+        n = table[_n(c)]
+        if agg == AGG_MEAN:
+            table[c] = table[c] / n.where(n > 0)
+        elif agg == AGG_SUM:
+            table[c] = table[c].where(n > 0)  # all-NaN group stays NaN (not 0)
+    return table.drop(columns=[_n(c) for c in values] + [c for c in ("__t__",) if c in table.columns])
+
+
+# ============================================================
+# ✅ RACE (wide Year + series columns, or long Date/Name/Value)
+# ============================================================
+def _to_years(s: pd.Series, dates: bool) -> np.ndarray:
+    """Numeric years as-is; dates -> fractional years (2020-07-02 -> ~2020.5)."""
+    if not dates:
+        return pd.to_numeric(s, errors="coerce").to_numpy(dtype=float)
+    d = pd.to_datetime(s, errors="coerce")
+    days = np.where(d.dt.is_leap_year, 366.0, 365.0)
+    return (d.dt.year + (d.dt.dayofyear - 1) / days).to_numpy(dtype=float)
+
+
+def _race_layout(cols: List[str]) -> Tuple[str, Optional[str], Optional[str]]:
+    """(time col, series col, value col); series/value are None for the wide layout."""
+    low = {c.lower(): c for c in cols}
+    time_col = next((low[n] for n in _TIME_NAMES if n in low), cols[0])
+    series_col = next((low[n] for n in _SERIES_NAMES if n in low), None)
+    value_col = low.get("value")
+    if series_col is None or value_col is None:
+        return time_col, None, None
+    return time_col, series_col, value_col
+
+
+def _race_rows(chunk: pd.DataFrame, layout, dates: bool, period: float) -> pd.DataFrame:
+    """Chunk -> long rows (__t__ time, __p__ period, __s__ series, __v__ value)."""
+    time_col, series_col, value_col = layout
+    t = _to_years(chunk[time_col], dates)
+    if series_col is None:
+        vals = chunk.drop(columns=[time_col]).apply(pd.to_numeric, errors="coerce").fillna(0.0)
+        rows = vals.assign(__t__=t).melt(id_vars="__t__", var_name="__s__", value_name="__v__")
+    else:
+        rows = pd.DataFrame(
+            {
+                "__t__": t,
+                "__s__": chunk[series_col].astype(str).str.strip().to_numpy(),
+                "__v__": pd.to_numeric(chunk[value_col], errors="coerce").to_numpy(dtype=float),
+            }
+        )
+    rows = rows[np.isfinite(rows["__t__"].to_numpy(dtype=float))].copy()
+    rows[_n("__v__")] = rows["__v__"].notna().astype(float)
+    if period > 0:
+        rows["__p__"] = np.round(np.floor(rows["__t__"] / period + 1e-9) * period, 6)
+    else:
+        rows["__p__"] = rows["__t__"]
+    return rows
+
+
+def stream_race(
+    path: str,
+    top_n: int,
+    period: float = 1.0,
+    agg: str = AGG_LAST,
+    rank_by: str = RANK_FINAL,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> Dataset:
+    """
+    Race CSV of any size -> wide Dataset (time column + top_n series columns, CSV order).
+
+    period  : bucket width in years (1 = yearly, 0.25 = quarterly, 0 = keep raw times)
+    agg     : how rows inside one bucket combine (last / mean / sum / max)
+    rank_by : which series survive: highest value in the last bucket, or highest peak
+
+    Two passes, memory O(series) + O(buckets * top_n):
+      1) per-series ranking stat on raw rows (last value / peak / total for sums),
+         keeping top_n * STREAM_CANDIDATES candidates
+      2) exact bucket grid for the candidates only, final top_n picked on that grid
+    """
+    top_n = max(1, int(top_n))
+    agg = agg if agg in AGGS else AGG_LAST
+    rank_by = rank_by if rank_by in RANKS else RANK_FINAL
+    period = max(0.0, float(period))
+    name = f"race-stream-n{top_n}-p{period:g}-{agg}-{rank_by}"
+
+    def build() -> Dataset:
+        cols = _header(path)
+        if len(cols) < 2:
+            raise ValueError("race_data.csv must have at least 2 columns: Year + 1 series.")
+        layout = _race_layout(cols)
+        time_col = layout[0]
+        dates: Optional[bool] = None
+
+        # ---- pass 1: ranking stat per series ----
+        stat_agg = AGG_SUM if agg == AGG_SUM else (AGG_LAST if rank_by == RANK_FINAL else AGG_MAX)
+        order: Dict[str, int] = {}
+        stats = None
+        for chunk in _chunks(path, chunk_rows):
+            if dates is None:
+                dates = bool(pd.to_numeric(chunk[time_col], errors="coerce").notna().mean() < 0.5)
+            rows = _race_rows(chunk, layout, dates, period)
+            for s in pd.unique(rows["__s__"]):
+                order.setdefault(s, len(order))
+            stats = _merge(stats, _fold(rows, ["__s__"], stat_agg, ["__v__"]), ["__s__"], stat_agg, ["__v__"])
+        if stats is None or not order:
+            raise ValueError(f"No rows in {path}")
+
+        stat = _finish(stats, stat_agg, ["__v__"]).set_index("__s__")["__v__"].fillna(0.0)
+        stat = stat.reindex(sorted(stat.index, key=order.__getitem__))
+        cand = list(stat.sort_values(ascending=False, kind="stable").index[: top_n * STREAM_CANDIDATES])
+        cand_set = set(cand)
+
+        # ---- pass 2: bucket grid for candidates only ----
+        keep_cols = [time_col] + cand if layout[1] is None else None
+        grid_t = None
+        for chunk in _chunks(path, chunk_rows, keep=keep_cols):
+            rows = _race_rows(chunk, layout, bool(dates), period)
+            if layout[1] is not None:
+                rows = rows[rows["__s__"].isin(cand_set)]
+            part = _fold(rows, ["__p__", "__s__"], agg, ["__v__"])
+            grid_t = _merge(grid_t, part, ["__p__", "__s__"], agg, ["__v__"])
+
+        grid = _finish(grid_t, agg, ["__v__"]).pivot(index="__p__", columns="__s__", values="__v__").sort_index()
+        grid = grid.reindex(columns=[s for s in sorted(cand_set, key=order.__getitem__)])
+        if agg in (AGG_LAST, AGG_MAX):
+            grid = grid.ffill()  # a series without rows in a bucket keeps its level
+        grid = grid.fillna(0.0).astype(float)
+
+        score = grid.iloc[-1] if rank_by == RANK_FINAL else grid.max()
+        keep = set(score.sort_values(ascending=False, kind="stable").index[:top_n])
+        grid = grid[[c for c in grid.columns if c in keep]]
+
+        df = grid.reset_index().rename(columns={"__p__": time_col})
+        df.columns = [str(c) for c in df.columns]
+        df[time_col] = df[time_col].astype(float)
+        return Dataset.from_frame(parse_meta(path, META_LINES), df, source=path)
+
+    return load_cached(path, name, STREAM_VERSION, build)
+
+
+# ============================================================
+# ✅ MAP (rollup to one row per Country)
+# ============================================================
+def stream_map(path: str, agg: str = AGG_SUM, chunk_rows: int = STREAM_CHUNK_ROWS) -> Dataset:
+    """
+    Map CSV of any size (e.g. one row per event) -> one row per Country.
+    Numeric columns (Value + compare columns) roll up with `agg`; Group and text columns
+    keep their first value. Rows come back sorted by Value (highest first), so the
+    template's MAX cut keeps the biggest countries. Memory O(countries).
+    """
+    agg = agg if agg in AGGS else AGG_SUM
+    name = f"map-stream-{agg}"
+
+    def build() -> Dataset:
+        table = None
+        numeric: Optional[List[str]] = None
+        texts: List[str] = []
+        seen = 0
+        for chunk in _chunks(path, chunk_rows):
+            chunk.columns = [c.title() for c in chunk.columns]
+            if "Country" not in chunk.columns:
+                raise ValueError("CSV must have column: Country")
+            if "Group" not in chunk.columns:
+                chunk["Group"] = "Global"
+            if "Value" not in chunk.columns:
+                chunk["Value"] = np.nan
+            if numeric is None:
+                other = [c for c in chunk.columns if c not in ("Country", "Group")]
+                numeric = [c for c in other if c == "Value" or pd.to_numeric(chunk[c], errors="coerce").notna().any()]
+                texts = ["Group"] + [c for c in other if c not in numeric]
+
+            chunk["Country"] = chunk["Country"].astype(str).str.strip()
+            chunk["Group"] = chunk["Group"].astype(str).str.strip()
+            for c in numeric:
+                chunk[c] = pd.to_numeric(chunk[c], errors="coerce").astype(float)
+                chunk[_n(c)] = chunk[c].notna().astype(float)
+            chunk["__t__"] = np.arange(seen, seen + len(chunk), dtype=float)  # file order for AGG_LAST
+            seen += len(chunk)
+
+            part = _fold(chunk, ["Country"], agg, numeric, texts)
+            table = _merge(table, part, ["Country"], agg, numeric, texts)
+
+        if table is None:
+            raise ValueError(f"No rows in {path}")
+        df = _finish(table, agg, numeric)
+        df = df[["Country"] + texts + numeric]
+        if df["Value"].notna().any():
+            df = df.sort_values("Value", ascending=False, kind="stable", na_position="last")
+        return Dataset.from_frame(parse_meta(path, META_FIRST_LINE), df.reset_index(drop=True), source=path)
+
+    return load_cached(path, name, STREAM_VERSION, build)
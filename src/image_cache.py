@@ -0,0 +1,147 @@
+# src/image_cache.py
+# Decoded + pre-resized sprite cache (RGBA .npy, memory-mapped).
+#
+# Full-resolution JPEGs scaled down by the renderer cost a Pillow decode per render and a
+# full-size resample per frame. Here every sprite is decoded once, resized to the exact
+# on-screen pixel box, and stored on disk keyed by (file hash, pixel size, fit mode).
+# Batch workers share the same files; np.load(mmap_mode="r") keeps them in the page cache,
+# and each ImageMobject gets a copy-on-write mapping of its own (no private copy until
+# something like set_opacity() writes into its pixels).
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from manim import ImageMobject, config
+
+try:
+    from src.config import CACHE_DIR
+except Exception:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+from src.cache_manager import cache_hit, cache_miss, cache_put
+from src.data.ingest import file_digest
+
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, "images")
+IMAGE_CACHE_VERSION = 1
+
+# cache key -> array (mmap'd .npy): repeat lookups in a long-lived process skip the stat + np.load
+_SPRITES: Dict[str, np.ndarray] = {}
+
+
+def frame_to_pixels(width: float, height: float) -> Tuple[int, int]:
+    """Frame units -> output pixels for the current render config."""
+    ppu_x = config.pixel_width / config.frame_width
+    ppu_y = config.pixel_height / config.frame_height
+    return max(1, int(round(width * ppu_x))), max(1, int(round(height * ppu_y)))
+
+
+def _decode_resize(path: str, px_w: int, px_h: int, fit: str) -> np.ndarray:
+    from PIL import Image
+
+    with Image.open(path) as src:
+        im = src.convert("RGBA")
+
+    sw, sh = im.size
+    if fit == "cover":
+        # crop to target aspect (centered), then resize to the exact box
+        target_ar = px_w / px_h
+        if sw / sh > target_ar:
+            cw = int(round(sh * target_ar))
+            x0 = (sw - cw) // 2
+            im = im.crop((x0, 0, x0 + cw, sh))
+        else:
+            ch = int(round(sw / target_ar))
+            y0 = (sh - ch) // 2
+            im = im.crop((0, y0, sw, y0 + ch))
+        out_w, out_h = px_w, px_h
+    else:
+        # "contain": keep aspect, fit inside the box
+        s = min(px_w / sw, px_h / sh)
+        out_w = max(1, int(round(sw * s)))
+        out_h = max(1, int(round(sh * s)))
+
+    im = im.resize((out_w, out_h), Image.LANCZOS)
+    return np.asarray(im, dtype=np.uint8)
+
+
+def load_sprite_rgba(path: str, px_w: int, px_h: int, fit: str = "contain") -> np.ndarray:
+    """
+    Returns a read-only (h, w, 4) uint8 array for `path` at the requested pixel box.
+    fit="contain" keeps aspect inside the box, fit="cover" center-crops to fill it.
+    """
+    fit = "cover" if str(fit).lower() == "cover" else "contain"
+    key = f"{file_digest(path)}_{int(px_w)}x{int(px_h)}_{fit}_v{IMAGE_CACHE_VERSION}"
+    arr = _SPRITES.get(key)
+    if arr is None:
+        arr = _SPRITES[key] = _load_or_build(path, key, int(px_w), int(px_h), fit)
+    return arr
+
+
+def _load_or_build(path: str, key: str, px_w: int, px_h: int, fit: str) -> np.ndarray:
+    npy_path = os.path.join(IMAGE_CACHE_DIR, key + ".npy")
+
+    if os.path.exists(npy_path):
+        try:
+            arr = np.load(npy_path, mmap_mode="r")
+            cache_hit("images", npy_path)
+            return arr
+        except Exception:
+            pass  # torn/corrupt entry -> rebuild below
+
+    cache_miss("images")
+    arr = _decode_resize(path, px_w, px_h, fit)
+
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        tmp = f"{npy_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, arr)
+        os.replace(tmp, npy_path)  # atomic: parallel workers never see half-written files
+        cache_put("images", npy_path)
+        return np.load(npy_path, mmap_mode="r")
+    except Exception:
+        return arr
+
+
+def _private_pixels(arr: np.ndarray) -> np.ndarray:
+    """Writable per-mobject view of a cached sprite; pages stay shared until written."""
+    filename = getattr(arr, "filename", None)
+    if filename:
+        try:
+            return np.asarray(np.load(filename, mmap_mode="c"))
+        except Exception:
+            pass
+    return np.array(arr)
+
+
+def cached_image_mobject(
+    path: str,
+    max_w: float,
+    max_h: float,
+    fit: str = "contain",
+    px_size: Optional[Tuple[int, int]] = None,
+) -> ImageMobject:
+    """
+    ImageMobject backed by the cache, sized to (max_w, max_h) frame units.
+    The pixel array already matches the on-screen size, so the renderer never
+    resamples a full-resolution source.
+    """
+    px_w, px_h = px_size if px_size else frame_to_pixels(max_w, max_h)
+    arr = load_sprite_rgba(path, px_w, px_h, fit=fit)
+
+    # ImageMobject() copies whatever it is given: build it on a 1x1 placeholder, then hand
+    # it the mapped sprite and re-derive its frame size from the real pixel shape
+    im = ImageMobject(arr[:1, :1])
+    im.pixel_array = _private_pixels(arr)
+    im.reset_points()
+    if fit == "cover":
+        im.stretch_to_fit_width(max_w)
+        im.stretch_to_fit_height(max_h)
+    else:
+        im.scale_to_fit_width(max_w)
+        if im.height > max_h:
+            im.scale_to_fit_height(max_h)
+    return im
@@ -0,0 +1,163 @@
+# src/layout.py
+# Label placement engine shared by the chart templates (donut chips, race value chips, map cards).
+# Pure NumPy: works on plain box arrays, never touches Mobject bounding boxes.
+
+from __future__ import annotations
+
+import heapq
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# ============================================================
+# ✅ SWEEP-LINE OVERLAP SEARCH (x-axis)
+# ============================================================
+def _sweep_x_pairs(x0: np.ndarray, x1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns every (i, j) pair whose [x0, x1] intervals overlap.
+    Boxes are visited by left edge; a min-heap on right edges keeps the active set,
+    so the cost is O(n log n + pairs) instead of testing all n² pairs.
+    """
+    order = np.argsort(x0, kind="stable")
+    active: List[Tuple[float, int]] = []
+    ii: List[int] = []
+    jj: List[int] = []
+
+    for k in order:
+        k = int(k)
+        left = float(x0[k])
+        while active and active[0][0] <= left:
+            heapq.heappop(active)
+        for _, a in active:
+            ii.append(a)
+            jj.append(k)
+        heapq.heappush(active, (float(x1[k]), k))
+
+    return np.array(ii, dtype=int), np.array(jj, dtype=int)
+
+
+# ============================================================
+# ✅ 1D STACK PACKER (cluster merge, minimal displacement)
+# ============================================================
+def _pack_stack(desired: np.ndarray, h: np.ndarray, gap: float, lo: float, hi: float) -> np.ndarray:
+    """
+    desired/h are ordered top -> bottom. Returns centers that keep that order with
+    `gap` between neighbours, stay inside [lo, hi] when they fit, and move each label
+    as little as possible (clusters sit on the mean of their members' wishes).
+    """
+    n = len(desired)
+    # offset of each item's center from the top of its cluster
+    off = np.empty(n)
+    # cluster stack: [first, count, sum_of_wishes, total_height]
+    clusters: List[List[float]] = []
+
+    def _top(c: List[float]) -> float:
+        t = c[2] / c[1]
+        t = max(t, lo + c[3])
+        return min(t, hi)
+
+    for k in range(n):
+        off[k] = h[k] / 2.0
+        cur = [k, 1, float(desired[k]) + off[k], float(h[k])]
+
+        while clusters:
+            prev = clusters[-1]
+            if _top(cur) <= _top(prev) - prev[3] - gap:
+                break
+            shift = prev[3] + gap
+            first, count = int(cur[0]), int(cur[1])
+            off[first:first + count] += shift
+            clusters.pop()
+            cur = [prev[0], prev[1] + cur[1], prev[2] + cur[2] + shift * cur[1], prev[3] + gap + cur[3]]
+
+        clusters.append(cur)
+
+    out = np.empty(n)
+    for c in clusters:
+        first, count = int(c[0]), int(c[1])
+        out[first:first + count] = _top(c) - off[first:first + count]
+    return out
+
+
+# ============================================================
+# ✅ PUBLIC API
+# ============================================================
+def resolve_label_boxes(
+    boxes: Sequence[Sequence[float]],
+    lanes: Optional[Sequence[object]] = None,
+    y_min: float = -np.inf,
+    y_max: float = np.inf,
+    gap: float = 0.0,
+    pad_x: float = 0.0,
+) -> np.ndarray:
+    """
+    Resolves label collisions in one call.
+
+    boxes  : (n, 4) rows of (cx, cy, w, h) — the wished-for label positions.
+    lanes  : optional lane/side id per box; labels only collide inside the same lane.
+    y_min/y_max : vertical band every label must stay inside.
+    gap    : minimum vertical clearance between two colliding labels.
+    pad_x  : extra horizontal padding when testing for overlap.
+
+    Only y moves (x is the caller's lane decision). Labels that share x-range and
+    collide are merged into a stack and packed around their wished positions;
+    the result is deterministic for a given input. Returns (n, 2) centers.
+    """
+    b = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    n = len(b)
+    out = b[:, :2].copy()
+    if n == 0:
+        return out
+
+    cx, _, w, h = b.T
+    lo = float(y_min)
+    hi = float(y_max)
+
+    wish = np.clip(b[:, 1], lo + h / 2.0, hi - h / 2.0)
+    wish = np.where(np.isfinite(wish), wish, b[:, 1])
+    y = wish.copy()
+    if n == 1:
+        out[:, 1] = y
+        return out
+
+    ii, jj = _sweep_x_pairs(cx - w / 2.0 - pad_x, cx + w / 2.0 + pad_x)
+    if lanes is not None:
+        lane_ids = np.asarray(lanes, dtype=object)
+        same = np.asarray(lane_ids[ii] == lane_ids[jj], dtype=bool)
+        ii, jj = ii[same], jj[same]
+    if len(ii) == 0:
+        out[:, 1] = y
+        return out
+
+    need = (h[ii] + h[jj]) / 2.0 + gap
+    parent = np.arange(n)
+
+    def _find(a: int) -> int:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = int(parent[a])
+        return a
+
+    # Every round merges at least two stacks, so n rounds is a hard upper bound.
+    for _ in range(n):
+        hit = np.abs(y[ii] - y[jj]) < need - 1e-9
+        if not np.any(hit):
+            break
+
+        for a, c in zip(ii[hit], jj[hit]):
+            ra, rc = _find(int(a)), _find(int(c))
+            if ra != rc:
+                parent[max(ra, rc)] = min(ra, rc)
+
+        roots = np.array([_find(k) for k in range(n)])
+        for r in np.unique(roots):
+            members = np.flatnonzero(roots == r)
+            if len(members) < 2:
+                continue
+            # top -> bottom by wish, index breaks ties (stable + deterministic)
+            members = members[np.lexsort((members, -wish[members]))]
+            y[members] = _pack_stack(wish[members], h[members], gap, lo, hi)
+
+    out[:, 1] = y
+    return out
@@ -0,0 +1,28 @@
+# src/lazy.py
+# Deferred imports for heavy optional-at-import-time modules (pandas).
+#
+# `pd = lazy_import("pandas")` costs nothing until the first attribute access
+# (pd.read_csv, pd.DataFrame, ...), so importing a template or listing the registry
+# doesn't pay for pandas; a render that never touches a DataFrame never loads it.
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module proxy that runs the real import on first use (stdlib LazyLoader)."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
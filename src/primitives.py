@@ -0,0 +1,344 @@
+# src/primitives.py
+# Small mutable mobjects for per-frame updaters.
+#
+# Updaters that rebuild a shape every frame (become(RoundedRectangle(...)), set_points_as_corners
+# over the whole history) pay allocation + bezier setup that grows with the animation. These
+# primitives keep their geometry and only move what changed.
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from manim import BOLD, WHITE, RoundedRectangle, Text, ValueTracker, VGroup, VMobject
+
+
+# ============================================================
+# ✅ MERGED RECTANGLES (many bars, one VMobject)
+# ============================================================
+def rect_path_points(x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray) -> np.ndarray:
+    """
+    Closed axis-aligned rectangles as cubic-bezier points for ONE VMobject (one subpath each).
+    Inputs are (n,) arrays; returns (n * 16, 3).
+    """
+    n = len(x0)
+    corners = np.zeros((n, 5, 3))
+    corners[:, :, 0] = np.stack([x0, x1, x1, x0, x0], axis=1)
+    corners[:, :, 1] = np.stack([y0, y0, y1, y1, y0], axis=1)
+
+    a = corners[:, :-1]
+    b = corners[:, 1:]
+    seg = np.stack([a, a + (b - a) / 3.0, a + 2.0 * (b - a) / 3.0, b], axis=2)  # (n, 4, 4, 3)
+    return seg.reshape(-1, 3)
+
+
+# ============================================================
+# ✅ STRETCH PILL (width changes move the side control points only)
+# ============================================================
+class StretchPill(RoundedRectangle):
+    """
+    Rounded pill whose width can be changed without rebuilding it.
+    The outline is built once; every control point is tagged left/right of center,
+    so a new width is just a shift of each side by half the difference.
+    Corners keep their radius (no scaling), unlike stretch_to_fit_width().
+    """
+
+    def __init__(self, width: float = 1.0, height: float = 0.46, corner_radius: float = 0.12, **kwargs):
+        corner_radius = min(corner_radius, height / 2)
+        width = max(width, 2 * corner_radius + 0.02)
+        super().__init__(corner_radius=corner_radius, width=width, height=height, **kwargs)
+        self._base = self.points - self.get_center()
+        self._side = np.sign(self._base[:, 0])[:, None] * np.array([[0.5, 0.0, 0.0]])
+        self._base_w = float(width)
+        self._min_w = 2 * corner_radius + 0.02
+        self._w = float(width)
+        self._shape = self._base
+
+    def get_pill_width(self) -> float:
+        return self._w
+
+    def set_pill(self, width: Optional[float] = None, center: Optional[Sequence[float]] = None) -> "StretchPill":
+        """Resizes (if the width actually changed) and recenters the pill."""
+        if center is None:
+            center = self.get_center()
+        if width is not None:
+            w = round(max(float(width), self._min_w), 3)
+            if w != self._w:
+                self._shape = self._base + self._side * (w - self._base_w)
+                self._w = w
+        self.points = self._shape + np.asarray(center, dtype=float)
+        return self
+
+
+# ============================================================
+# ✅ PROGRESSIVE POLYLINE (grow-only point buffer)
+# ============================================================
+class ProgressivePolyline(VMobject):
+    """
+    Polyline that is drawn corner by corner.
+    Points live in a preallocated buffer: add_corner() appends one straight segment,
+    set_tip() rewrites only the last (moving) segment. self.points is a view of the
+    used part of the buffer, so a frame costs O(1) no matter how long the line is.
+    """
+
+    def __init__(self, start: Sequence[float], capacity: int = 16, **kwargs):
+        super().__init__(**kwargs)
+        self._buf = np.zeros((4 * (max(1, int(capacity)) + 1), 3))
+        self._corner = np.asarray(start, dtype=float).copy()
+        self._count = 0  # committed segments
+        self.set_tip(self._corner)
+
+    @staticmethod
+    def _segment(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+        d = b - a
+        out[0] = a
+        out[1] = a + d / 3.0
+        out[2] = a + 2.0 * d / 3.0
+        out[3] = b
+
+    def _grow(self) -> None:
+        bigger = np.zeros((2 * len(self._buf), 3))
+        bigger[: len(self._buf)] = self._buf
+        self._buf = bigger
+
+    def add_corner(self, point: Sequence[float]) -> "ProgressivePolyline":
+        """Commits a segment from the last corner to `point`."""
+        p = np.asarray(point, dtype=float)
+        if 4 * (self._count + 2) > len(self._buf):
+            self._grow()
+        i = 4 * self._count
+        self._segment(self._corner, p, self._buf[i : i + 4])
+        self._corner = p.copy()
+        self._count += 1
+        return self.set_tip(p)
+
+    def set_tip(self, point: Sequence[float]) -> "ProgressivePolyline":
+        """Moves the free end (the segment after the last corner)."""
+        i = 4 * self._count
+        self._segment(self._corner, np.asarray(point, dtype=float), self._buf[i : i + 4])
+        self.points = self._buf[: i + 4]
+        return self
+
+    @property
+    def corner_count(self) -> int:
+        return self._count
+
+
+# ============================================================
+# ✅ GLYPH COUNTER (number display, zero Pango calls while ticking)
+# ============================================================
+GLYPH_DIGITS = "0123456789"
+GLYPH_CHARSET = GLYPH_DIGITS + "-.,+%KMBT"
+
+# (chars, font, weight, font_size) -> {char: (points relative to (cell center, baseline), width)}
+_GLYPH_SETS: Dict[Tuple[str, str, str, float], Dict[str, Tuple[np.ndarray, float]]] = {}
+
+
+def _glyph_set(chars: str, font: str, weight: str, font_size: float) -> Dict[str, Tuple[np.ndarray, float]]:
+    """One Text() per style per process; every glyph keeps its baseline offset."""
+    key = (chars, font, str(weight), float(font_size))
+    gs = _GLYPH_SETS.get(key)
+    if gs is None:
+        try:
+            row = Text(chars, font=font, weight=weight, font_size=font_size)
+        except Exception:
+            row = Text(chars, font_size=font_size)
+        base = row[chars.index("0")].get_bottom()[1] if "0" in chars else row.get_bottom()[1]
+        gs = {}
+        for ch, mob in zip(chars, row):
+            c = mob.get_center()
+            gs[ch] = (mob.points - np.array([c[0], base, 0.0]), float(mob.width))
+        _GLYPH_SETS[key] = gs
+    return gs
+
+
+class GlyphCounter(VGroup):
+    """
+    Fixed-width number display for tracker-driven values.
+    Digits, sign, decimal point and unit letters are rendered once per style (shared
+    across counters); a value change only copies glyph points into a set of slots
+    (`max_chars` up front; a longer string adds slots rather than dropping characters).
+    Digits sit in equal cells, so the number doesn't jitter while it counts.
+
+    Positioning works like any mobject (move_to / next_to / align_to); the counter
+    re-lays out around its current left edge, center or right edge (`align`).
+    An optional suffix (e.g. "K") is drawn after the number, smaller and in its own color.
+    """
+
+    def __init__(
+        self,
+        text: str = "0",
+        max_chars: int = 8,
+        font: str = "Montserrat",
+        weight: str = BOLD,
+        font_size: float = 24,
+        color=WHITE,
+        align: str = "center",
+        suffix: str = "",
+        suffix_color=None,
+        suffix_scale: float = 1.0,
+        suffix_buff: float = 0.06,
+        charset: str = GLYPH_CHARSET,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        suffix = str(suffix or "")
+        chars = "".join(dict.fromkeys(GLYPH_DIGITS + charset + suffix))
+        self._glyphs = _glyph_set(chars, font, weight, font_size)
+
+        self._h0 = max(1e-6, float(np.ptp(self._glyphs["0"][0][:, 1])))
+        self._advance = max(w for ch, (_, w) in self._glyphs.items() if ch in GLYPH_DIGITS) * 1.10
+        self._track = self._advance * 0.08
+        self.align = align if align in ("left", "center", "right") else "center"
+
+        # bounding box carrier: one straight segment from bottom-left to top-right (zero area, no stroke)
+        self._frame = VMobject().set_fill(opacity=0).set_stroke(width=0)
+        self._frame.set_points(self._diagonal(0.0, 0.0, 0.0, self._h0))
+
+        self.slots = [VMobject().set_fill(color, opacity=1.0).set_stroke(width=0) for _ in range(max(1, int(max_chars)))]
+        self.suffix = suffix
+        self.suffix_scale = float(suffix_scale)
+        self.suffix_buff = float(suffix_buff)
+        self.suffix_mob = VGroup(
+            *[
+                VMobject().set_fill(suffix_color or color, opacity=1.0).set_stroke(width=0)
+                for _ in range(len(suffix))
+            ]
+        )
+        self.add(self._frame, *self.slots, self.suffix_mob)
+
+        self._text: Optional[str] = None
+        self.set_text(str(text))
+
+    # keep the box carrier invisible whatever styling is applied to the counter
+    def set_stroke(self, *args, **kwargs):
+        super().set_stroke(*args, **kwargs)
+        self._frame.set_stroke(width=0, opacity=0)
+        return self
+
+    @staticmethod
+    def _diagonal(x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        a = np.array([x0, y0, 0.0])
+        d = np.array([x1, y1, 0.0]) - a
+        return np.array([a, a + d / 3.0, a + 2.0 * d / 3.0, a + d])
+
+    def get_text(self) -> str:
+        return self._text or ""
+
+    def _cell(self, ch: str) -> float:
+        return self._advance if ch in GLYPH_DIGITS else self._glyphs[ch][1] + self._track
+
+    def _grow(self, n: int) -> None:
+        # value outgrew max_chars (e.g. 10,000,000,000): add slots in the same style, never cut digits
+        at = self.submobjects.index(self.suffix_mob)
+        for _ in range(n - len(self.slots)):
+            slot = self.slots[0].copy()
+            slot.clear_points()
+            self.insert(at, slot)
+            self.slots.append(slot)
+            at += 1
+
+    def set_text(self, text: str) -> "GlyphCounter":
+        if text == self._text:
+            return self
+        chars = [c for c in str(text) if c in self._glyphs]
+        if len(chars) > len(self.slots):
+            self._grow(len(chars))
+        self._text = "".join(chars)
+
+        p0 = self._frame.points[0]
+        p1 = self._frame.points[-1]
+        scale = max(1e-6, (p1[1] - p0[1]) / self._h0)
+        base = p0[1]
+
+        cells = np.array([self._cell(c) for c in chars]) * scale
+        suf_w = [self._glyphs[c][1] * scale * self.suffix_scale for c in self.suffix]
+        total = float(cells.sum())
+        if self.suffix:
+            total += self.suffix_buff + sum(suf_w) + self._track * scale * self.suffix_scale * (len(self.suffix) - 1)
+
+        if self.align == "left":
+            x0 = p0[0]
+        elif self.align == "right":
+            x0 = p1[0] - total
+        else:
+            x0 = (p0[0] + p1[0]) / 2 - total / 2
+
+        x = x0
+        for i, slot in enumerate(self.slots):
+            if i < len(chars):
+                pts, _ = self._glyphs[chars[i]]
+                slot.points = pts * scale + np.array([x + cells[i] / 2, base, 0.0])
+                x += cells[i]
+            elif len(slot.points):
+                slot.points = np.zeros((0, 3))
+
+        x += self.suffix_buff if self.suffix else 0.0
+        for ch, w, mob in zip(self.suffix, suf_w, self.suffix_mob):
+            pts, _ = self._glyphs[ch]
+            mob.points = pts * (scale * self.suffix_scale) + np.array([x + w / 2, base, 0.0])
+            x += w + self._track * scale * self.suffix_scale
+
+        self._frame.points = self._diagonal(x0, base, x0 + total, base + self._h0 * scale)
+        return self
+
+    def set_value(self, value: float, formatter: Optional[Callable[[float], str]] = None) -> "GlyphCounter":
+        return self.set_text(formatter(value) if formatter else str(int(round(float(value)))))
+
+    def track(self, tracker: ValueTracker, formatter: Optional[Callable[[float], str]] = None) -> "GlyphCounter":
+        """Follows `tracker` every frame; glyphs only move when the shown string changes."""
+        self.add_updater(lambda m: m.set_value(tracker.get_value(), formatter))
+        return self
+
+
+# ============================================================
+# ✅ NUMBER COUNTER (TeX-free DecimalNumber)
+# ============================================================
+def format_number(
+    value: float,
+    num_decimal_places: int = 0,
+    group_with_commas: bool = True,
+    include_sign: bool = False,
+) -> str:
+    """DecimalNumber's formatting rules: fixed decimals, optional 1,234 grouping and +/- sign."""
+    spec = f"{'+' if include_sign else ''}{',' if group_with_commas else ''}.{max(0, int(num_decimal_places))}f"
+    s = format(float(value), spec)
+    if s.startswith("-") and not s.strip("-+0.,"):
+        s = ("+" if include_sign else "") + s[1:]  # no "-0.0"
+    return s
+
+
+class NumberCounter(GlyphCounter):
+    """
+    Drop-in for DecimalNumber without MathTex: no LaTeX/dvisvgm run per new digit string,
+    no TeX install needed on render workers. Same knobs (decimal places, grouping, sign,
+    unit) and the same set_value()/get_value(), so existing updaters keep working.
+    """
+
+    def __init__(
+        self,
+        number: float = 0.0,
+        num_decimal_places: int = 0,
+        group_with_commas: bool = True,
+        include_sign: bool = False,
+        unit: str = "",
+        max_chars: int = 12,
+        font_size: float = 24,
+        **kwargs,
+    ):
+        self.num_decimal_places = int(num_decimal_places)
+        self.group_with_commas = bool(group_with_commas)
+        self.include_sign = bool(include_sign)
+        self.number = float(number)
+        super().__init__(self._format(self.number), max_chars=max_chars, font_size=font_size, suffix=unit, **kwargs)
+
+    def _format(self, value: float) -> str:
+        return format_number(value, self.num_decimal_places, self.group_with_commas, self.include_sign)
+
+    def set_value(self, number: float, formatter: Optional[Callable[[float], str]] = None) -> "NumberCounter":
+        self.number = float(number)
+        return self.set_text(formatter(self.number) if formatter else self._format(self.number))
+
+    def get_value(self) -> float:
+        return self.number
+
@@ -0,0 +1,100 @@
+# src/race_timeline.py
+# Wide-format race data (Year + one column per series) as one NumPy timeline.
+#
+# Same interpolation and ranking rules as the line race (linear between years, end segments
+# extrapolated, ties keep CSV column order), but vectorised over all series, so a whole
+# render's worth of per-frame values and rank order can be precomputed as arrays.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class RaceFrames:
+    """Per-frame arrays for one render (F frames, S series, K kept rows)."""
+
+    times: np.ndarray  # (F,)   timeline value (year) of each frame
+    values: np.ndarray  # (F, S) interpolated values
+    rank: np.ndarray  # (F, S) integer rank, 0 = leader
+    pos: np.ndarray  # (F, S) rank eased over time (rows slide instead of jumping)
+    visible: np.ndarray  # (F, K) series ids sorted by pos, first K only
+    scale: np.ndarray  # (F,)   smoothed leader value (bar width reference)
+
+
+class RaceTimeline:
+    def __init__(self, years: Sequence[float], values: np.ndarray, labels: Sequence[str]):
+        self.years = np.asarray(years, dtype=float)
+        self.values = np.asarray(values, dtype=float).reshape(len(self.years), -1)  # (Y, S)
+        self.labels = [str(c) for c in labels]
+
+    @property
+    def n_series(self) -> int:
+        return self.values.shape[1]
+
+    def sample(self, ts: Sequence[float]) -> np.ndarray:
+        """(F,) times -> (F, S) values."""
+        ts = np.atleast_1d(np.asarray(ts, dtype=float))
+        if len(self.years) < 2:
+            return np.repeat(self.values[:1], len(ts), axis=0)
+
+        idx = np.clip(np.searchsorted(self.years, ts) - 1, 0, len(self.years) - 2)
+        t1 = self.years[idx]
+        t2 = self.years[idx + 1]
+        span = t2 - t1
+        a = np.where(span == 0, 0.0, (ts - t1) / np.where(span == 0, 1.0, span))
+        v1 = self.values[idx]
+        v2 = self.values[idx + 1]
+        return v1 + (v2 - v1) * a[:, None]
+
+    def at(self, t: float) -> np.ndarray:
+        return self.sample([t])[0]
+
+    @staticmethod
+    def order(values: np.ndarray) -> np.ndarray:
+        """Series ids, highest value first (stable: ties keep column order)."""
+        return np.argsort(-np.asarray(values), axis=-1, kind="stable")
+
+    def scores(self, t: float) -> List[Tuple[str, float]]:
+        """[(label, value)] sorted for the ranking HUD."""
+        vals = self.at(t)
+        return [(self.labels[i], float(vals[i])) for i in self.order(vals)]
+
+    def precompute(
+        self,
+        t0: float,
+        t1: float,
+        n_frames: int,
+        keep: int,
+        fps: float = 60.0,
+        slide: float = 0.22,
+    ) -> RaceFrames:
+        """
+        Everything a bar race needs per frame, computed once.
+        slide : time constant (seconds) for rows easing into a new rank.
+        keep  : how many rows can be on screen at once (visible slots + overflow).
+        """
+        n_frames = max(2, int(n_frames))
+        times = np.linspace(float(t0), float(t1), n_frames)
+        values = self.sample(times)
+
+        order = self.order(values)
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(self.n_series)[None, :], axis=1)
+
+        k = 1.0 - np.exp(-1.0 / max(1e-6, slide * fps))
+        pos = np.empty(values.shape)
+        pos[0] = rank[0]
+        lead = values[np.arange(n_frames), order[:, 0]]
+        scale = np.empty(n_frames)
+        scale[0] = max(1e-9, lead[0])
+        for f in range(1, n_frames):
+            pos[f] = pos[f - 1] + (rank[f] - pos[f - 1]) * k
+            scale[f] = max(1e-9, scale[f - 1] + (lead[f] - scale[f - 1]) * k)
+
+        keep = max(1, min(int(keep), self.n_series))
+        visible = np.argsort(pos, axis=1, kind="stable")[:, :keep]
+        return RaceFrames(times=times, values=values, rank=rank, pos=pos, visible=visible, scale=scale)
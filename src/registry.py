@@ -0,0 +1,202 @@
+# src/registry.py
+# Template registry: short name -> (module, Scene class), imported only when selected.
+#
+# Listing / looking up templates is plain data here. load_scene() imports just the chosen
+# module (once per process), so a runner never pays for the other templates' imports.
+#
+#   python -m src.registry                   # list templates
+#   python -m src.registry render bar -q h   # render one in this process
+#
+# Quality presets keep the 9:16 frame (manim's own -q presets are landscape).
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class TemplateSpec:
+    name: str
+    module: str  # dotted path from the project root
+    scene: str  # Scene subclass in that module
+    data: str = ""  # CSV it looks for (demo data when missing)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(PROJECT_ROOT, *self.module.split(".")) + ".py"
+
+
+TEMPLATES: Dict[str, TemplateSpec] = {
+    t.name: t
+    for t in (
+        TemplateSpec("bar", "src.templates.Bar_chart.bar_chart", "BarChartTemplate", "bar_data.csv"),
+        TemplateSpec("bar_race", "src.templates.line_chart.scan_race", "BarChartRace", "race_data.csv"),
+        TemplateSpec("butterfly", "src.templates.chart_folder.butterfly_chart", "ButterflyChart", "butterfly_data.csv"),
+        TemplateSpec("donut", "src.templates.pie_chart.donut_breakdown", "DonutBreakdownFinal", "market_share.csv"),
+        TemplateSpec("line_race", "src.templates.line_chart.scan_race", "CinematicLineRace", "race_data.csv"),
+        TemplateSpec("map", "src.templates.map_chart.geo_universal", "GeoUniversalMap", "map_data.csv"),
+        TemplateSpec("sort", "src.templates.Sort_card.sort_card", "SortCardTribunalFinal", "sort_data.csv"),
+        TemplateSpec("vs", "src.templates.Vs_card.vs_card", "VsCard", "vs_data.csv"),
+    )
+}
+
+# letter -> (pixel_width, pixel_height, frame_rate)
+QUALITIES = {"l": (480, 854, 15), "m": (720, 1280, 30), "h": (1080, 1920, 60), "k": (2160, 3840, 60)}
+
+# name -> Scene class (already imported in this process)
+_LOADED: Dict[str, type] = {}
+
+
+def template_names() -> List[str]:
+    return sorted(TEMPLATES)
+
+
+def get_template(name: str) -> TemplateSpec:
+    try:
+        return TEMPLATES[name]
+    except KeyError:
+        raise KeyError(f"Unknown template {name!r}. Known: {', '.join(template_names())}") from None
+
+
+def load_scene(name: str) -> type:
+    """Imports the template's module on first use and returns its Scene class."""
+    scene_cls = _LOADED.get(name)
+    if scene_cls is None:
+        spec = get_template(name)
+        if PROJECT_ROOT not in sys.path:
+            sys.path.insert(0, PROJECT_ROOT)
+        scene_cls = getattr(importlib.import_module(spec.module), spec.scene)
+        _LOADED[name] = scene_cls
+    return scene_cls
+
+
+def _tracked(scene_cls: type, on_play: Callable) -> type:
+    """Same scene (same output name), calling on_play(scene) after every play()/wait()."""
+
+    class Tracked(scene_cls):
+        def play(self, *args, **kwargs):
+            super().play(*args, **kwargs)
+            on_play(self)
+
+    Tracked.__name__ = Tracked.__qualname__ = scene_cls.__name__
+    return Tracked
+
+
+def _requested_movie_path(scene_name: str) -> Optional[str]:
+    """Where Manim would write this scene's movie for the current config.output_file (None if unset)."""
+    from manim import config
+    from manim.utils.file_ops import add_extension_if_not_present
+
+    if not config["output_file"]:
+        return None
+    module_name = config.get_dir("input_file").stem if config["input_file"] else ""
+    movie_dir = config.get_dir("video_dir", module_name=module_name, scene_name=scene_name)
+    return str(movie_dir / add_extension_if_not_present(config.get_dir("output_file"), config["movie_file_extension"]))
+
+
+def _deliver(cached: str, dst: Optional[str]) -> str:
+    """Copies a cached movie to the path the caller asked for (cache files are never handed out to be moved)."""
+    if not dst:
+        return cached
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    shutil.copy2(cached, tmp)
+    os.replace(tmp, dst)
+    return dst
+
+
+def render(
+    name: str,
+    quality: Optional[str] = None,
+    on_play: Optional[Callable] = None,
+    use_cache: bool = True,
+    resume: bool = True,
+    **config_overrides,
+) -> str:
+    """
+    Renders one template in this process; returns the movie path.
+    quality is a QUALITIES letter; other manim config overrides (output_file, media_dir, ...)
+    apply to this render only. Afterwards the media/cache budgets are enforced (src.cache_manager).
+    With use_cache, an identical earlier render (src.render_cache fingerprint) is returned
+    from cache/renders without building the scene (copied to output_file when one is set).
+    With resume, finished plays are journalled (src.checkpoint) and a retry after a crash
+    re-encodes only what came after the last one.
+    """
+    from manim import tempconfig
+
+    from src.cache_manager import install_manim_hooks, manager, rendering
+    from src.checkpoint import CHECKPOINT_DIR, checkpointed
+    from src.checkpoint import clear as clear_checkpoint
+    from src.render_cache import fingerprint, lookup, static_fingerprint, store
+    from src.rng import reset as reset_rng
+    from src.static_hold import install as install_static_hold
+    from src.text_store import install as install_text_store
+
+    # render-time patches live here, not in src.config: importing constants stays side-effect free
+    install_manim_hooks()
+    install_text_store()  # Text() glyph paths from one packed store (cache/text_paths)
+    install_static_hold()  # waits / mostly-still plays reuse the previous frame
+
+    if quality:
+        w, h, fps = QUALITIES[quality]
+        config_overrides = {"pixel_width": w, "pixel_height": h, "frame_rate": fps, **config_overrides}
+    with tempconfig(config_overrides):
+        fp = fingerprint(get_template(name), load_scene(name))
+        cached = lookup(fp) if use_cache else None
+        if cached:
+            return _deliver(cached, _requested_movie_path(get_template(name).scene))
+        scene_cls = load_scene(name)
+        if resume:
+            scene_cls = checkpointed(scene_cls, fp)
+        if on_play is not None:
+            scene_cls = _tracked(scene_cls, on_play)
+        # streams derive from code/config/assets, not data: a one-row edit keeps every other
+        # segment's randomness (and so its cached frames, src/segments.py) unchanged
+        reset_rng(static_fingerprint(get_template(name).path, get_template(name).scene))
+        scene = scene_cls()
+        # sibling workers' enforce() must not evict what this render still concatenates
+        with rendering(getattr(scene.renderer.file_writer, "partial_movie_directory", None), os.path.join(CHECKPOINT_DIR, fp)):
+            scene.render()
+        path = str(scene.renderer.file_writer.movie_file_path)
+        clear_checkpoint(fp)  # the movie exists now; its plays are no longer worth keeping
+        if use_cache:
+            store(fp, path, template=name)
+        cache = manager()
+        cache.enforce()  # inside tempconfig: media_dir overrides decide what gets scanned
+        cache.flush_stats()  # daemon workers never reach atexit
+    return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.registry", description="List or render templates.")
+    sub = parser.add_subparsers(dest="cmd")
+    sub.add_parser("list")
+    p_render = sub.add_parser("render")
+    p_render.add_argument("name", choices=template_names())
+    p_render.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    p_render.add_argument("-o", "--output-file", default=None)
+    p_render.add_argument("--no-cache", action="store_true", help="always render (ignore cache/renders)")
+    p_render.add_argument("--no-resume", action="store_true", help="start from the first play even after a crash")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "render":
+        overrides = {"output_file": args.output_file} if args.output_file else {}
+        print(render(args.name, quality=args.quality, use_cache=not args.no_cache, resume=not args.no_resume, **overrides))
+        return 0
+
+    for name in template_names():
+        t = TEMPLATES[name]
+        print(f"{name:<10} {t.scene:<22} {os.path.relpath(t.path, PROJECT_ROOT):<46} {t.data}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+# src/render_cache.py
+# Content-addressed whole-video cache: same template + data + config -> same movie, no render.
+#
+# fingerprint() hashes everything that decides the pixels:
+#   - the template module's source and the shared code under src/ (not other templates, not tooling)
+#   - every CSV the template might read, from the module's own data_candidates() list (raw
+#     bytes, so the meta header TITLE/SUB/TOPK/... is in it)
+#   - Theme + src.config video settings + the active Manim output config (size, fps, background)
+#   - every file under assets/ (fonts, svgs, images)
+# A finished movie is copied to cache/renders/<fingerprint><ext> with a small
+# JSON manifest next to it; the next identical render returns that file without building a scene.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Dict, List, Optional
+
+from src.cache_manager import cache_hit, cache_miss, cache_put
+from src.data.ingest import file_digest
+
+try:
+    from src.config import ASSETS_DIR, CACHE_DIR
+except Exception:
+    _ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ASSETS_DIR = os.path.join(_ROOT, "assets")
+    CACHE_DIR = os.path.join(_ROOT, "cache")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+RENDER_CACHE_DIR = os.path.join(CACHE_DIR, "renders")
+RENDER_CACHE_VERSION = 1
+
+# runners / bookkeeping: editing these never changes a frame
+_TOOLING = {"registry.py", "render_server.py", "bench_startup.py", "cache_manager.py", "render_cache.py", "checkpoint.py"}
+
+# Manim output settings that change the encoded file
+_MANIM_KEYS = (
+    "pixel_width",
+    "pixel_height",
+    "frame_rate",
+    "frame_width",
+    "frame_height",
+    "background_color",
+    "background_opacity",
+    "transparent",
+    "movie_file_extension",
+    "format",
+    "renderer",
+)
+
+
+def _source_files(template_path: str) -> List[str]:
+    templates_dir = os.path.join(SRC_DIR, "templates")
+    out = [template_path]
+    for dirpath, dirs, files in os.walk(SRC_DIR):
+        dirs[:] = [d for d in dirs if d != "__pycache__" and os.path.join(dirpath, d) != templates_dir]
+        out += [os.path.join(dirpath, f) for f in files if f.endswith(".py") and f not in _TOOLING]
+    return sorted(set(out))
+
+
+def _asset_files() -> List[str]:
+    out: List[str] = []
+    for dirpath, _, files in os.walk(ASSETS_DIR):
+        out += [os.path.join(dirpath, f) for f in files]
+    return sorted(out)
+
+
+def data_candidates(module, data_name: str) -> List[str]:
+    """The template's own CSV search list (its data_candidates()), else DATA_DIR + the repo's Data/ folders."""
+    own = getattr(module, "data_candidates", None)
+    if callable(own):
+        return list(own())
+    dirs = [getattr(module, "DATA_DIR", None), os.path.join(PROJECT_ROOT, "Data"), os.path.dirname(module.__file__), PROJECT_ROOT]
+    return [os.path.join(d, data_name) for d in dirs if d]
+
+
+def _config_snapshot() -> Dict:
+    from manim import config
+
+    from src import config as project_config
+
+    theme = {k: v for k, v in vars(project_config.Theme).items() if not k.startswith("_")}
+    video = {k: getattr(project_config, k, None) for k in ("VIDEO_WIDTH", "VIDEO_HEIGHT", "FPS", "BACKGROUND_COLOR")}
+    manim_cfg = {k: getattr(config, k, None) for k in _MANIM_KEYS}
+    return {"theme": theme, "video": video, "manim": manim_cfg}
+
+
+def _digests(paths: List[str]) -> Dict[str, str]:
+    # repo-relative keys: the same render hashes the same on every checkout path
+    return {os.path.relpath(p, PROJECT_ROOT): file_digest(p) for p in paths if os.path.isfile(p)}
+
+
+def _hash(parts: Dict) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+
+def _static_parts(template_path: str, scene_name: str) -> Dict:
+    import manim
+
+    return {
+        "v": RENDER_CACHE_VERSION,
+        "manim": getattr(manim, "__version__", ""),
+        "scene": scene_name,
+        "code": _digests(_source_files(template_path)),
+        "assets": _digests(_asset_files()),
+        "config": _config_snapshot(),
+    }
+
+
+def static_fingerprint(template_path: str, scene_name: str) -> str:
+    """fingerprint() without the data: code + config + assets. Seeds RNGs and keys segments."""
+    return _hash(_static_parts(template_path, scene_name))
+
+
+def fingerprint(spec, scene_cls: type) -> str:
+    """Hash of code + data + config + assets for one template render (call inside tempconfig)."""
+    module = sys.modules[scene_cls.__module__]
+    parts = _static_parts(spec.path, scene_cls.__name__)
+    parts["template"] = spec.name
+    # by position, not path: render_server jobs point DATA_DIR at a fresh temp dir
+    parts["data"] = [file_digest(p) if os.path.isfile(p) else None for p in data_candidates(module, spec.data)]
+    return _hash(parts)
+
+
+def _entry_path(fp: str, ext: str) -> str:
+    return os.path.join(RENDER_CACHE_DIR, fp + ext)
+
+
+def lookup(fp: str) -> Optional[str]:
+    """Cached movie for this fingerprint, or None."""
+    try:
+        with open(_entry_path(fp, ".json"), "r", encoding="utf-8") as f:
+            movie = _entry_path(fp, json.load(f)["ext"])
+    except (OSError, ValueError, KeyError):
+        cache_miss("renders")
+        return None
+    if not os.path.isfile(movie):
+        cache_miss("renders")
+        return None
+    cache_hit("renders", movie)
+    return movie
+
+
+def store(fp: str, movie_path: str, template: str = "") -> Optional[str]:
+    """Keeps a copy of a finished movie under its fingerprint. Never raises."""
+    ext = os.path.splitext(movie_path)[1] or ".mp4"
+    dst = _entry_path(fp, ext)
+    try:
+        os.makedirs(RENDER_CACHE_DIR, exist_ok=True)
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        shutil.copy2(movie_path, tmp)  # not a hard link: the next render rewrites movie_path in place
+        os.replace(tmp, dst)
+        manifest = {"template": template, "ext": ext, "source": os.path.abspath(movie_path), "time": time.strftime("%Y-%m-%d %H:%M:%S")}
+        with open(_entry_path(fp, ".json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+    except OSError:
+        return None
+    cache_put("renders", dst)
+    return dst
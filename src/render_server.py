@@ -0,0 +1,451 @@
+# src/render_server.py
+# Long-lived local render daemon with pre-forked warm workers.
+#
+# The parent imports manim + every template, registers the bundled fonts, parses world.svg
+# and builds the default glyph set ONCE, then forks N workers. Workers inherit all of that
+# copy-on-write and keep their own caches (datasets, sprites, glyph sets, Text SVGs) between
+# jobs, so a job pays for drawing, not for setup.
+#
+# Protocol: one JSON line per connection (job), JSON lines back (events) until done/error.
+#   job    {"template": "bar", "csv": "/abs/data.csv", "retries": 1, "options": {"quality": "h", "output_file": "x"}}
+#   events {"job": id, "event": "queued" | "start" | "progress" | "retry" | "done" | "error", ...}
+#
+# Each job renders into its own private video dir (two workers on the same template would
+# otherwise share <Scene>.mp4 and its partial_movie_files list); the finished movie is copied
+# to media/render_server/<job>_<Scene>.mp4, or to options.output_file when one is given.
+#
+# A retry resumes from the job's last finished play (src/checkpoint.py), so a transient
+# failure late in a render costs the tail, not the whole video. The parent watches its
+# workers: one killed outright (OOM, signal) is replaced, and its job gets an "error" event,
+# or is requeued (same journal, so it resumes) while it has retries left.
+#
+#   python -m src.render_server serve -w 2                  # Unix socket (127.0.0.1:8765 w/o AF_UNIX)
+#   python -m src.render_server submit bar --csv my.csv -q h
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import multiprocessing as mp
+import multiprocessing.connection as mp_connection
+import os
+import queue
+import shutil
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.registry import PROJECT_ROOT, QUALITIES, get_template, load_scene, render, template_names
+
+HAS_UNIX = hasattr(socket, "AF_UNIX")
+DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), "shorts_render.sock") if HAS_UNIX else "127.0.0.1:8765"
+
+_WARM = False
+WATCH_INTERVAL = 1.0  # seconds between worker liveness checks
+
+
+# ============================================================
+# ✅ WARM-UP (parent, before fork)
+# ============================================================
+def warm_up(templates: Optional[Iterable[str]] = None) -> None:
+    """Everything a job would otherwise redo per process. Idempotent (no-op in forked workers)."""
+    global _WARM
+    if _WARM:
+        return
+
+    import manimpango
+    from manim import SVGMobject
+
+    from src.config import ASSETS_DIR, FONTS_DIR
+    from src.primitives import GlyphCounter
+    from src.static_hold import install as install_static_hold
+    from src.text_store import install as install_text_store
+
+    install_text_store()  # before fork: workers inherit the patched Text / renderer
+    install_static_hold()
+
+    for ttf in sorted(glob.glob(os.path.join(FONTS_DIR, "*.ttf"))):
+        try:
+            manimpango.register_font(ttf)
+        except Exception:
+            pass
+
+    for name in templates or template_names():
+        load_scene(name)
+
+    svg_path = os.path.join(ASSETS_DIR, "svgs", "world.svg")
+    if os.path.exists(svg_path):
+        SVGMobject(svg_path)  # manim keeps parsed SVGs keyed by (file, args); the map reuses it
+
+    GlyphCounter()  # default counter glyph set (Montserrat bold)
+    _WARM = True
+
+
+# ============================================================
+# ✅ ONE JOB (worker side)
+# ============================================================
+@contextmanager
+def _job_data(module, data_name: str, csv: Optional[str]):
+    """Points the template's DATA_DIR at a private dir holding the job's CSV under its usual name."""
+    if not csv:
+        yield
+        return
+    if not os.path.exists(csv):
+        raise FileNotFoundError(csv)
+    job_dir = tempfile.mkdtemp(prefix="shorts_job_")
+    shutil.copyfile(csv, os.path.join(job_dir, data_name))
+    missing = object()
+    old = getattr(module, "DATA_DIR", missing)
+    module.DATA_DIR = job_dir
+    try:
+        yield
+    finally:
+        if old is missing:
+            del module.DATA_DIR
+        else:
+            module.DATA_DIR = old
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+
+@contextmanager
+def _job_videos():
+    """Private video_dir for one job (Text/Tex caches under media_dir stay shared)."""
+    job_dir = tempfile.mkdtemp(prefix="shorts_media_")
+    try:
+        yield os.path.join(job_dir, "videos")
+    finally:
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+
+def _export(path: str, output_file: Optional[str], token: str) -> str:
+    """Copies a job's movie out of its private dir; returns the final path."""
+    from manim import config
+
+    out_dir = os.path.join(str(config.get_dir("media_dir")), "render_server")
+    if output_file:
+        name = output_file if os.path.splitext(output_file)[1] else output_file + os.path.splitext(path)[1]
+        dst = name if os.path.isabs(name) else os.path.join(out_dir, name)
+    else:
+        dst = os.path.join(out_dir, f"{token}_{os.path.basename(path)}")
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    shutil.copy2(path, tmp)
+    os.replace(tmp, dst)
+    return dst
+
+
+def run_job(job: Dict, emit: Optional[Callable[[Dict], None]] = None, job_id: Optional[str] = None) -> str:
+    """Renders one job in this process; returns the movie path."""
+    spec = get_template(job["template"])
+    options = dict(job.get("options") or {})
+    quality = options.pop("quality", None)
+    output_file = options.pop("output_file", None)
+    if quality is not None and quality not in QUALITIES:
+        raise ValueError(f"quality must be one of {sorted(QUALITIES)}")
+
+    def on_play(scene) -> None:
+        if emit is not None:
+            emit({"event": "progress", "plays": scene.renderer.num_plays, "t": round(float(scene.renderer.time), 2)})
+
+    module = sys.modules[load_scene(spec.name).__module__]
+    with _job_data(module, spec.data, job.get("csv")), _job_videos() as video_dir:
+        path = render(spec.name, quality=quality, on_play=on_play, video_dir=video_dir, **options)
+        return _export(path, output_file, job_id or uuid.uuid4().hex[:12])
+
+
+def _worker_loop(templates, jobs, events) -> None:
+    warm_up(templates)  # only does work when the worker wasn't forked from a warm parent
+    while True:
+        item = jobs.get()
+        if item is None:
+            return
+        job_id, job = item
+
+        def emit(ev: Dict, job_id=job_id) -> None:
+            events.send({"job": job_id, **ev})  # own pipe, no feeder thread: sent before we can die
+
+        t0 = time.perf_counter()
+        emit({"event": "start", "pid": os.getpid()})
+        retries = max(0, int(job.get("retries") or 0))
+        for attempt in range(retries + 1):
+            try:
+                path = run_job(job, emit, job_id)
+                emit({"event": "done", "path": path, "seconds": round(time.perf_counter() - t0, 2)})
+                break
+            except Exception as e:
+                message = f"{type(e).__name__}: {e}"
+                if attempt < retries:
+                    emit({"event": "retry", "attempt": attempt + 1, "message": message})
+                    continue
+                emit({"event": "error", "message": message, "trace": traceback.format_exc(limit=3)})
+
+
+# ============================================================
+# ✅ SERVER (parent)
+# ============================================================
+def _parse_address(address: str) -> Union[str, Tuple[str, int]]:
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and os.sep not in host:
+        return host or "127.0.0.1", int(port)
+    return address
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def _send(self, ev: Dict) -> None:
+        self.wfile.write((json.dumps(ev) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        daemon: RenderDaemon = self.server.render_daemon
+        try:
+            job = json.loads(self.rfile.readline().decode("utf-8"))
+            get_template(job["template"])
+        except Exception as e:
+            self._send({"event": "error", "message": f"bad job: {e}"})
+            return
+
+        job_id = uuid.uuid4().hex[:12]
+        inbox = daemon.open_job(job_id)
+        try:
+            daemon.enqueue(job_id, job)
+            self._send({"job": job_id, "event": "queued"})
+            while True:
+                ev = inbox.get()
+                self._send(ev)
+                if ev["event"] in ("done", "error"):
+                    return
+        except OSError:
+            pass  # client went away; the job still finishes, its events are dropped
+        finally:
+            daemon.close_job(job_id)
+
+
+if HAS_UNIX:
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RenderDaemon:
+    def __init__(self, address: str = DEFAULT_ADDRESS, workers: int = 2, templates: Optional[Iterable[str]] = None):
+        self.address = _parse_address(address)
+        self.n_workers = max(1, int(workers))
+        self.templates = list(templates or template_names())
+        self._inboxes: Dict[str, "queue.Queue[Dict]"] = {}
+        self._lock = threading.Lock()
+        # each worker has its own job queue and event pipe: one killed mid-get() / mid-send
+        # can't leave a shared queue's lock held, and the parent always knows who runs which job
+        self._pending: "queue.Queue[Optional[Tuple[str, Dict]]]" = queue.Queue()
+        self._idle: "queue.Queue[int]" = queue.Queue()  # pids ready for a job
+        self._workers: Dict[int, Tuple[object, object, object]] = {}  # pid -> (process, job queue, event pipe)
+        self._running: Dict[str, Tuple[int, Dict]] = {}  # job id -> (worker pid, job)
+        self._stopping = threading.Event()
+        self.server = None
+
+    @property
+    def _procs(self) -> List:
+        return [proc for proc, _, _ in self._workers.values()]
+
+    def open_job(self, job_id: str) -> "queue.Queue[Dict]":
+        with self._lock:
+            inbox = self._inboxes[job_id] = queue.Queue()
+        return inbox
+
+    def close_job(self, job_id: str) -> None:
+        with self._lock:
+            self._inboxes.pop(job_id, None)
+
+    def enqueue(self, job_id: str, job: Dict) -> None:
+        self._pending.put((job_id, job))
+
+    def _deliver(self, ev: Dict) -> None:
+        with self._lock:
+            inbox = self._inboxes.get(ev.get("job"))
+        if inbox is not None:
+            inbox.put(ev)
+
+    def _assign(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            while True:
+                pid = self._idle.get()
+                with self._lock:
+                    worker = self._workers.get(pid)
+                    if worker is not None:  # else it died while idle; its replacement is queued too
+                        self._running[item[0]] = (pid, item[1])
+                        break
+            worker[1].put(item)
+
+    def _dispatch(self) -> None:
+        while not self._stopping.is_set():
+            with self._lock:
+                pipes = [pipe for _, _, pipe in self._workers.values()]
+            for pipe in mp_connection.wait(pipes, timeout=WATCH_INTERVAL):
+                try:
+                    ev = pipe.recv()
+                except (EOFError, OSError):
+                    continue  # worker gone; _watch fails / requeues its job
+                if ev.get("event") in ("done", "error"):
+                    with self._lock:
+                        pid, _ = self._running.pop(ev.get("job"), (None, None))
+                    if pid is not None:
+                        self._idle.put(pid)
+                self._deliver(ev)
+
+    def _spawn(self) -> None:
+        jobs = self._ctx.Queue()
+        pipe, events = self._ctx.Pipe(duplex=False)
+        p = self._ctx.Process(target=_worker_loop, args=(self.templates, jobs, events), daemon=True)
+        p.start()
+        events.close()  # the worker holds the write end; EOF here once it dies
+        with self._lock:
+            self._workers[p.pid] = (p, jobs, pipe)
+        self._idle.put(p.pid)
+
+    def _worker_died(self, p) -> None:
+        """Starts a replacement, then fails or requeues the dead worker's job (if it had one)."""
+        with self._lock:
+            self._workers.pop(p.pid)[2].close()
+            lost = [(job_id, job) for job_id, (pid, job) in self._running.items() if pid == p.pid]
+            for job_id, _ in lost:
+                del self._running[job_id]
+        self._spawn()
+        message = f"worker {p.pid} died (exit code {p.exitcode})"
+        for job_id, job in lost:
+            retries = int(job.get("retries") or 0)
+            if retries > 0:  # same fingerprint -> the requeued render resumes from its journal
+                self._deliver({"job": job_id, "event": "retry", "message": message})
+                self.enqueue(job_id, {**job, "retries": retries - 1})
+            else:
+                self._deliver({"job": job_id, "event": "error", "message": message})
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(WATCH_INTERVAL):
+            for p in self._procs:
+                if not p.is_alive() and not self._stopping.is_set():
+                    self._worker_died(p)
+
+    def start(self) -> None:
+        # fork shares the warm parent copy-on-write; spawn-only platforms warm each worker once
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context("fork" if "fork" in methods else "spawn")
+        if ctx.get_start_method() == "fork":
+            warm_up(self.templates)
+
+        self._ctx = ctx
+        for _ in range(self.n_workers):
+            self._spawn()
+        self._threads = [
+            threading.Thread(target=target, daemon=True) for target in (self._dispatch, self._assign, self._watch)
+        ]
+        for t in self._threads:
+            t.start()
+
+        if isinstance(self.address, str):
+            if os.path.exists(self.address):
+                os.unlink(self.address)  # stale socket from a previous run
+            self.server = _UnixServer(self.address, _Handler)
+        else:
+            self.server = _TCPServer(self.address, _Handler)
+        self.server.render_daemon = self
+
+    def serve_forever(self) -> None:
+        if self.server is None:
+            self.start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        self._pending.put(None)
+        with self._lock:
+            workers = list(self._workers.values())
+        for _, jobs, _ in workers:
+            jobs.put(None)
+        for p, _, _ in workers:
+            p.join(timeout=5)
+        for t in self._threads:
+            t.join(timeout=5)
+        if self.server is not None:
+            self.server.server_close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+
+
+# ============================================================
+# ✅ CLIENT
+# ============================================================
+def submit(job: Dict, address: str = DEFAULT_ADDRESS, on_event: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """Sends one job and blocks until it finishes; returns the final (done/error) event."""
+    addr = _parse_address(address)
+    family = socket.AF_INET if isinstance(addr, tuple) else socket.AF_UNIX
+    last: Dict = {}
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.connect(addr)
+        sock.sendall((json.dumps(job) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as f:
+            for line in f:
+                last = json.loads(line)
+                if on_event is not None:
+                    on_event(last)
+                if last.get("event") in ("done", "error"):
+                    break
+    return last
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.render_server", description="Warm local render daemon.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_serve = sub.add_parser("serve")
+    p_serve.add_argument("templates", nargs="*", help="templates to preload (default: all)")
+    p_serve.add_argument("-a", "--address", default=DEFAULT_ADDRESS, help="socket path or host:port")
+    p_serve.add_argument("-w", "--workers", type=int, default=2)
+
+    p_submit = sub.add_parser("submit")
+    p_submit.add_argument("template", choices=template_names())
+    p_submit.add_argument("--csv", default=None)
+    p_submit.add_argument("-q", "--quality", choices=sorted(QUALITIES), default=None)
+    p_submit.add_argument("-o", "--output-file", default=None)
+    p_submit.add_argument("-a", "--address", default=DEFAULT_ADDRESS)
+    p_submit.add_argument("-r", "--retries", type=int, default=0, help="re-run a failed job (resumes from its checkpoint)")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        if PROJECT_ROOT not in sys.path:
+            sys.path.insert(0, PROJECT_ROOT)
+        daemon = RenderDaemon(args.address, workers=args.workers, templates=args.templates or None)
+        daemon.start()
+        print(f"render daemon: {args.address} ({daemon.n_workers} workers)", flush=True)
+        daemon.serve_forever()
+        return 0
+
+    options = {}
+    if args.quality:
+        options["quality"] = args.quality
+    if args.output_file:
+        options["output_file"] = args.output_file
+    job = {"template": args.template, "csv": os.path.abspath(args.csv) if args.csv else None, "retries": args.retries, "options": options}
+    final = submit(job, args.address, on_event=lambda ev: print(json.dumps(ev), flush=True))
+    return 0 if final.get("event") == "done" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# src/rng.py
+# Render-scoped randomness: named, seeded streams derived from the job fingerprint.
+#
+# Unseeded random.* made every render of the same inputs differ, so frames could not be
+# cached, compared or split across workers. Templates draw from stream("vs.rain") /
+# np_stream(...) instead: same root seed + same name -> same sequence, and adding a new
+# stream never shifts the numbers of the others. reset() also seeds the global `random` /
+# np.random for code that still uses them (src/utils.make_floating_particles).
+#
+# registry.render() resets with the render's static fingerprint (code + config + assets, not
+# the data, so segments unaffected by a data edit draw the same numbers); a plain `manim`
+# CLI run gets the default seed at import (one scene per process there).
+#
+# For state that must be a function of time (rain, particles), hash_uniform(name, i, k) is
+# stateless: the value for (line i, cycle k) never depends on how many frames came before.
+
+from __future__ import annotations
+
+import hashlib
+import random
+import struct
+
+import numpy as np
+
+DEFAULT_SEED = "auto-shorts"
+
+_ROOT = DEFAULT_SEED
+
+
+def _digest(*parts) -> bytes:
+    return hashlib.sha256("\x1f".join(str(p) for p in (_ROOT,) + parts).encode("utf-8")).digest()
+
+
+def reset(seed=None) -> None:
+    """Starts a render: new root seed for every stream, global RNGs re-seeded from it."""
+    global _ROOT
+    _ROOT = DEFAULT_SEED if seed is None else str(seed)
+    random.seed(_digest("global"))
+    np.random.seed(struct.unpack("<I", _digest("global.np")[:4])[0])
+
+
+def seed_of(name: str) -> int:
+    return int.from_bytes(_digest(name)[:8], "little")
+
+
+def stream(name: str) -> random.Random:
+    """Independent random.Random for one named use (same render + name -> same numbers)."""
+    return random.Random(seed_of(name))
+
+
+def np_stream(name: str) -> np.random.Generator:
+    return np.random.default_rng(seed_of(name))
+
+
+def hash_uniform(name: str, *index, low: float = 0.0, high: float = 1.0) -> float:
+    """Stateless uniform draw for (name, *index): a pure function, safe to call per frame."""
+    u = int.from_bytes(_digest(name, *index)[:8], "little") / 2**64
+    return low + (high - low) * u
+
+
+reset()
@@ -0,0 +1,170 @@
+# src/segments.py
+# Segment-level render cache: re-render only the rounds / items / reveals a data edit touched.
+#
+# A template wraps each per-row block of plays in `with segs.segment(name, *deps):`. deps are
+# whatever that block's frames depend on (row values, running scores, bin contents, mobjects
+# already on screen); the key also folds in the static fingerprint (code + config + assets,
+# src/render_cache.py) and the scene clock at the block's start, so a block whose timing
+# shifted because an earlier row changed is a miss too.
+#
+#   hit  -> the block still runs (later state stays exact) but with Manim's skip_animations,
+#           and the stored partial movies are hard-linked (or copied) into this render's
+#           partial_movie_files dir and spliced into the writer's file list; that dir is
+#           protected from eviction while the render runs (src/cache_manager.py)
+#   miss -> rendered normally; its partial movies are copied to cache/segments/<key>_NN.<ext>
+#
+# Background updaters must be functions of elapsed time (see src/rng.py): a skipped play
+# advances them by its whole run_time in one step.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Any, List, Optional
+
+import numpy as np
+from manim import Mobject, config
+
+from src.cache_manager import cache_hit, cache_miss, cache_put
+from src.render_cache import static_fingerprint
+
+try:
+    from src.config import CACHE_DIR
+except Exception:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+SEGMENT_CACHE_DIR = os.path.join(CACHE_DIR, "segments")
+
+
+def _array_digest(arr: np.ndarray) -> str:
+    arr = np.ascontiguousarray(arr)
+    h = hashlib.sha1(f"{arr.dtype.str}{arr.shape}".encode("ascii"))
+    h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def mobject_digest(mob: Mobject) -> str:
+    """Geometry + colours (+ pixels for images) of a mobject family (what it looks like, not how it was built)."""
+    h = hashlib.sha1()
+    for m in mob.get_family():
+        h.update(np.ascontiguousarray(m.points, dtype=np.float64).round(6).tobytes())
+        for attr in ("fill_rgbas", "stroke_rgbas", "stroke_width", "z_index"):
+            if hasattr(m, attr):
+                h.update(np.asarray(getattr(m, attr), dtype=np.float64).round(6).tobytes())
+        pixels = getattr(m, "pixel_array", None)
+        if pixels is not None:  # ImageMobject: points are just the corners
+            h.update(_array_digest(pixels).encode("ascii"))
+    return h.hexdigest()
+
+
+def _dep(value: Any) -> Any:
+    if isinstance(value, Mobject):
+        return mobject_digest(value)
+    if isinstance(value, (list, tuple)):
+        return [_dep(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _dep(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, np.ndarray):
+        return _array_digest(value)  # repr() elides the middle of large arrays
+    return repr(value)
+
+
+class SegmentCache:
+    def __init__(self, scene, template_file: str):
+        self.scene = scene
+        renderer = getattr(scene, "renderer", None)
+        self.enabled = (
+            bool(config.write_to_movie)
+            and hasattr(renderer, "file_writer")
+            and not getattr(renderer, "_original_skipping_status", True)  # -s / -n runs: leave alone
+        )
+        self.base = static_fingerprint(template_file, type(scene).__name__) if self.enabled else ""
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, name: str, deps) -> str:
+        blob = json.dumps([self.base, name, _dep(list(deps))], sort_keys=True).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()[:32]
+
+    def _manifest(self, key: str) -> str:
+        return os.path.join(SEGMENT_CACHE_DIR, key + ".json")
+
+    def _lookup(self, key: str) -> Optional[List[str]]:
+        try:
+            with open(self._manifest(key), "r", encoding="utf-8") as f:
+                files = [os.path.join(SEGMENT_CACHE_DIR, fn) for fn in json.load(f)["files"]]
+        except (OSError, ValueError, KeyError):
+            return None
+        return files if all(os.path.isfile(p) for p in files) else None  # partly evicted -> redo
+
+    @staticmethod
+    def _claim(files: List[str], directory: str) -> Optional[List[str]]:
+        """Links (or copies) cached files into this render's partial movie dir; None if one is gone."""
+        out: List[str] = []
+        try:
+            for src in files:
+                dst = os.path.join(directory, "segment_" + os.path.basename(src))
+                tmp = f"{dst}.{os.getpid()}.tmp"
+                try:
+                    os.link(src, tmp)
+                except OSError:
+                    shutil.copy2(src, tmp)  # other filesystem / no hard links
+                os.replace(tmp, dst)
+                out.append(dst)
+        except OSError:
+            return None  # evicted between lookup and claim -> render it
+        return out
+
+    def _store(self, key: str, files: List[str]) -> None:
+        names: List[str] = []
+        try:
+            os.makedirs(SEGMENT_CACHE_DIR, exist_ok=True)
+            for i, src in enumerate(files):
+                name = f"{key}_{i:02d}{os.path.splitext(src)[1]}"
+                dst = os.path.join(SEGMENT_CACHE_DIR, name)
+                tmp = f"{dst}.{os.getpid()}.tmp"
+                shutil.copy2(src, tmp)  # Manim reuses uncached_NNNNN names on the next render
+                os.replace(tmp, dst)
+                names.append(name)
+                cache_put("segments", dst)
+            with open(self._manifest(key), "w", encoding="utf-8") as f:
+                json.dump({"files": names}, f)
+        except OSError:
+            pass
+
+    @contextmanager
+    def segment(self, name: str, *deps):
+        if not self.enabled:
+            yield
+            return
+        renderer = self.scene.renderer
+        writer = renderer.file_writer
+        key = self.key(name, (round(float(renderer.time), 4),) + deps)
+        files = self._lookup(key)
+        if files is not None:
+            cached = files
+            files = self._claim(cached, str(writer.partial_movie_directory))
+            if files is not None:
+                for p in cached:
+                    cache_hit("segments", p)
+
+        if files is None:
+            self.misses += 1
+            cache_miss("segments")
+            start = len(writer.partial_movie_files)
+            yield
+            self._store(key, [f for f in writer.partial_movie_files[start:] if f])
+            return
+
+        self.hits += 1
+        renderer._original_skipping_status = True  # play() resets skip_animations from this
+        try:
+            yield
+        finally:
+            renderer._original_skipping_status = False
+            renderer.skip_animations = False
+        writer.partial_movie_files.extend(files)
+        writer.sections[-1].partial_movie_files.extend(files)
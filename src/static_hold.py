@@ -0,0 +1,321 @@
+# src/static_hold.py
+# Static-hold detection for the Cairo renderer: holds and mostly-still plays stop re-rasterising.
+#
+# Manim already freezes a Wait with no updaters, but one rotating watermark / blinking chip /
+# rain updater anywhere turns every later mobject (draw order) into a "moving" one, so a
+# self.wait(2) at the end of a template redraws the whole 1080x1920 frame 120 times.
+# install() patches three renderer steps; per play:
+#
+#   seeds  - what can actually change: families of the played animations' mobjects, of every
+#            mobject with an updater, and foreground mobjects
+#   base   - everything below the lowest seed in draw order; drawn once per play
+#   held   - everything else above it; drawn once more on top of base for the play's
+#            background, then redrawn only where a seed's pixels reach (always from the base
+#            image, so a translucent held mobject is never composited twice)
+#   frame  - seeds' points/style digest equal to the previous frame's -> that framebuffer is
+#            written again without touching Cairo
+#   rects  - otherwise (DIRTY_RECTS) only the pixel bounds of the seeds that changed, before
+#            and after, are repainted: base image copied back into those rectangles, then every
+#            seed / held mobject overlapping them drawn in z-order under a Cairo clip; the rest
+#            of the frame is the previous one. Over MAX_DIRTY_FRACTION of the frame (or with
+#            DIRTY_RECTS off) -> base image + every seed and held mobject
+#
+# held is guarded, not trusted: its digest and the scene's whole family (ids + draw order)
+# are checked every frame, and the first change (an updater on A that moves B, always_redraw
+# / become() growing a family, a z_index change) falls back to Manim's own static/moving
+# split for the rest of the play.
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, Optional
+
+import numpy as np
+from manim import Scene, VMobject, config
+from manim.constants import RendererType
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+
+DIRTY_RECTS = True
+MAX_DIRTY_FRACTION = 0.5  # above this a clipped redraw saves nothing over a full one
+MAX_RECTS = 32  # more than this many after merging -> their bounding box
+
+_ORIG: Dict[str, object] = {}
+STATS = dict.fromkeys(
+    ("plays", "frames", "reused", "fallbacks", "dirty_frames", "dirty_pixels", "frame_pixels"), 0
+)
+
+
+def _member_digest(h, m) -> None:
+    h.update(np.ascontiguousarray(m.points).tobytes())
+    for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width", "background_stroke_width", "z_index"):
+        value = getattr(m, attr, None)
+        if value is not None:
+            h.update(np.ascontiguousarray(value, dtype=np.float64).tobytes())
+    pixels = getattr(m, "pixel_array", None)
+    if pixels is not None:  # ImageMobject: replaced arrays show up by identity, not content
+        h.update(id(pixels).to_bytes(8, "little"))
+        # set_opacity()/set_color() write into that same array; their inputs are kept on the mobject
+        h.update(repr((getattr(m, "fill_opacity", None), str(getattr(m, "color", "")))).encode("utf-8"))
+
+
+def _digest(mobs) -> bytes:
+    h = hashlib.sha1()
+    for m in mobs:
+        _member_digest(h, m)
+    return h.digest()
+
+
+def _digests(mobs) -> List[bytes]:
+    out = []
+    for m in mobs:
+        h = hashlib.sha1()
+        _member_digest(h, m)
+        out.append(h.digest())
+    return out
+
+
+def _boxes(mobs, pad: float) -> np.ndarray:
+    """(n, 4) x0, y0, x1, y1 per mobject, padded by its stroke width (+ pad)."""
+    out = np.empty((len(mobs), 4))
+    for i, m in enumerate(mobs):
+        pts = m.points
+        if not len(pts):  # e.g. Create() at alpha 0: nothing to overlap
+            out[i] = (np.inf, np.inf, -np.inf, -np.inf)
+            continue
+        grow = pad + 0.01 * float(np.max(getattr(m, "stroke_width", 0) or 0))  # camera.cairo_line_width_multiple
+        grow += 0.01 * float(np.max(getattr(m, "background_stroke_width", 0) or 0))
+        out[i, :2] = pts[:, :2].min(axis=0) - grow
+        out[i, 2:] = pts[:, :2].max(axis=0) + grow
+    return out
+
+
+def _family_ids(mobs) -> set:
+    return {id(f) for m in mobs if m is not None for f in m.get_family()}
+
+
+def _merge(rects: List[List[int]]) -> List[List[int]]:
+    """Unions overlapping pixel rectangles until none overlap."""
+    merged = True
+    while merged:
+        merged = False
+        out: List[List[int]] = []
+        for r in rects:
+            for o in out:
+                if r[0] <= o[2] and o[0] <= r[2] and r[1] <= o[3] and o[1] <= r[3]:
+                    o[:] = [min(o[0], r[0]), min(o[1], r[1]), max(o[2], r[2]), max(o[3], r[3])]
+                    merged = True
+                    break
+            else:
+                out.append(list(r))
+        rects = out
+    if len(rects) > MAX_RECTS:
+        a = np.asarray(rects)
+        rects = [[int(a[:, 0].min()), int(a[:, 1].min()), int(a[:, 2].max()), int(a[:, 3].max())]]
+    return rects
+
+
+def _overlaps(boxes: np.ndarray, rects) -> np.ndarray:
+    r = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+    return (
+        (boxes[:, None, 0] < r[None, :, 2])
+        & (r[None, :, 0] < boxes[:, None, 2])
+        & (boxes[:, None, 1] < r[None, :, 3])
+        & (r[None, :, 1] < boxes[:, None, 3])
+    ).any(axis=1)
+
+
+def _clippable(m) -> bool:
+    # ImageMobjects and background-image VMobjects are composited with numpy, not through the
+    # camera's Cairo context, so a clip would not hold for them
+    return isinstance(m, VMobject) and m.get_background_image() is None
+
+
+class _Plan:
+    def __init__(self, scene):
+        camera = scene.renderer.camera
+        self.scene = scene
+        self.camera = camera
+        everything = extract_mobject_family_members(scene.mobjects + scene.foreground_mobjects)
+        live = [m.get_family() for m in everything if m.updaters]
+        seed_ids = _family_ids([a.mobject for a in scene.animations]) | _family_ids(scene.foreground_mobjects)
+        seed_ids |= {id(f) for family in live for f in family}
+
+        # whole families, not only members with points yet: Create() at alpha 0 has none
+        drawn = self.family()
+        first = next((i for i, m in enumerate(drawn) if id(m) in seed_ids), len(drawn))
+        self.base = drawn[:first]  # below every seed: never redrawn this play
+        self.top = drawn[first:]  # seeds + held, draw order
+        self.seeds = [m for m in self.top if id(m) in seed_ids]
+        self.held = [m for m in self.top if id(m) not in seed_ids]
+        self.order = {id(m): i for i, m in enumerate(drawn)}
+        self.ids = [id(m) for m in drawn]
+
+        self.pad = 2.0 * config.frame_width / config.pixel_width
+        self.held_sig = _digest(self.held)
+        self.held_pixels = self.pixel_boxes(_boxes(self.held, self.pad))
+        self.base_image: Optional[np.ndarray] = None  # base only; static_image = base + held
+        self.sigs: Optional[List[bytes]] = None  # per seed, last drawn frame
+        self.boxes: Optional[np.ndarray] = None
+        self.frame: Optional[np.ndarray] = None
+        self.broken = False
+
+    def family(self) -> List:
+        scene = self.scene
+        roots = scene.mobjects + scene.foreground_mobjects
+        return extract_mobject_family_members(roots, use_z_index=self.camera.use_z_index)
+
+    def stale(self) -> bool:
+        """A held mobject changed, or the family / draw order did (always_redraw, become(), z_index)."""
+        return [id(m) for m in self.family()] != self.ids or _digest(self.held) != self.held_sig
+
+    def pixel_boxes(self, boxes: np.ndarray) -> np.ndarray:
+        """Frame-unit boxes -> integer pixel boxes (x0, y0, x1, y1), clamped to the frame."""
+        c = self.camera
+        pw, ph = c.pixel_width, c.pixel_height
+        sx, sy = pw / c.frame_width, ph / c.frame_height
+        fx, fy = c.frame_center[0], c.frame_center[1]
+        out = np.zeros((len(boxes), 4))
+        ok = np.isfinite(boxes).all(axis=1)
+        b = boxes[ok]
+        out[ok, 0] = np.floor((b[:, 0] - fx) * sx + pw / 2)
+        out[ok, 2] = np.ceil((b[:, 2] - fx) * sx + pw / 2)
+        out[ok, 1] = np.floor(ph / 2 - (b[:, 3] - fy) * sy)
+        out[ok, 3] = np.ceil(ph / 2 - (b[:, 1] - fy) * sy)
+        out[:, 0::2] = out[:, 0::2].clip(0, pw)
+        out[:, 1::2] = out[:, 1::2].clip(0, ph)
+        return out
+
+    def dirty_rects(self, sigs: List[bytes], boxes: np.ndarray) -> Optional[List[List[int]]]:
+        """Pixel rectangles covering every changed seed before and after, or None (redraw all)."""
+        if self.sigs is None:  # first frame of the play: seeds aren't in static_image at all
+            parts = boxes
+        else:
+            changed = [i for i, (a, b) in enumerate(zip(sigs, self.sigs)) if a != b]
+            parts = np.concatenate([self.boxes[changed], boxes[changed]])
+        px = self.pixel_boxes(parts)
+        px = px[(px[:, 2] > px[:, 0]) & (px[:, 3] > px[:, 1])]
+        rects = _merge(px.astype(int).tolist())
+        area = sum((r[2] - r[0]) * (r[3] - r[1]) for r in rects)
+        total = self.camera.pixel_width * self.camera.pixel_height
+        if area > MAX_DIRTY_FRACTION * total:
+            return None
+        STATS["dirty_frames"] += 1
+        STATS["dirty_pixels"] += area
+        STATS["frame_pixels"] += total
+        return rects
+
+    def in_rects(self, rects, boxes: np.ndarray) -> List:
+        """Seeds + held whose pixels reach into rects, in draw order."""
+        if not rects:
+            return []
+        seeds = [m for m, on in zip(self.seeds, _overlaps(self.pixel_boxes(boxes), rects)) if on]
+        held = [m for m, on in zip(self.held, _overlaps(self.held_pixels, rects)) if on] if self.held else []
+        return sorted(seeds + held, key=lambda m: self.order[id(m)])
+
+
+def _drawable(mobs) -> List:
+    return [m for m in mobs if m.has_points()]
+
+
+def _begin_animations(self) -> None:
+    _ORIG["begin_animations"](self)
+    self._hold = None
+    renderer = self.renderer
+    if (
+        config.renderer != RendererType.CAIRO
+        or not isinstance(renderer, CairoRenderer)
+        or renderer.skip_animations
+        or not self.moving_mobjects
+        or self.is_current_animation_frozen_frame()  # Manim already writes that frame once
+    ):
+        return
+    self._hold = _Plan(self)
+    STATS["plays"] += 1
+
+
+def _save_static_frame_data(self, scene, static_mobjects):
+    plan = getattr(scene, "_hold", None)
+    if plan is None:
+        return _ORIG["save_static_frame_data"](self, scene, static_mobjects)
+    self.camera.reset()
+    self.camera.capture_mobjects(_drawable(plan.base), include_submobjects=False)
+    plan.base_image = self.get_frame()
+    self.camera.capture_mobjects(_drawable(plan.held), include_submobjects=False)
+    self.static_image = self.get_frame()
+    return self.static_image
+
+
+def _render(self, scene, time, moving_mobjects):
+    plan = getattr(scene, "_hold", None)
+    if plan is not None and not plan.broken and plan.stale():
+        plan.broken = True  # something outside the seeds moved: Manim's split from here on
+        STATS["fallbacks"] += 1
+        _ORIG["save_static_frame_data"](self, scene, scene.static_mobjects)
+    if plan is None or plan.broken:
+        return _ORIG["render"](self, scene, time, moving_mobjects)
+
+    STATS["frames"] += 1
+    sigs = _digests(plan.seeds)
+    if sigs == plan.sigs and plan.frame is not None:
+        STATS["reused"] += 1
+        self.add_frame(plan.frame)
+        return
+    boxes = _boxes(plan.seeds, plan.pad)
+    rects = plan.dirty_rects(sigs, boxes) if DIRTY_RECTS else None
+    if rects is None:
+        # from the base image (no held mobjects in it): a held one is never composited twice
+        self.camera.set_frame_to_background(plan.base_image)
+        self.camera.capture_mobjects(_drawable(plan.top), include_submobjects=False)
+    else:
+        prev = plan.frame if plan.frame is not None else self.static_image
+        self.camera.set_frame_to_background(prev)
+        _redraw_rects(self.camera, plan, rects, boxes, prev)
+    plan.sigs, plan.boxes, plan.frame = sigs, boxes, self.get_frame()
+    self.add_frame(plan.frame)
+
+
+def _redraw_rects(camera, plan: _Plan, rects, boxes: np.ndarray, prev: np.ndarray) -> None:
+    """camera.pixel_array holds prev; repaints just rects of it from the base image up."""
+    pixels = camera.pixel_array
+    for x0, y0, x1, y1 in rects:
+        pixels[y0:y1, x0:x1] = plan.base_image[y0:y1, x0:x1]
+    mobs = _drawable(plan.in_rects(rects, boxes))
+    if all(_clippable(m) for m in mobs):
+        ctx = camera.get_cairo_context(pixels)
+        matrix = ctx.get_matrix()
+        ctx.save()
+        ctx.identity_matrix()
+        for x0, y0, x1, y1 in rects:
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.set_matrix(matrix)
+        ctx.clip()
+        try:
+            camera.capture_mobjects(mobs, include_submobjects=False)
+        finally:
+            ctx.restore()
+        return
+    camera.capture_mobjects(mobs, include_submobjects=False)
+    out = prev.copy()  # unclipped draw: keep only the rects of it
+    for x0, y0, x1, y1 in rects:
+        out[y0:y1, x0:x1] = pixels[y0:y1, x0:x1]
+    pixels[:] = out
+
+
+def install() -> None:
+    """Patches Scene / CairoRenderer for static-hold reuse. Idempotent."""
+    if _ORIG:
+        return
+    _ORIG["begin_animations"] = Scene.begin_animations
+    _ORIG["save_static_frame_data"] = CairoRenderer.save_static_frame_data
+    _ORIG["render"] = CairoRenderer.render
+    Scene.begin_animations = _begin_animations
+    CairoRenderer.save_static_frame_data = _save_static_frame_data
+    CairoRenderer.render = _render
+
+
+def stats() -> Dict[str, float]:
+    """Counters; dirty_share = redrawn pixels / frame pixels over the dirty-rect frames."""
+    out: Dict[str, float] = dict(STATS)
+    out["dirty_share"] = STATS["dirty_pixels"] / STATS["frame_pixels"] if STATS["frame_pixels"] else 0.0
+    return out
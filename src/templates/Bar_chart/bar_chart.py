@@ -4,7 +4,6 @@ import sys
 import os
 import numpy as np
 import random
-import pandas as pd
 from manim import *
 from manim import rate_functions as rf
 
@@ -13,74 +12,298 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
-# --- IMPORTS (Robust) ---
-try:
-    from src.config import Theme, BACKGROUND_COLOR
-    from src.utils import (
-        IntroManager,
-        get_safe_frame,
-        clamp_x,
-        clamp_y,
-        make_floating_particles,
-        Brand,
-    )
-except Exception:
-    BACKGROUND_COLOR = "#050505"
-
-    class Theme:
-        NEON_BLUE = "#00F0FF"
-        NEON_PINK = "#FF0055"
-        NEON_PURPLE = "#BD00FF"
-        NEON_GREEN = "#00FF66"
-        TEXT_MAIN = "#FFFFFF"
-        TEXT_SUB = "#B8B8B8"
-        AXIS_COLOR = "#00F0FF"
-        C_CONTAINER_FILL = "#050505"
-        C_CONTAINER_STROKE = "#004488"
-        C_BAR_GRADIENT = ["#0033CC", "#0088FF", "#00FFFF"]
-        C_DOT_CORE = "#FFFFFF"
-        C_DOT_GLOW = "#00FFFF"
-        C_LINE_CORE = "#FFFFFF"
-        C_LINE_GLOW = "#00FFFF"
-
-    # minimal safe-frame fallbacks
-    config.frame_height = 16.0
-    config.frame_width = 9.0
-
-    class Brand:
-        CYAN = "#00F0FF"
-        PINK = "#FF0055"
-        GREEN = "#00FF66"
-        WHITE = "#FFFFFF"
-        TEXT_MAIN = "#FFFFFF"
-        TEXT_SUB = "#B8B8B8"
-
-    def get_safe_frame(margin=0.60):
-        half_w = config.frame_width / 2
-        half_h = config.frame_height / 2
-        return {
-            "left": -half_w + margin,
-            "right": half_w - margin,
-            "top": half_h - margin,
-            "bottom": -half_h + margin,
-            "w": config.frame_width - (2 * margin),
-            "h": config.frame_height - (2 * margin),
-            "cx": 0.0,
-            "cy": 0.0,
-        }
-
-    def clamp_x(x, mob_width=0.0, margin=0.60):
-        sf = get_safe_frame(margin)
-        half = float(mob_width) / 2
-        return float(np.clip(x, sf["left"] + half, sf["right"] - half))
-
-    def clamp_y(y, mob_height=0.0, margin=0.60):
-        sf = get_safe_frame(margin)
-        half = float(mob_height) / 2
-        return float(np.clip(y, sf["bottom"] + half, sf["top"] - half))
-
-    def make_floating_particles(*args, **kwargs):
-        return VGroup()
+# --- IMPORTS ---
+from src.config import Theme, BACKGROUND_COLOR, DATA_DIR
+from src.utils import (
+    IntroManager,
+    get_safe_frame,
+    clamp_x,
+    clamp_y,
+    make_floating_particles,
+    Brand,
+)
+from src.data.ingest import load_dataset
+from src.data.schemas import BAR_SCHEMA
+from src.primitives import NumberCounter, ProgressivePolyline, StretchPill, format_number, rect_path_points
+
+
+def data_candidates() -> list:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [
+        os.path.join(DATA_DIR, "bar_data.csv"),
+        os.path.join(project_root, "Data", "bar_data.csv"),
+        os.path.join(current_dir, "bar_data.csv"),
+    ]
+
+
+def _load_bar_rows():
+    """Name,Value rows from Data/bar_data.csv ('#' meta lines ignored); demo set if missing."""
+    csv_path = next((p for p in data_candidates() if os.path.exists(p)), None)
+    if csv_path:
+        try:
+            ds = load_dataset(csv_path, BAR_SCHEMA)
+            names = ds["Name"].tolist()
+            if names:
+                return names, ds["Value"].astype(float).tolist()
+        except Exception as e:
+            print(f"bar_data.csv error: {e}")
+    return ["Nvidia", "Microsoft", "Apple", "Google", "Amazon"], [95, 88, 82, 76, 70]
+
+
+# ============================================================
+# ✅ WAVE ENGINE (large N): one shared tracker, NumPy geometry
+# ============================================================
+CLASSIC_MAX_ITEMS = 6  # above this, bars grow together (fixed-length video)
+WAVE_RUN_TIME = 4.2
+WAVE_STAGGER = 0.45  # fraction of the run spent staggering bar starts (0 = all together)
+
+
+def wave_progress(t: float, n: int, stagger: float = WAVE_STAGGER) -> np.ndarray:
+    """Eased 0..1 progress for n bars from ONE tracker value t (bar i starts at stagger * i / (n - 1))."""
+    starts = np.linspace(0.0, stagger, n) if n > 1 else np.zeros(1)
+    span = max(1e-6, 1.0 - stagger)
+    p = np.clip((float(t) - starts) / span, 0.0, 1.0)
+    return 1.0 - (1.0 - p) ** 3  # ease_out_cubic, vectorised
+
+
+class BarWaveEngine:
+    """
+    Grows every bar of a ranking from one ValueTracker.
+    Per frame: progress / widths / tip x / counter values are NumPy arrays, and all bars
+    (and all tips) are a single VMobject whose point buffer is rewritten in place.
+    Counters only re-render when their displayed integer changes.
+    """
+
+    def __init__(
+        self,
+        values,
+        max_val: float,
+        x_start: float,
+        bar_max_w: float,
+        ys,
+        bar_h: float,
+        counter_x: float,
+        counter_font_size: int = 20,
+        stagger: float = WAVE_STAGGER,
+    ):
+        self.values = np.asarray(values, dtype=float)
+        self.n = len(self.values)
+        self.targets = np.clip(self.values / max(1e-9, float(max_val)), 0.0, 1.0) * bar_max_w
+        self.ys = np.asarray(ys, dtype=float)
+        self.x_start = float(x_start)
+        self.bar_h = float(bar_h)
+        self.counter_x = float(counter_x)
+        self.stagger = float(stagger)
+
+        self.tracker = ValueTracker(0.0)
+
+        self.bars = VMobject()
+        self.bars.set_fill(
+            color=Theme.C_BAR_GRADIENT if hasattr(Theme, "C_BAR_GRADIENT") else [Theme.NEON_BLUE, Theme.NEON_PINK],
+            opacity=1.0,
+        )
+        self.bars.set_stroke(width=0)
+        self.bars.set_sheen_direction(RIGHT)
+        self.bars.set_z_index(40)
+
+        self.tips = VMobject()
+        self.tips.set_fill(color=WHITE, opacity=0.90).set_stroke(width=0)
+        self.tips.set_z_index(45)
+
+        self.counters = VGroup(
+            *[
+                NumberCounter(0, num_decimal_places=0, font_size=counter_font_size, color=Theme.NEON_BLUE)
+                for _ in range(self.n)
+            ]
+        ).set_z_index(60)
+        self._shown = np.full(self.n, -1, dtype=np.int64)
+
+        self.group = VGroup(self.bars, self.tips, self.counters)
+        self.update(self.group)
+
+    def progress(self) -> np.ndarray:
+        return wave_progress(self.tracker.get_value(), self.n, self.stagger)
+
+    def tip_x(self) -> np.ndarray:
+        return self.x_start + np.maximum(0.02, self.progress() * self.targets)
+
+    def update(self, _=None) -> None:
+        p = self.progress()
+        x1 = self.x_start + np.maximum(0.02, p * self.targets)
+        half = self.bar_h / 2.0
+        x0 = np.full(self.n, self.x_start)
+        self.bars.set_points(rect_path_points(x0, self.ys - half, x1, self.ys + half))
+
+        tip = min(0.09, half * 0.8)
+        self.tips.set_points(rect_path_points(x1 - tip * 1.6, self.ys - tip, x1, self.ys + tip))
+
+        shown = np.rint(p * self.values).astype(np.int64)
+        for i in np.flatnonzero(shown != self._shown):
+            num = self.counters[i]
+            num.set_value(int(shown[i]))
+            num.move_to([self.counter_x - num.width / 2, self.ys[i], 0])
+        self._shown = shown
+
+    def start(self) -> None:
+        self.group.add_updater(self.update)
+
+    def stop(self) -> None:
+        self.group.remove_updater(self.update)
+        self.tracker.set_value(1.0)
+        self.update()
+
+
+# ============================================================
+# ✅ SCROLL LIST (hundreds of rows): virtualised, recycled row pool
+# ============================================================
+SCROLL_MIN_ITEMS = 24  # above this, rows keep a readable height and the view scrolls
+SCROLL_ROW_H = 0.78
+SCROLL_ROWS_PER_SEC = 2.4
+SCROLL_MAX_RUN_TIME = 40.0
+
+
+class BarScrollList:
+    """
+    Leaderboard window that scrolls through any number of rows.
+    Only (visible rows + 2) slots exist. Data row i always lives in slot i % pool, so while
+    scrolling only the slot that just left the window is re-bound (new rank/name/value),
+    everything else is moved in place. Plates and bars of all slots are two merged
+    VMobjects, clipped to the window with NumPy. Cost depends on the window, not on N.
+    """
+
+    def __init__(
+        self,
+        names,
+        values,
+        max_val: float,
+        window_top: float,
+        window_bottom: float,
+        row_h: float,
+        rank_x: float,
+        x_start: float,
+        bar_max_w: float,
+        counter_x: float,
+        font_size: int = 22,
+    ):
+        self.names = [str(n).upper() for n in names]
+        self.values = np.asarray(values, dtype=float)
+        self.n = len(self.values)
+        self.targets = np.clip(self.values / max(1e-9, float(max_val)), 0.0, 1.0) * bar_max_w
+
+        self.top = float(window_top)
+        self.bottom = float(window_bottom)
+        self.row_h = float(row_h)
+        self.rank_x = float(rank_x)
+        self.x_start = float(x_start)
+        self.bar_max_w = float(bar_max_w)
+        self.counter_x = float(counter_x)
+        self.font_size = int(font_size)
+        self.bar_h = min(0.46, self.row_h * 0.56)
+        self.label_max_w = (self.x_start - self.rank_x) - 0.45
+
+        self.window_rows = max(1, int((self.top - self.bottom) / self.row_h))
+        self.pool_size = min(self.n, self.window_rows + 2)
+        self.max_offset = float(max(0, self.n - self.window_rows))
+
+        self.offset = ValueTracker(0.0)  # rows scrolled past the top
+        self.grow = ValueTracker(0.0)  # intro growth of whatever is on screen
+
+        self.plates = VMobject().set_fill("#060606", opacity=0.85).set_stroke(width=0).set_z_index(30)
+        self.bars = VMobject()
+        self.bars.set_fill(
+            color=Theme.C_BAR_GRADIENT if hasattr(Theme, "C_BAR_GRADIENT") else [Theme.NEON_BLUE, Theme.NEON_PINK],
+            opacity=1.0,
+        )
+        self.bars.set_stroke(width=0).set_sheen_direction(RIGHT).set_z_index(40)
+
+        self.slots = []
+        for _ in range(self.pool_size):
+            rank = Text("0", font="Montserrat", weight=BOLD, font_size=self.font_size, color=WHITE)
+            name = Text(" ", font="Montserrat", weight=BOLD, font_size=self.font_size, color=WHITE)
+            val = NumberCounter(0, num_decimal_places=0, font_size=self.font_size, color=Theme.NEON_BLUE)
+            grp = VGroup(rank, name, val).set_z_index(60)
+            self.slots.append({"idx": -1, "group": grp, "rank": rank, "name": name, "val": val, "shown": None, "alpha": None})
+
+        self.group = VGroup(self.plates, self.bars, *[sl["group"] for sl in self.slots])
+        self.update(self.group)
+
+    def _bind(self, slot: dict, idx: int) -> None:
+        rank = Text(str(idx + 1), font="Montserrat", weight=BOLD, font_size=self.font_size, color=WHITE)
+        name = Text(self.names[idx], font="Montserrat", weight=BOLD, font_size=self.font_size, color=WHITE)
+        if name.width > self.label_max_w:
+            name.scale_to_fit_width(self.label_max_w)
+        slot["rank"].become(rank)
+        slot["name"].become(name)
+        slot["idx"] = idx
+        slot["shown"] = None
+        slot["alpha"] = None
+
+    def row_y(self, idx) -> np.ndarray:
+        return self.top - (np.asarray(idx, dtype=float) - self.offset.get_value() + 0.5) * self.row_h
+
+    def visible_indices(self) -> np.ndarray:
+        first = int(np.floor(self.offset.get_value()))
+        idx = np.arange(first, first + self.pool_size)
+        return idx[(idx >= 0) & (idx < self.n)]
+
+    def update(self, _=None) -> None:
+        idx = self.visible_indices()
+        ys = self.row_y(idx)
+
+        # enter/exit: rows grow in over the first row-height inside the window, text fades
+        inside = np.minimum(self.top - ys, ys - self.bottom) / self.row_h + 0.5
+        enter = np.clip(inside, 0.0, 1.0)
+        p = (1.0 - (1.0 - enter) ** 3) * float(self.grow.get_value())
+        widths = np.maximum(0.02, self.targets[idx] * p)
+
+        def _clip(y0, y1):
+            return np.clip(y0, self.bottom, self.top), np.clip(y1, self.bottom, self.top)
+
+        py0, py1 = _clip(ys - (self.bar_h + 0.10) / 2, ys + (self.bar_h + 0.10) / 2)
+        x0 = np.full(len(idx), self.x_start - 0.10)
+        self.plates.set_points(rect_path_points(x0, py0, x0 + self.bar_max_w + 0.20, py1))
+
+        by0, by1 = _clip(ys - self.bar_h / 2, ys + self.bar_h / 2)
+        bx0 = np.full(len(idx), self.x_start)
+        self.bars.set_points(rect_path_points(bx0, by0, bx0 + widths, by1))
+
+        live = set()
+        for k, i in enumerate(idx):
+            i = int(i)
+            slot = self.slots[i % self.pool_size]
+            live.add(i % self.pool_size)
+            if slot["idx"] != i:
+                self._bind(slot, i)
+
+            y = float(ys[k])
+            slot["rank"].move_to([self.rank_x, y, 0])
+            slot["name"].move_to([self.x_start - 0.12 - slot["name"].width / 2, y, 0])
+
+            shown = int(round(p[k] * self.values[i]))
+            if shown != slot["shown"]:
+                slot["val"].set_value(shown)
+                slot["shown"] = shown
+            slot["val"].move_to([self.counter_x - slot["val"].width / 2, y, 0])
+
+            alpha = round(float(enter[k]) * 8) / 8  # quantised: only edge rows ever restyle
+            if alpha != slot["alpha"]:
+                slot["group"].set_opacity(alpha)
+                slot["alpha"] = alpha
+
+        for j, slot in enumerate(self.slots):
+            if j not in live and slot["alpha"] != 0.0:
+                slot["group"].set_opacity(0.0)
+                slot["alpha"] = 0.0
+
+    def slot_for(self, idx: int) -> dict:
+        return self.slots[idx % self.pool_size]
+
+    def start(self) -> None:
+        self.group.add_updater(self.update)
+
+    def stop(self) -> None:
+        self.group.remove_updater(self.update)
+        self.update()
 
 
 class BarChartTemplate(Scene):
@@ -178,11 +401,10 @@ class BarChartTemplate(Scene):
         )
 
         # ============================================================
-        # 5) DATA (CSV ready later; for now same demo set)
+        # 5) DATA (bar_data.csv if present, else same demo set)
         # ============================================================
-        names = ["Nvidia", "Microsoft", "Apple", "Google", "Amazon"]
-        values = [95, 88, 82, 76, 70]
-        max_val = 100
+        names, values = _load_bar_rows()
+        max_val = max(100, max(values))  # demo scale stays 0..100
 
         # sort safety (so it works even if user provides random order)
         rows = sorted(list(zip(names, values)), key=lambda x: x[1], reverse=True)
@@ -201,6 +423,12 @@ class BarChartTemplate(Scene):
         GAP_Y = min(1.75, available_h / (num_items + 0.2))
         START_Y = top_y
 
+        # Very long rankings keep a readable row height and scroll instead of shrinking
+        scroll_mode = num_items > SCROLL_MIN_ITEMS
+        if scroll_mode:
+            GAP_Y = SCROLL_ROW_H
+        rows_on_screen = min(num_items, int(available_h / GAP_Y) + 1) if scroll_mode else num_items
+
         # Horizontal layout
         RAIL_X = sf["left"] + 0.55
         RANK_X = RAIL_X + 0.60
@@ -222,7 +450,7 @@ class BarChartTemplate(Scene):
 
         # ---- Left RANK RAIL ----
         rail_top = START_Y + 0.55
-        rail_bottom = START_Y - (num_items - 1) * GAP_Y - 0.55
+        rail_bottom = START_Y - (rows_on_screen - 1) * GAP_Y - 0.55
 
         rail = Line([RAIL_X, rail_top, 0], [RAIL_X, rail_bottom, 0])
         rail.set_stroke(color=Theme.NEON_BLUE, width=3, opacity=0.35)
@@ -264,7 +492,7 @@ class BarChartTemplate(Scene):
             )
             v_line.set_stroke(Theme.NEON_BLUE, width=2, opacity=0.12)
 
-            label = Text(str(m), font="Arial", font_size=14, color=Theme.TEXT_SUB)
+            label = Text(str(int(round(m / 100 * max_val))), font="Arial", font_size=14, color=Theme.TEXT_SUB)
             label.move_to([x_pos, rail_bottom - 0.55, 0])
             guide_group.add(v_line, label)
 
@@ -276,208 +504,316 @@ class BarChartTemplate(Scene):
         winner_index = int(np.argmax(values))
         bar_groups = []
 
-        for i, (name, value) in enumerate(zip(names, values)):
-            y_pos = START_Y - (i * GAP_Y)
-            target_width = (value / max_val) * BAR_MAX_WIDTH
-
-            # Branch from rail to rank circle
-            branch = Line([RAIL_X, y_pos, 0], [RANK_X - 0.18, y_pos, 0])
-            branch.set_stroke(color=Theme.NEON_BLUE, width=2, opacity=0.25)
-            bolt = Dot(color=WHITE, radius=0.035).move_to(branch.get_start())
-            bolt.set_opacity(0.6)
+        if scroll_mode:
+            # --- SCROLL PATH: recycled row pool, countdown from the bottom of the list up to #1 ---
+            row_fs = int(np.clip(GAP_Y * 30, 12, 22))
+            board = BarScrollList(
+                names,
+                values,
+                max_val,
+                window_top=START_Y + GAP_Y / 2,
+                window_bottom=rail_bottom + 0.55 - GAP_Y / 2,
+                row_h=GAP_Y,
+                rank_x=RANK_X,
+                x_start=BAR_START_X,
+                bar_max_w=BAR_MAX_WIDTH,
+                counter_x=VALUE_ANCHOR_X,
+                font_size=row_fs,
+            )
+            board.offset.set_value(board.max_offset)
+            board.update()
+            self.add(board.group)
+            board.start()
 
-            # Rank badge
-            rank_bg = Circle(radius=0.25, color="#0B0B0B", fill_opacity=1).set_stroke(
-                Theme.NEON_BLUE, width=2, opacity=0.7
+            self.play(board.grow.animate.set_value(1.0), run_time=1.0, rate_func=rf.ease_out_cubic)
+            self.play(
+                board.offset.animate.set_value(0.0),
+                run_time=float(np.clip(board.max_offset / SCROLL_ROWS_PER_SEC, 4.0, SCROLL_MAX_RUN_TIME)),
+                rate_func=rf.ease_in_out_sine,
             )
-            rank_bg.move_to([RANK_X, y_pos, 0])
-            rank_num = Text(f"{i + 1}", font="Montserrat", weight=BOLD, font_size=20, color=WHITE).move_to(rank_bg)
-
-            # Label plate
-            name_text = Text(str(name).upper(), font="Montserrat", weight=BOLD, font_size=24, color=WHITE)
-            text_plate = RoundedRectangle(corner_radius=0.12, width=name_text.width + 0.55, height=0.52)
-            text_plate.set_fill(color="#000000", opacity=0.70).set_stroke(width=0)
-            text_plate.move_to([LABEL_X, y_pos + 0.45, 0])
-            name_text.move_to(text_plate)
-
-            # Keep label inside safe
-            text_plate.move_to(
-                [
-                    clamp_x(text_plate.get_x(), text_plate.width, 0.70),
-                    clamp_y(text_plate.get_y(), text_plate.height, 0.70),
-                    0,
-                ]
+            board.stop()
+
+            win_slot = board.slot_for(winner_index)
+            win_w = max(0.10, float(board.targets[winner_index]))
+            win_y = float(board.row_y(winner_index))
+            winner_bar = RoundedRectangle(corner_radius=min(0.10, board.bar_h / 2), width=win_w, height=board.bar_h)
+            winner_bar.set_stroke(width=0)
+            winner_bar.set_fill(
+                color=Theme.C_BAR_GRADIENT if hasattr(Theme, "C_BAR_GRADIENT") else [Theme.NEON_BLUE, Theme.NEON_PINK],
+                opacity=1,
             )
-            name_text.move_to(text_plate)
-
-            label_group = VGroup(text_plate, name_text)
-
+            winner_bar.move_to([BAR_START_X + win_w / 2, win_y, 0]).set_z_index(50)
             self.play(
-                FadeIn(branch, run_time=0.25),
-                FadeIn(bolt, run_time=0.25),
-                FadeIn(rank_bg, shift=RIGHT * 0.15, run_time=0.35),
-                FadeIn(rank_num, shift=RIGHT * 0.15, run_time=0.35),
-                FadeIn(label_group, shift=RIGHT * 0.15, run_time=0.4),
+                FadeIn(winner_bar),
+                Flash(winner_bar.get_right(), color=WHITE, line_length=0.6, flash_radius=0.35),
+                run_time=0.35,
             )
 
-            # Bar container (ends BEFORE value gutter)
-            container = RoundedRectangle(corner_radius=0.12, width=BAR_MAX_WIDTH + 0.20, height=BAR_HEIGHT)
-            container.set_stroke(Theme.NEON_BLUE, width=2, opacity=0.35)
-            container.set_fill("#060606", opacity=0.85)
-            container.move_to([BAR_START_X + BAR_MAX_WIDTH / 2, y_pos, 0])
-            self.add(container)
-
-            # DOTS + LINE run
-            num_dots = 12
-            dot_positions = []
-            dots_group = VGroup()
-
-            for k in range(num_dots):
-                t = k / (num_dots - 1)
-                x = BAR_START_X + t * target_width
-                y_offset = 0.14 if k % 2 else -0.14
-                if k == 0 or k == num_dots - 1:
-                    y_offset = 0
-                pos = np.array([x, y_pos + y_offset, 0])
-                dot_positions.append(pos)
-
-                d = Dot(radius=0.055, color="#3A3A3A")
-                d.active_color = WHITE
-                d.move_to(pos)
-                ring = Circle(radius=0.10, color=Theme.NEON_BLUE, stroke_width=1.4).set_opacity(0.25)
-                ring.move_to(pos)
-                dots_group.add(d, ring)
-
-            self.add(dots_group)
-
-            zig_line = VMobject().set_stroke(color=WHITE, width=3, opacity=0.9)
-            zig_glow = VMobject().set_stroke(color=Theme.NEON_BLUE, width=10, opacity=0.22)
-            spark = Dot(radius=0.11, color=WHITE)
-            spark.set_opacity(0.9)
-
-            line_group = VGroup(zig_glow, zig_line, spark)
-            self.add(line_group)
-
-            # Final bar (morph target)
-            final_bar = RoundedRectangle(corner_radius=0.10, width=max(0.10, target_width), height=BAR_HEIGHT - 0.16)
-            final_bar.set_stroke(width=0)
-            final_bar.set_fill(
+            winner_val = win_slot["val"]
+            winner_label = win_slot["name"]
+            winner = VGroup(win_slot["group"], winner_bar)
+            others = [sl["group"] for sl in board.slots if sl is not win_slot and sl["alpha"]]
+            others += [board.bars]
+        elif num_items > CLASSIC_MAX_ITEMS:
+            # --- WAVE PATH: every bar grows from ONE tracker (fixed length for any N) ---
+            row_fs = int(np.clip(GAP_Y * 34, 10, 24))
+            bar_h = float(min(BAR_HEIGHT - 0.16, GAP_Y * 0.56))
+            ys = START_Y - np.arange(num_items) * GAP_Y
+            max_label_w = (BAR_START_X - RANK_X) - 0.45
+
+            rows = []
+            for i, name in enumerate(names):
+                y_pos = float(ys[i])
+                rank_num = Text(f"{i + 1}", font="Montserrat", weight=BOLD, font_size=row_fs, color=WHITE)
+                rank_num.move_to([RANK_X, y_pos, 0])
+
+                name_text = Text(str(name).upper(), font="Montserrat", weight=BOLD, font_size=row_fs, color=WHITE)
+                if name_text.width > max_label_w:
+                    name_text.scale_to_fit_width(max_label_w)
+                name_text.move_to([BAR_START_X - 0.12 - name_text.width / 2, y_pos, 0])
+
+                container = Rectangle(width=BAR_MAX_WIDTH + 0.20, height=bar_h + 0.10)
+                container.set_stroke(Theme.NEON_BLUE, width=1.2, opacity=0.25)
+                container.set_fill("#060606", opacity=0.85)
+                container.move_to([BAR_START_X + BAR_MAX_WIDTH / 2, y_pos, 0])
+
+                rows.append(VGroup(container, rank_num, name_text))
+
+            self.play(LaggedStart(*[FadeIn(r, shift=RIGHT * 0.10) for r in rows], lag_ratio=0.04), run_time=0.8)
+
+            engine = BarWaveEngine(
+                values,
+                max_val,
+                x_start=BAR_START_X,
+                bar_max_w=BAR_MAX_WIDTH,
+                ys=ys,
+                bar_h=bar_h,
+                counter_x=VALUE_ANCHOR_X,
+                counter_font_size=row_fs,
+            )
+            self.add(engine.group)
+            engine.start()
+            self.play(engine.tracker.animate.set_value(1.0), run_time=WAVE_RUN_TIME, rate_func=linear)
+            engine.stop()
+
+            # classic-style bar over the winner row (the outro scales/flashes it)
+            win_w = max(0.10, float(engine.targets[winner_index]))
+            winner_bar = RoundedRectangle(corner_radius=min(0.10, bar_h / 2), width=win_w, height=bar_h)
+            winner_bar.set_stroke(width=0)
+            winner_bar.set_fill(
                 color=Theme.C_BAR_GRADIENT if hasattr(Theme, "C_BAR_GRADIENT") else [Theme.NEON_BLUE, Theme.NEON_PINK],
                 opacity=1,
             )
-            final_bar.align_to(container, LEFT).shift(RIGHT * 0.10).set_y(y_pos).set_opacity(0)
-
-            sheen = RoundedRectangle(corner_radius=0.10, width=max(0.10, target_width), height=(BAR_HEIGHT - 0.16) / 2)
-            sheen.set_stroke(width=0).set_fill(color=WHITE, opacity=0.18)
-            sheen.align_to(final_bar, UP).align_to(final_bar, LEFT).set_opacity(0)
-
-            # Value number (FIXED COLUMN -> NEVER overlaps bars)
-            val_num = DecimalNumber(0, num_decimal_places=0, font_size=24, color=Theme.NEON_BLUE)
-            val_num.set_z_index(60)
-            self.add(val_num)
-
-            # optional: small pill behind value for readability
-            val_pill = RoundedRectangle(corner_radius=0.12, width=1.15, height=0.46)
-            val_pill.set_fill(color=BLACK, opacity=0.55).set_stroke(width=0)
-            val_pill.set_z_index(55)
-            self.add(val_pill)
-
-            tracker = ValueTracker(0)
-            flashed_indices = set()
-
-            def update_single_bar(_):
-                t = tracker.get_value()
-                val_num.set_value(t * value)
-
-                # keep value in a dedicated gutter column
-                # adjust x for changing digit width
-                x = VALUE_ANCHOR_X - (val_num.width / 2)
-                x = clamp_x(x, val_num.width, 0.70)
-                val_num.move_to([x, y_pos, 0])
-
-                # pill follows (auto width)
-                pill_w = max(1.10, val_num.width + 0.35)
-                val_pill.become(
-                    RoundedRectangle(corner_radius=0.12, width=pill_w, height=0.46)
-                    .set_fill(color=BLACK, opacity=0.55)
-                    .set_stroke(width=0)
-                )
-                val_pill.set_z_index(55)
-                val_pill.move_to(val_num)
-
-                total_segments = num_dots - 1
-                exact_pos = t * total_segments
-                current_idx = int(exact_pos)
-                remainder = exact_pos - current_idx
-                if current_idx >= total_segments:
-                    current_idx = total_segments - 1
-                    remainder = 1.0
-
-                p1 = dot_positions[current_idx]
-                p2 = dot_positions[current_idx + 1]
-                current_tip = p1 + (p2 - p1) * remainder
-                spark.move_to(current_tip)
-
-                points = [dot_positions[0]]
-                for kk in range(1, current_idx + 1):
-                    points.append(dot_positions[kk])
-                    points.append(dot_positions[kk])
-                points.append(current_tip)
+            winner_bar.move_to([BAR_START_X + win_w / 2, float(ys[winner_index]), 0]).set_z_index(50)
+            self.play(
+                FadeIn(winner_bar),
+                Flash(winner_bar.get_right(), color=WHITE, line_length=0.6, flash_radius=0.35),
+                run_time=0.35,
+            )
 
-                zig_line.set_points_as_corners(points)
-                zig_glow.set_points_as_corners(points)
+            winner_val = engine.counters[winner_index]
+            winner_label = rows[winner_index][2]
+            winner = VGroup(rows[winner_index], winner_bar, winner_val)
+            others = [r for j, r in enumerate(rows) if j != winner_index]
+            others += [engine.bars, engine.tips]
+            others += [c for j, c in enumerate(engine.counters) if j != winner_index]
+        else:
+
+            for i, (name, value) in enumerate(zip(names, values)):
+                y_pos = START_Y - (i * GAP_Y)
+                target_width = (value / max_val) * BAR_MAX_WIDTH
+
+                # Branch from rail to rank circle
+                branch = Line([RAIL_X, y_pos, 0], [RANK_X - 0.18, y_pos, 0])
+                branch.set_stroke(color=Theme.NEON_BLUE, width=2, opacity=0.25)
+                bolt = Dot(color=WHITE, radius=0.035).move_to(branch.get_start())
+                bolt.set_opacity(0.6)
+
+                # Rank badge
+                rank_bg = Circle(radius=0.25, color="#0B0B0B", fill_opacity=1).set_stroke(
+                    Theme.NEON_BLUE, width=2, opacity=0.7
+                )
+                rank_bg.move_to([RANK_X, y_pos, 0])
+                rank_num = Text(f"{i + 1}", font="Montserrat", weight=BOLD, font_size=20, color=WHITE).move_to(rank_bg)
+
+                # Label plate
+                name_text = Text(str(name).upper(), font="Montserrat", weight=BOLD, font_size=24, color=WHITE)
+                text_plate = RoundedRectangle(corner_radius=0.12, width=name_text.width + 0.55, height=0.52)
+                text_plate.set_fill(color="#000000", opacity=0.70).set_stroke(width=0)
+                text_plate.move_to([LABEL_X, y_pos + 0.45, 0])
+                name_text.move_to(text_plate)
+
+                # Keep label inside safe
+                text_plate.move_to(
+                    [
+                        clamp_x(text_plate.get_x(), text_plate.width, 0.70),
+                        clamp_y(text_plate.get_y(), text_plate.height, 0.70),
+                        0,
+                    ]
+                )
+                name_text.move_to(text_plate)
 
-                if current_idx not in flashed_indices and remainder > 0.12:
-                    flashed_indices.add(current_idx)
-                    real_idx = current_idx * 2
-                    dot_obj = dots_group[real_idx]
-                    ring_obj = dots_group[real_idx + 1]
-                    dot_obj.set_color(dot_obj.active_color)
-                    ring_obj.set_stroke(opacity=0.9).set_stroke(width=2)
+                label_group = VGroup(text_plate, name_text)
 
-            line_group.add_updater(update_single_bar)
+                self.play(
+                    FadeIn(branch, run_time=0.25),
+                    FadeIn(bolt, run_time=0.25),
+                    FadeIn(rank_bg, shift=RIGHT * 0.15, run_time=0.35),
+                    FadeIn(rank_num, shift=RIGHT * 0.15, run_time=0.35),
+                    FadeIn(label_group, shift=RIGHT * 0.15, run_time=0.4),
+                )
 
-            self.play(tracker.animate.set_value(1.0), run_time=1.4, rate_func=linear)
+                # Bar container (ends BEFORE value gutter)
+                container = RoundedRectangle(corner_radius=0.12, width=BAR_MAX_WIDTH + 0.20, height=BAR_HEIGHT)
+                container.set_stroke(Theme.NEON_BLUE, width=2, opacity=0.35)
+                container.set_fill("#060606", opacity=0.85)
+                container.move_to([BAR_START_X + BAR_MAX_WIDTH / 2, y_pos, 0])
+                self.add(container)
+
+                # DOTS + LINE run
+                num_dots = 12
+                dot_positions = []
+                dots_group = VGroup()
+
+                for k in range(num_dots):
+                    t = k / (num_dots - 1)
+                    x = BAR_START_X + t * target_width
+                    y_offset = 0.14 if k % 2 else -0.14
+                    if k == 0 or k == num_dots - 1:
+                        y_offset = 0
+                    pos = np.array([x, y_pos + y_offset, 0])
+                    dot_positions.append(pos)
+
+                    d = Dot(radius=0.055, color="#3A3A3A")
+                    d.active_color = WHITE
+                    d.move_to(pos)
+                    ring = Circle(radius=0.10, color=Theme.NEON_BLUE, stroke_width=1.4).set_opacity(0.25)
+                    ring.move_to(pos)
+                    dots_group.add(d, ring)
+
+                self.add(dots_group)
+
+                zig_line = ProgressivePolyline(dot_positions[0], capacity=num_dots)
+                zig_line.set_stroke(color=WHITE, width=3, opacity=0.9)
+                zig_glow = ProgressivePolyline(dot_positions[0], capacity=num_dots)
+                zig_glow.set_stroke(color=Theme.NEON_BLUE, width=10, opacity=0.22)
+                spark = Dot(radius=0.11, color=WHITE)
+                spark.set_opacity(0.9)
+
+                line_group = VGroup(zig_glow, zig_line, spark)
+                self.add(line_group)
+
+                # Final bar (morph target)
+                final_bar = RoundedRectangle(corner_radius=0.10, width=max(0.10, target_width), height=BAR_HEIGHT - 0.16)
+                final_bar.set_stroke(width=0)
+                final_bar.set_fill(
+                    color=Theme.C_BAR_GRADIENT if hasattr(Theme, "C_BAR_GRADIENT") else [Theme.NEON_BLUE, Theme.NEON_PINK],
+                    opacity=1,
+                )
+                final_bar.align_to(container, LEFT).shift(RIGHT * 0.10).set_y(y_pos).set_opacity(0)
 
-            line_group.remove_updater(update_single_bar)
+                sheen = RoundedRectangle(corner_radius=0.10, width=max(0.10, target_width), height=(BAR_HEIGHT - 0.16) / 2)
+                sheen.set_stroke(width=0).set_fill(color=WHITE, opacity=0.18)
+                sheen.align_to(final_bar, UP).align_to(final_bar, LEFT).set_opacity(0)
 
-            # Morph to bar
-            temp_straight = Line(dot_positions[0], dot_positions[-1], color=WHITE, stroke_width=4)
-            self.add(temp_straight)
-            self.remove(line_group, dots_group)
+                # Value number (FIXED COLUMN -> NEVER overlaps bars)
+                val_num = NumberCounter(0, num_decimal_places=0, font_size=24, color=Theme.NEON_BLUE)
+                val_num.set_z_index(60)
+                self.add(val_num)
 
-            final_bar.set_opacity(1)
-            sheen.set_opacity(1)
+                # optional: small pill behind value for readability
+                val_pill = StretchPill(width=1.15, height=0.46, corner_radius=0.12)
+                val_pill.set_fill(color=BLACK, opacity=0.55).set_stroke(width=0)
+                val_pill.set_z_index(55)
+                self.add(val_pill)
+
+                tracker = ValueTracker(0)
+                flashed_indices = set()
+
+                def update_single_bar(_):
+                    t = tracker.get_value()
+                    val_num.set_value(t * value)
+
+                    # keep value in a dedicated gutter column
+                    # adjust x for changing digit width
+                    x = VALUE_ANCHOR_X - (val_num.width / 2)
+                    x = clamp_x(x, val_num.width, 0.70)
+                    val_num.move_to([x, y_pos, 0])
+
+                    # pill follows (auto width, side points only move when the digit count changes)
+                    val_pill.set_pill(width=max(1.10, val_num.width + 0.35), center=val_num.get_center())
+
+                    total_segments = num_dots - 1
+                    exact_pos = t * total_segments
+                    current_idx = int(exact_pos)
+                    remainder = exact_pos - current_idx
+                    if current_idx >= total_segments:
+                        current_idx = total_segments - 1
+                        remainder = 1.0
+
+                    p1 = dot_positions[current_idx]
+                    p2 = dot_positions[current_idx + 1]
+                    current_tip = p1 + (p2 - p1) * remainder
+                    spark.move_to(current_tip)
+
+                    # commit newly passed dots (each at most once), then move only the free end
+                    while zig_line.corner_count < current_idx:
+                        passed = dot_positions[zig_line.corner_count + 1]
+                        zig_line.add_corner(passed)
+                        zig_glow.add_corner(passed)
+                    zig_line.set_tip(current_tip)
+                    zig_glow.set_tip(current_tip)
+
+                    if current_idx not in flashed_indices and remainder > 0.12:
+                        flashed_indices.add(current_idx)
+                        real_idx = current_idx * 2
+                        dot_obj = dots_group[real_idx]
+                        ring_obj = dots_group[real_idx + 1]
+                        dot_obj.set_color(dot_obj.active_color)
+                        ring_obj.set_stroke(opacity=0.9).set_stroke(width=2)
+
+                line_group.add_updater(update_single_bar)
+
+                self.play(tracker.animate.set_value(1.0), run_time=1.4, rate_func=linear)
+
+                line_group.remove_updater(update_single_bar)
+
+                # Morph to bar
+                temp_straight = Line(dot_positions[0], dot_positions[-1], color=WHITE, stroke_width=4)
+                self.add(temp_straight)
+                self.remove(line_group, dots_group)
+
+                final_bar.set_opacity(1)
+                sheen.set_opacity(1)
+
+                shockwave = Circle(radius=0.08, color=WHITE, stroke_width=4).move_to(final_bar.get_right())
+                self.play(
+                    ReplacementTransform(temp_straight, final_bar),
+                    FadeIn(sheen, run_time=0.15),
+                    Flash(final_bar.get_right(), color=WHITE, line_length=0.9, flash_radius=0.45),
+                    shockwave.animate.scale(6).set_opacity(0),
+                    run_time=0.42,
+                    rate_func=rf.ease_out_back,
+                )
+                self.remove(shockwave)
 
-            shockwave = Circle(radius=0.08, color=WHITE, stroke_width=4).move_to(final_bar.get_right())
-            self.play(
-                ReplacementTransform(temp_straight, final_bar),
-                FadeIn(sheen, run_time=0.15),
-                Flash(final_bar.get_right(), color=WHITE, line_length=0.9, flash_radius=0.45),
-                shockwave.animate.scale(6).set_opacity(0),
-                run_time=0.42,
-                rate_func=rf.ease_out_back,
-            )
-            self.remove(shockwave)
+                bar_groups.append(
+                    VGroup(branch, bolt, rank_bg, rank_num, label_group, container, final_bar, sheen, val_pill, val_num)
+                )
 
-            bar_groups.append(
-                VGroup(branch, bolt, rank_bg, rank_num, label_group, container, final_bar, sheen, val_pill, val_num)
-            )
+            winner = bar_groups[winner_index]
+            others = [g for j, g in enumerate(bar_groups) if j != winner_index]
+            winner_bar = winner[6]
+            winner_val = winner[9]
+            winner_label = winner[4]
 
         # ============================================================
         # 8) WINNER REVEAL (premium outro)
         # ============================================================
         self.wait(0.4)
 
-        winner = bar_groups[winner_index]
-        others = [g for j, g in enumerate(bar_groups) if j != winner_index]
-
         self.play(*[g.animate.set_opacity(0.25) for g in others], run_time=0.35)
 
-        winner_bar = winner[6]
-        winner_val = winner[9]
-        winner_label = winner[4]
-
         banner_h = 1.65
         banner = RoundedRectangle(width=sf["w"], height=banner_h, corner_radius=0.18)
         banner.set_fill(color="#000000", opacity=0.85)
@@ -490,7 +826,7 @@ class BarChartTemplate(Scene):
 
         t1 = Text("TOP LEADER", font="Montserrat", weight=BOLD, font_size=22, color=Theme.TEXT_SUB)
         t2 = Text(win_name, font="Montserrat", weight=BOLD, font_size=46, color=Theme.TEXT_MAIN)
-        t3 = Text(f"SCORE: {win_val}", font="Montserrat", weight=BOLD, font_size=22, color=Theme.NEON_BLUE)
+        t3 = Text(f"SCORE: {format_number(win_val)}", font="Montserrat", weight=BOLD, font_size=22, color=Theme.NEON_BLUE)
 
         txt = VGroup(t1, t2, t3).arrange(DOWN, buff=0.12).move_to(banner)
         txt.set_z_index(201)
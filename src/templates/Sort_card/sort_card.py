@@ -12,12 +12,9 @@
 import os
 import sys
 import math
-import random
-import re
 from typing import Dict, List, Tuple
 
 import numpy as np
-import pandas as pd
 from manim import *
 from manim import rate_functions as rf
 
@@ -31,11 +28,26 @@ sys.path.append(project_root)
 # project imports (utils.py is LOCKED)
 from src.config import DATA_DIR, ASSETS_DIR, BACKGROUND_COLOR, Theme
 from src.utils import IntroManager, get_safe_frame, make_floating_particles
+from src.image_cache import cached_image_mobject
+from src.text_prewarm import prewarm_texts, text_spec
+from src.data.ingest import load_dataset, parse_meta
+from src.data.schemas import SORT_SCHEMA
+from src.lazy import lazy_import
+from src.rng import stream
+from src.segments import SegmentCache
+
+pd = lazy_import("pandas")
 
 # -------------------------
 # DATA
 # -------------------------
-_META_RE = re.compile(r"([A-Za-z_]+)\s*=\s*([^,]+)")
+SCAN_PHRASES = [
+    "scanning evidence…",
+    "validating intent…",
+    "cross-checking logs…",
+    "finalizing verdict…",
+    "matching pattern…",
+]
 
 
 def _safe_text(s: str, font="Montserrat", font_size=24, color=WHITE, weight=None) -> Text:
@@ -52,7 +64,7 @@ def ellipsize(s: str, n: int = 18) -> str:
     return s if len(s) <= n else s[: max(1, n - 1)] + "…"
 
 
-def load_csv_with_meta(csv_path: str) -> Tuple[Dict[str, str], pd.DataFrame]:
+def load_csv_with_meta(csv_path: str) -> Tuple[Dict[str, str], "pd.DataFrame"]:
     meta = {"TITLE": "TIER 1 vs TIER 2", "SUB": "AI TRIBUNAL SORT TEST", "FEED": "FEED_SORT // TRIBUNAL"}
     if not os.path.exists(csv_path):
         df = pd.DataFrame(
@@ -64,38 +76,27 @@ def load_csv_with_meta(csv_path: str) -> Tuple[Dict[str, str], pd.DataFrame]:
         )
         return meta, df
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        first = f.readline().strip()
-
-    if first.startswith("#"):
-        first = first[1:].strip()
-        for m in _META_RE.finditer(first):
-            k = m.group(1).strip().upper()
-            v = m.group(2).strip()
-            meta[k] = v
-
-    df = pd.read_csv(csv_path, comment="#")
-    df.columns = [c.strip() for c in df.columns]
-    if "Reason" not in df.columns:
-        df["Reason"] = ["UNKNOWN"] * len(df)
-    if "Category" not in df.columns:
-        df["Category"] = [2] * len(df)
-    if "Image" not in df.columns:
-        df["Image"] = [""] * len(df)
-
-    def _cat(x):
-        try:
-            return int(float(x))
-        except Exception:
-            return 2
-
-    df["Category"] = df["Category"].apply(_cat)
-    df["Reason"] = df["Reason"].astype(str).fillna("UNKNOWN")
-    df["Image"] = df["Image"].astype(str).fillna("")
-    df = df.head(10).reset_index(drop=True)  # max 10
+    meta.update(parse_meta(csv_path))
+    # Image / Category (int) / Reason, max 10 rows, parsed once per file (src/data cache)
+    df = load_dataset(csv_path, SORT_SCHEMA).frame()
     return meta, df
 
 
+def sort_text_specs(df: "pd.DataFrame") -> list:
+    """Every per-item label the tribunal loop will build (same kwargs as its _safe_text calls)."""
+    specs = []
+    for reason in df.get("Reason", []):
+        r = ellipsize(str(reason).strip().upper(), 26)
+        specs.append(text_spec(r, font="Consolas", font_size=15, color=WHITE, weight=BOLD))
+    for line in SCAN_PHRASES + ["ready"]:
+        specs.append(text_spec(line, font="Consolas", font_size=11, color=Theme.TEXT_SUB))
+    for verdict, accent in (("GO LEFT", Theme.NEON_BLUE), ("GO RIGHT", Theme.NEON_PINK)):
+        specs.append(text_spec(verdict, font="Montserrat", font_size=22, color=accent, weight=BOLD))
+    for k in range(1, len(df) + 1):
+        specs.append(text_spec(str(k), font="Consolas", font_size=28, color=WHITE, weight=BOLD))
+    return specs
+
+
 # -------------------------
 # FIT HELPERS
 # -------------------------
@@ -371,9 +372,10 @@ def build_border_counter(pos: np.ndarray, accent: str) -> Dict[str, Mobject]:
 # -------------------------
 # CARDS (Group, safe for ImageMobject)
 # -------------------------
-def build_sprite(img_path: str, accent: str) -> Group:
+def build_sprite(img_path: str, accent: str, max_w: float = 2.4, max_h: float = 2.0) -> Group:
     if img_path and os.path.exists(img_path):
-        im = ImageMobject(img_path)
+        # decoded + resized once to the on-screen box (shared disk cache)
+        im = cached_image_mobject(img_path, max_w, max_h)
         im.set_z_index(3)
     else:
         im = _safe_text("?", font_size=72, color=WHITE, weight=BOLD)
@@ -471,14 +473,20 @@ def pack_positions(inner_rect: Mobject, n: int, cols: int = 3) -> List[np.ndarra
 # -------------------------
 # MAIN SCENE
 # -------------------------
+def data_candidates() -> List[str]:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [os.path.join(DATA_DIR, "sort_data.csv")]
+
+
 class SortCardTribunalFinal(Scene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
         sf = get_safe_frame(margin=0.70)
 
         # Data
-        csv_path = os.path.join(DATA_DIR, "sort_data.csv")
+        csv_path = data_candidates()[0]
         meta, df = load_csv_with_meta(csv_path)
+        prewarm_texts(sort_text_specs(df))
 
         # Intro (LOCKED)
         try:
@@ -510,12 +518,11 @@ class SortCardTribunalFinal(Scene):
         t = ValueTracker(0.0)
         t.add_updater(lambda m, dt: m.increment_value(dt))
 
-        scanline = always_redraw(
-            lambda: Rectangle(width=sf["w"] + 2.0, height=0.12)
-            .set_fill(color=Theme.NEON_BLUE, opacity=0.018)
-            .set_stroke(width=0)
-            .move_to([sf["cx"], sf["bottom"] + (t.get_value() * 0.9) % (sf["h"] + 1.4), 0])
-            .set_z_index(2)
+        # persistent rect, moved in place (no per-frame rebuild)
+        scanline = Rectangle(width=sf["w"] + 2.0, height=0.12)
+        scanline.set_fill(color=Theme.NEON_BLUE, opacity=0.018).set_stroke(width=0).set_z_index(2)
+        scanline.add_updater(
+            lambda m: m.move_to([sf["cx"], sf["bottom"] + (t.get_value() * 0.9) % (sf["h"] + 1.4), 0])
         )
         bg_layer.add(scanline)
         self.add(t)  # ensure updater runs
@@ -588,16 +595,25 @@ class SortCardTribunalFinal(Scene):
         def beam_end():
             return scanner_grp.get_top() + UP * 0.14
 
-        beam = always_redraw(
-            lambda: VGroup(
-                Line(beam_start(), beam_end()).set_stroke(
-                    color=scanner["accent"], width=10, opacity=float(0.12 * beam_alpha.get_value())
-                ),
-                Line(beam_start(), beam_end()).set_stroke(
-                    color=scanner["accent"], width=2.8, opacity=float(0.55 * beam_alpha.get_value())
-                ),
-            ).set_z_index(170)
-        )
+        # persistent lines: endpoints/stroke updated in place; zero alpha -> zero width
+        # (Cairo skips zero-width strokes) and no geometry work at all
+        beam_glow = Line(UP, DOWN).set_stroke(width=0, opacity=0)
+        beam_core = Line(UP, DOWN).set_stroke(width=0, opacity=0)
+        beam = VGroup(beam_glow, beam_core).set_z_index(170)
+
+        def _update_beam(m):
+            a = float(beam_alpha.get_value())
+            if a <= 1e-3:
+                if beam_core.get_stroke_width() > 0:
+                    m.set_stroke(width=0, opacity=0)
+                return
+            s, e = beam_start(), beam_end()
+            beam_glow.put_start_and_end_on(s, e)
+            beam_core.put_start_and_end_on(s, e)
+            beam_glow.set_stroke(color=scanner["accent"], width=10, opacity=0.12 * a)
+            beam_core.set_stroke(color=scanner["accent"], width=2.8, opacity=0.55 * a)
+
+        beam.add_updater(_update_beam)
 
         # Containers
         left_bin = build_vault_bay(left_bin_center, Theme.NEON_BLUE, "Tier 1")
@@ -615,23 +631,36 @@ class SortCardTribunalFinal(Scene):
             end = np.array([target[0], target[1] + 0.10, 0])
             return [start, mid1, mid2, end]
 
-        routeL = always_redraw(
-            lambda: VGroup(
-                VMobject().set_points_as_corners(_route_points(True)).set_stroke(Theme.NEON_BLUE, 2.2, opacity=0.08),
-                VMobject().set_points_as_corners(_route_points(True)).set_stroke(
-                    Theme.NEON_BLUE, 9, opacity=0.16 * routeL_alpha.get_value()
-                ),
-            ).set_z_index(115)
-        )
-
-        routeR = always_redraw(
-            lambda: VGroup(
-                VMobject().set_points_as_corners(_route_points(False)).set_stroke(Theme.NEON_PINK, 2.2, opacity=0.08),
-                VMobject().set_points_as_corners(_route_points(False)).set_stroke(
-                    Theme.NEON_PINK, 9, opacity=0.16 * routeR_alpha.get_value()
-                ),
-            ).set_z_index(115)
-        )
+        def _make_route(is_left: bool, col: str, alpha: ValueTracker) -> VGroup:
+            # base stays visible (0.08); glow only follows while alpha > 0
+            base = VMobject().set_points_as_corners(_route_points(is_left))
+            base.set_fill(opacity=0).set_stroke(col, 2.2, opacity=0.08)
+            glow = base.copy().set_stroke(col, width=0, opacity=0)
+            grp = VGroup(base, glow).set_z_index(115)
+            last = {"key": None}
+
+            def _upd(m):
+                pts = _route_points(is_left)
+                key = tuple(np.round(np.concatenate(pts), 4))
+                moved = key != last["key"]
+                if moved:
+                    base.set_points_as_corners(pts)
+                    last["key"] = key
+
+                a = float(alpha.get_value())
+                if a <= 1e-3:
+                    if glow.get_stroke_width() > 0:
+                        glow.set_stroke(width=0, opacity=0)
+                    return
+                if moved or glow.get_stroke_width() == 0:
+                    glow.match_points(base)
+                glow.set_stroke(col, 9, opacity=0.16 * a)
+
+            grp.add_updater(_upd)
+            return grp
+
+        routeL = _make_route(True, Theme.NEON_BLUE, routeL_alpha)
+        routeR = _make_route(False, Theme.NEON_PINK, routeR_alpha)
 
         # Counters
         cL = build_border_counter(np.array([sf["left"] + 0.20, sf["cy"] + 0.45, 0]), Theme.NEON_BLUE)
@@ -757,13 +786,9 @@ class SortCardTribunalFinal(Scene):
         # -------------------------
         entry = np.array([sf["right"] + 1.6, evidence_center[1] + 0.18, 0])
 
-        scan_phrases = [
-            "scanning evidence…",
-            "validating intent…",
-            "cross-checking logs…",
-            "finalizing verdict…",
-            "matching pattern…",
-        ]
+        scan_phrases = SCAN_PHRASES
+        scan_rng = stream("sort.scan")  # seeded per render (src/rng.py)
+        segs = SegmentCache(self, __file__)
 
         # base idle label (reused)
         def make_scanner_label(line: str):
@@ -797,165 +822,178 @@ class SortCardTribunalFinal(Scene):
             except Exception:
                 cat = 2
 
-            is_left = (cat == 1)
-            accent = Theme.NEON_BLUE if is_left else Theme.NEON_PINK
-            bin_ref = left_bin if is_left else right_bin
-            counter_ref = cL if is_left else cR
-
-            img_path = os.path.join(ASSETS_DIR, "images", img_name)
-
-            sprite = build_sprite(img_path, accent=accent)
-            sprite.move_to(entry)
-            sprite.set_opacity(1.0)
-            items_layer.add(sprite)
-
-            # fit sprite into evidence
-            fit_mobject_to_box(sprite, evidence["inner"].width * 0.78, evidence["inner"].height * 0.72)
-
-            # accents
-            evidence["outer"].set_stroke(color=accent, opacity=0.62)
-            evidence["glow"].set_stroke(color=accent, opacity=0.09)
-            scanner_set_accent(scanner, accent)
-
-            # update reason tag (top border)
-            text_obj = _safe_text(ellipsize(reason.upper(), 26), font="Consolas", font_size=15, color=WHITE, weight=BOLD)
-            reason_txt.become(text_obj)
-            reason_txt.set_z_index(205)
-
-            # width based on text (clamped)
-            w_cap = evidence["outer"].width * 0.86
-            w_min = evidence["outer"].width * 0.48
-            target_w = max(w_min, min(w_cap, reason_txt.width + 0.55))
-            reason_plate.set_width(target_w)
-            reason_glow.set_width(target_w)
-            place_reason_tag()
-            reason_txt.scale_to_fit_width(reason_plate.width * 0.90)
-            reason_txt.move_to(reason_plate.get_center() + DOWN * 0.005)
-
-            # ENTRY -> EVIDENCE (tiny anticipation + smooth)
-            self.play(sprite.animate.shift(LEFT * 0.10), run_time=0.10, rate_func=rf.ease_out_cubic)
-            self.play(
-                AnimationGroup(
-                    sprite.animate.move_to(evidence_center),
-                    beam_alpha.animate.set_value(1.0),
-                    reason_glow.animate.set_opacity(1.0),
-                    reason_plate.animate.set_opacity(1.0),
-                    reason_txt.animate.set_opacity(1.0),
-                    lag_ratio=0.0,
-                ),
-                run_time=0.40,
-                rate_func=rf.ease_out_cubic,
-            )
-
-            # SCAN (alive: rings rotate opposite, sweep subtle)
-            sweep.set_opacity(1.0)
-            for msg in random.sample(scan_phrases, k=3):
-                new_label = make_scanner_label(msg)
+            phrases = scan_rng.sample(scan_phrases, k=3)
+
+            # one cached segment per item (src/segments.py): depends on this row, what is
+            # already stacked in the bins / counters and the labels left from the last item
+            with segs.segment(
+                "item", img_name, reason, cat, phrases,
+                left_bin["items"], right_bin["items"], cL["value"], cR["value"], reason_txt, scanner_label,
+            ):
+                is_left = (cat == 1)
+                accent = Theme.NEON_BLUE if is_left else Theme.NEON_PINK
+                bin_ref = left_bin if is_left else right_bin
+                counter_ref = cL if is_left else cR
+
+                img_path = os.path.join(ASSETS_DIR, "images", img_name)
+
+                sprite = build_sprite(
+                    img_path,
+                    accent=accent,
+                    max_w=evidence["inner"].width * 0.78,
+                    max_h=evidence["inner"].height * 0.72,
+                )
+                sprite.move_to(entry)
+                sprite.set_opacity(1.0)
+                items_layer.add(sprite)
+
+                # fit sprite into evidence
+                fit_mobject_to_box(sprite, evidence["inner"].width * 0.78, evidence["inner"].height * 0.72)
+
+                # accents
+                evidence["outer"].set_stroke(color=accent, opacity=0.62)
+                evidence["glow"].set_stroke(color=accent, opacity=0.09)
+                scanner_set_accent(scanner, accent)
+
+                # update reason tag (top border)
+                text_obj = _safe_text(ellipsize(reason.upper(), 26), font="Consolas", font_size=15, color=WHITE, weight=BOLD)
+                reason_txt.become(text_obj)
+                reason_txt.set_z_index(205)
+
+                # width based on text (clamped)
+                w_cap = evidence["outer"].width * 0.86
+                w_min = evidence["outer"].width * 0.48
+                target_w = max(w_min, min(w_cap, reason_txt.width + 0.55))
+                reason_plate.set_width(target_w)
+                reason_glow.set_width(target_w)
+                place_reason_tag()
+                reason_txt.scale_to_fit_width(reason_plate.width * 0.90)
+                reason_txt.move_to(reason_plate.get_center() + DOWN * 0.005)
+
+                # ENTRY -> EVIDENCE (tiny anticipation + smooth)
+                self.play(sprite.animate.shift(LEFT * 0.10), run_time=0.10, rate_func=rf.ease_out_cubic)
                 self.play(
                     AnimationGroup(
-                        Transform(scanner_label, new_label),
-                        Rotate(scanner["ticks"], angle=TAU * 0.14, about_point=scanner_center),
-                        Rotate(scanner["dash"], angle=-TAU * 0.12, about_point=scanner_center),
-                        Rotate(sweep, angle=TAU * 0.28, about_point=scanner_center),
+                        sprite.animate.move_to(evidence_center),
+                        beam_alpha.animate.set_value(1.0),
+                        reason_glow.animate.set_opacity(1.0),
+                        reason_plate.animate.set_opacity(1.0),
+                        reason_txt.animate.set_opacity(1.0),
                         lag_ratio=0.0,
                     ),
-                    run_time=0.30,
-                    rate_func=rf.ease_in_out_sine,
+                    run_time=0.40,
+                    rate_func=rf.ease_out_cubic,
                 )
 
-            # VERDICT (premium pulse, no harsh flash)
-            verdict = "GO LEFT" if is_left else "GO RIGHT"
-            verdict_label = VGroup(
-                _safe_text("VERDICT", font="Consolas", font_size=12, color=Theme.TEXT_SUB, weight=BOLD),
-                _safe_text(verdict, font_size=22, color=accent, weight=BOLD),
-                _safe_text("route locked", font="Consolas", font_size=11, color=Theme.TEXT_SUB),
-            ).arrange(DOWN, buff=0.06).move_to(scanner_center + DOWN * 0.02).set_z_index(230)
-
-            if verdict_label.width > scanner["radius"] * 1.7:
-                verdict_label.scale_to_fit_width(scanner["radius"] * 1.7)
-
-            self.play(Transform(scanner_label, verdict_label), run_time=0.22, rate_func=rf.ease_out_cubic)
-            evidence_pulse(accent)
+                # SCAN (alive: rings rotate opposite, sweep subtle)
+                sweep.set_opacity(1.0)
+                for msg in phrases:
+                    new_label = make_scanner_label(msg)
+                    self.play(
+                        AnimationGroup(
+                            Transform(scanner_label, new_label),
+                            Rotate(scanner["ticks"], angle=TAU * 0.14, about_point=scanner_center),
+                            Rotate(scanner["dash"], angle=-TAU * 0.12, about_point=scanner_center),
+                            Rotate(sweep, angle=TAU * 0.28, about_point=scanner_center),
+                            lag_ratio=0.0,
+                        ),
+                        run_time=0.30,
+                        rate_func=rf.ease_in_out_sine,
+                    )
+
+                # VERDICT (premium pulse, no harsh flash)
+                verdict = "GO LEFT" if is_left else "GO RIGHT"
+                verdict_label = VGroup(
+                    _safe_text("VERDICT", font="Consolas", font_size=12, color=Theme.TEXT_SUB, weight=BOLD),
+                    _safe_text(verdict, font_size=22, color=accent, weight=BOLD),
+                    _safe_text("route locked", font="Consolas", font_size=11, color=Theme.TEXT_SUB),
+                ).arrange(DOWN, buff=0.06).move_to(scanner_center + DOWN * 0.02).set_z_index(230)
+
+                if verdict_label.width > scanner["radius"] * 1.7:
+                    verdict_label.scale_to_fit_width(scanner["radius"] * 1.7)
+
+                self.play(Transform(scanner_label, verdict_label), run_time=0.22, rate_func=rf.ease_out_cubic)
+                evidence_pulse(accent)
+
+                # ROUTE glow ON + beam OFF
+                self.play(beam_alpha.animate.set_value(0.0), run_time=0.12, rate_func=rf.ease_in_out_sine)
+                if is_left:
+                    self.play(routeL_alpha.animate.set_value(1.0), run_time=0.14, rate_func=rf.ease_out_cubic)
+                else:
+                    self.play(routeR_alpha.animate.set_value(1.0), run_time=0.14, rate_func=rf.ease_out_cubic)
+
+                # MOVE card EVIDENCE -> BIN (smoother, scale late)
+                start = evidence_center
+                side = scanner_center + (LEFT * 1.75 if is_left else RIGHT * 1.75) + DOWN * 0.55
+                end = (left_bin["mouth"] if is_left else right_bin["mouth"]).get_center() + DOWN * 0.05
+
+                path = VMobject()
+                path.set_points_smoothly([start, side, end])
+                path.set_stroke(width=0, opacity=0)
 
-            # ROUTE glow ON + beam OFF
-            self.play(beam_alpha.animate.set_value(0.0), run_time=0.12, rate_func=rf.ease_in_out_sine)
-            if is_left:
-                self.play(routeL_alpha.animate.set_value(1.0), run_time=0.14, rate_func=rf.ease_out_cubic)
-            else:
-                self.play(routeR_alpha.animate.set_value(1.0), run_time=0.14, rate_func=rf.ease_out_cubic)
-
-            # MOVE card EVIDENCE -> BIN (smoother, scale late)
-            start = evidence_center
-            side = scanner_center + (LEFT * 1.75 if is_left else RIGHT * 1.75) + DOWN * 0.55
-            end = (left_bin["mouth"] if is_left else right_bin["mouth"]).get_center() + DOWN * 0.05
-
-            path = VMobject()
-            path.set_points_smoothly([start, side, end])
-            path.set_stroke(width=0, opacity=0)
-
-            self.play(
-                AnimationGroup(
-                    MoveAlongPath(sprite, path, rate_func=rf.ease_in_out_cubic),
+                self.play(
                     AnimationGroup(
-                        Wait(0.22),
-                        sprite.animate.scale(0.72),
+                        MoveAlongPath(sprite, path, rate_func=rf.ease_in_out_cubic),
+                        AnimationGroup(
+                            Wait(0.22),
+                            sprite.animate.scale(0.72),
+                            lag_ratio=0.0,
+                        ),
+                        reason_txt.animate.set_opacity(0.0),
+                        reason_plate.animate.set_opacity(0.0),
+                        reason_glow.animate.set_opacity(0.0),
                         lag_ratio=0.0,
                     ),
-                    reason_txt.animate.set_opacity(0.0),
-                    reason_plate.animate.set_opacity(0.0),
-                    reason_glow.animate.set_opacity(0.0),
-                    lag_ratio=0.0,
-                ),
-                run_time=0.58,
-                rate_func=rf.ease_in_out_cubic,
-            )
+                    run_time=0.58,
+                    rate_func=rf.ease_in_out_cubic,
+                )
 
-            # route glow OFF
-            if is_left:
-                self.play(routeL_alpha.animate.set_value(0.0), run_time=0.14, rate_func=rf.ease_in_out_sine)
-            else:
-                self.play(routeR_alpha.animate.set_value(0.0), run_time=0.14, rate_func=rf.ease_in_out_sine)
+                # route glow OFF
+                if is_left:
+                    self.play(routeL_alpha.animate.set_value(0.0), run_time=0.14, rate_func=rf.ease_in_out_sine)
+                else:
+                    self.play(routeR_alpha.animate.set_value(0.0), run_time=0.14, rate_func=rf.ease_in_out_sine)
 
-            sweep.set_opacity(0.0)
+                sweep.set_opacity(0.0)
 
-            # STORE inside container (grid pack)
-            bin_ref["items"].append(sprite)
-            n = len(bin_ref["items"])
-            positions = pack_positions(bin_ref["inner"], n, cols=3)
+                # STORE inside container (grid pack)
+                bin_ref["items"].append(sprite)
+                n = len(bin_ref["items"])
+                positions = pack_positions(bin_ref["inner"], n, cols=3)
 
-            rows = int(math.ceil(n / 3))
-            cell_w = bin_ref["inner"].width / 3
-            cell_h = bin_ref["inner"].height / max(1, rows)
-            max_w = cell_w * 0.78
-            max_h = cell_h * 0.82
+                rows = int(math.ceil(n / 3))
+                cell_w = bin_ref["inner"].width / 3
+                cell_h = bin_ref["inner"].height / max(1, rows)
+                max_w = cell_w * 0.78
+                max_h = cell_h * 0.82
 
-            self.play(
-                LaggedStart(*[bin_ref["items"][i].animate.move_to(positions[i]) for i in range(n)], lag_ratio=0.03),
-                run_time=0.26,
-                rate_func=rf.ease_out_cubic,
-            )
-            for sp in bin_ref["items"]:
-                fit_mobject_to_box(sp, max_w, max_h)
-
-            # confirm pulse (soft)
-            self.play(bin_ref["body"].animate.set_stroke(width=3.4, opacity=0.88), run_time=0.12, rate_func=rf.ease_out_cubic)
-            self.play(bin_ref["body"].animate.set_stroke(width=2.6, opacity=0.62), run_time=0.14, rate_func=rf.ease_in_out_sine)
-
-            # Counter increment
-            counter_ref["value"] += 1
-            new_txt = _safe_text(str(counter_ref["value"]), font="Consolas", font_size=28, color=WHITE, weight=BOLD)
-            new_txt.move_to(counter_ref["txt"].get_center())
-            self.play(Transform(counter_ref["txt"], new_txt), run_time=0.16, rate_func=rf.ease_out_cubic)
-            self.play(counter_ref["outer"].animate.set_stroke(width=3.2, opacity=0.88), run_time=0.10, rate_func=rf.ease_out_cubic)
-            self.play(counter_ref["outer"].animate.set_stroke(width=2.6, opacity=0.62), run_time=0.12, rate_func=rf.ease_in_out_sine)
-
-            # back to idle
-            idle = make_scanner_label("ready")
-            self.play(Transform(scanner_label, idle), run_time=0.18, rate_func=rf.ease_out_cubic)
-
-            # reset evidence neutral
-            evidence["outer"].set_stroke(color=Theme.NEON_BLUE, opacity=0.62)
-            evidence["glow"].set_stroke(color=Theme.NEON_BLUE, opacity=0.07)
+                self.play(
+                    LaggedStart(*[bin_ref["items"][i].animate.move_to(positions[i]) for i in range(n)], lag_ratio=0.03),
+                    run_time=0.26,
+                    rate_func=rf.ease_out_cubic,
+                )
+                for sp in bin_ref["items"]:
+                    fit_mobject_to_box(sp, max_w, max_h)
+
+                # confirm pulse (soft)
+                self.play(bin_ref["body"].animate.set_stroke(width=3.4, opacity=0.88), run_time=0.12, rate_func=rf.ease_out_cubic)
+                self.play(bin_ref["body"].animate.set_stroke(width=2.6, opacity=0.62), run_time=0.14, rate_func=rf.ease_in_out_sine)
+
+                # Counter increment
+                counter_ref["value"] += 1
+                new_txt = _safe_text(str(counter_ref["value"]), font="Consolas", font_size=28, color=WHITE, weight=BOLD)
+                new_txt.move_to(counter_ref["txt"].get_center())
+                self.play(Transform(counter_ref["txt"], new_txt), run_time=0.16, rate_func=rf.ease_out_cubic)
+                self.play(counter_ref["outer"].animate.set_stroke(width=3.2, opacity=0.88), run_time=0.10, rate_func=rf.ease_out_cubic)
+                self.play(counter_ref["outer"].animate.set_stroke(width=2.6, opacity=0.62), run_time=0.12, rate_func=rf.ease_in_out_sine)
+
+                # back to idle
+                idle = make_scanner_label("ready")
+                self.play(Transform(scanner_label, idle), run_time=0.18, rate_func=rf.ease_out_cubic)
+
+                # reset evidence neutral
+                evidence["outer"].set_stroke(color=Theme.NEON_BLUE, opacity=0.62)
+                evidence["glow"].set_stroke(color=Theme.NEON_BLUE, opacity=0.07)
 
         # WINNER HIGHLIGHT
         left_count = cL["value"]
@@ -1,8 +1,6 @@
 import sys
 import os
-import pandas as pd
 import numpy as np
-import random
 from manim import *
 import manim.utils.rate_functions as rf
 
@@ -11,25 +9,18 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
-# --- IMPORTS & FALLBACKS ---
-try:
-    from src.config import *
-    from src.utils import *
-except ImportError:
-    DATA_DIR = "./"
-    ASSETS_DIR = "./assets"
+# --- IMPORTS ---
+from src.config import *
+from src.utils import *
+from src.image_cache import cached_image_mobject
+from src.text_prewarm import prewarm_texts, text_spec
+from src.data.ingest import load_dataset
+from src.data.schemas import VS_SCHEMA
+from src.lazy import lazy_import
+from src.rng import hash_uniform, stream
+from src.segments import SegmentCache
 
-
-    class Theme:
-        NEON_BLUE = "#00F0FF"
-        NEON_PURPLE = "#BD00FF"
-        NEON_PINK = "#FF0055"
-
-
-    def get_branding_border():
-        border = Rectangle(height=16 / 9 * 7.5, width=7.5)
-        border.set_stroke(width=12, color=[Theme.NEON_BLUE, Theme.NEON_PURPLE, Theme.NEON_PINK], opacity=0.9)
-        return border
+pd = lazy_import("pandas")
 
 
 # --- 2. ROBUST DATA LOADING ---
@@ -45,20 +36,18 @@ def load_and_clean_data(csv_filename):
         return pd.DataFrame(data)
 
     try:
-        df = pd.read_csv(csv_filename)
-        df.columns = df.columns.str.strip()
-        df['Metric'] = df['Metric'].astype(str).str.strip().str.upper()
-        df['P1_Value'] = df['P1_Value'].astype(str).str.strip()
-        df['P2_Value'] = df['P2_Value'].astype(str).str.strip()
-        df = df[df['Metric'] != 'NAN']
-        df = df[df['Metric'] != '']
-        df['Winner'] = pd.to_numeric(df['Winner'], errors='coerce').fillna(0).astype(int)
-        return df
+        # cleaned once per file (Metric upper, values as display strings, Winner int)
+        return load_dataset(csv_filename, VS_SCHEMA).frame()
     except Exception as e:
         print(f"❌ Critical Error reading CSV: {e}")
         sys.exit(1)
 
 
+def data_candidates() -> list:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [os.path.join(DATA_DIR, "vs_data.csv")]
+
+
 class VsCard(Scene):
     def construct(self):
         self.camera.background_color = "#050505"
@@ -72,9 +61,19 @@ class VsCard(Scene):
         PLAYER_1 = {"name": "ABHISHEK", "color": C_P1, "image": "player1.png"}
         PLAYER_2 = {"name": "PANDEY", "color": C_P2, "image": "player2.png"}
 
-        csv_path = os.path.join(DATA_DIR, "vs_data.csv")
+        csv_path = data_candidates()[0]
         df = load_and_clean_data(csv_path)
 
+        # Prewarm every per-row label (parallel Pango render into the text cache)
+        prewarm_texts(
+            [text_spec(m, font="Montserrat", weight=BOLD, font_size=22, color=C_GOLD) for m in df['Metric']]
+            + [
+                text_spec(v, font="Montserrat", weight=BOLD, font_size=28, color=WHITE)
+                for v in list(df['P1_Value']) + list(df['P2_Value'])
+            ]
+            + [text_spec(k, font="Montserrat", weight=BOLD, font_size=24, color=C_WIN) for k in range(1, len(df) + 1)]
+        )
+
         # LAYERS
         static_layer = VGroup()  # Grid, Border
         bg_anim_layer = VGroup()  # Rain/Streaks
@@ -92,28 +91,34 @@ class VsCard(Scene):
         static_layer.add(grid)
 
         # NEW: High Speed Vertical Streaks (Rain)
+        # Seeded per render (src/rng.py) and a pure function of elapsed time, so identical
+        # inputs draw identical rain.
+        rain_rng = stream("vs.rain")
         rain_group = VGroup()
-        for _ in range(40):  # More particles for fuller screen
+        for i in range(40):  # More particles for fuller screen
             # Lines instead of Dots for speed effect
-            length = random.uniform(0.2, 0.6)
+            length = rain_rng.uniform(0.2, 0.6)
             line = Line(start=ORIGIN, end=UP * length)
-            line.set_stroke(width=random.uniform(1, 3), color=random.choice([C_P1, C_P2, GREY_B]))
-            line.set_opacity(random.uniform(0.3, 0.7))
-
-            # Position ANYWHERE on screen width (Full fill)
-            line.move_to([random.uniform(-4, 4), random.uniform(-4, 4), 0])
+            line.set_stroke(width=rain_rng.uniform(1, 3), color=rain_rng.choice([C_P1, C_P2, GREY_B]))
+            line.set_opacity(rain_rng.uniform(0.3, 0.7))
 
-            # Custom velocity attribute
-            line.velocity = DOWN * random.uniform(2.0, 4.0)  # Fast falling
+            # Position ANYWHERE on screen width (Full fill); (id, x0, y0, fall speed)
+            line.rain = (i, rain_rng.uniform(-4, 4), rain_rng.uniform(-4, 4), rain_rng.uniform(2.0, 4.0))
+            line.move_to([line.rain[1], line.rain[2], 0])
             rain_group.add(line)
 
+        rain_clock = {"t": 0.0}
+
         def update_rain(mob, dt):
+            rain_clock["t"] += dt
             for line in mob:
-                line.shift(line.velocity * dt)
-                if line.get_y() < -4.5:  # Reset to top
-                    line.move_to([random.uniform(-4, 4), 4.5, 0])
-                    # Randomize speed again for variety
-                    line.velocity = DOWN * random.uniform(2.0, 4.0)
+                i, x0, y0, speed = line.rain
+                fallen = speed * rain_clock["t"] - (y0 + 4.5)  # distance past the bottom edge
+                if fallen < 0:
+                    line.move_to([x0, y0 - speed * rain_clock["t"], 0])
+                else:  # Reset to top: drop k starts at 4.5 in its own column
+                    k = int(fallen // 9.0) + 1
+                    line.move_to([hash_uniform("vs.rain.x", i, k, low=-4, high=4), 4.5 - fallen % 9.0, 0])
 
         rain_group.add_updater(update_rain)
         bg_anim_layer.add(rain_group)
@@ -138,7 +143,16 @@ class VsCard(Scene):
         vs_box = Square(side_length=0.8, color=C_GOLD, stroke_width=4).rotate(45 * DEGREES).move_to(t_vs.get_center())
 
         vs_anim_grp = VGroup(vs_box, t_vs)
-        vs_anim_grp.add_updater(lambda m, dt: m.scale(1 + np.sin(self.time * 8) * 0.005))  # Intense Heartbeat
+        # Intense Heartbeat: the per-frame 1 + 0.005*sin(8t) scale product, written as a function
+        # of scene time so skipped (cached) plays land on exactly the same size
+        vs_anim_grp.beat = 1.0
+
+        def heartbeat(m, dt):
+            beat = np.exp(0.005 * config.frame_rate * (1 - np.cos(self.time * 8)) / 8)
+            m.scale(beat / m.beat)
+            m.beat = beat
+
+        vs_anim_grp.add_updater(heartbeat)
 
         # --- C. UI CONSTRUCTION ---
         # Positioning
@@ -160,10 +174,7 @@ class VsCard(Scene):
             # 2. Image
             img_file = os.path.join(ASSETS_DIR, "images", config["image"])
             if os.path.exists(img_file):
-                img = ImageMobject(img_file)
-                img.scale_to_fit_width(FRAME_WIDTH - 0.1)
-                if img.height > (FRAME_HEIGHT - 0.1):
-                    img.scale_to_fit_height(FRAME_HEIGHT - 0.1)
+                img = cached_image_mobject(img_file, FRAME_WIDTH - 0.1, FRAME_HEIGHT - 0.1)
             else:
                 img = Text(config["name"][0], font="Montserrat", weight=BOLD, font_size=70, color=config["color"])
 
@@ -223,6 +234,7 @@ class VsCard(Scene):
         self.add(vs_anim_grp)
 
         # --- E. GAME LOOP ---
+        segs = SegmentCache(self, __file__)
         p1_points = 0
         p2_points = 0
 
@@ -236,71 +248,74 @@ class VsCard(Scene):
             v2_text = row['P2_Value']
             winner = row['Winner']
 
-            t_metric = Text(metric_text, font="Montserrat", weight=BOLD, font_size=22, color=C_GOLD).move_to(metric_bg)
-            t_v1 = Text(v1_text, font="Montserrat", weight=BOLD, font_size=28, color=WHITE).move_to(val_box_1)
-            t_v2 = Text(v2_text, font="Montserrat", weight=BOLD, font_size=28, color=WHITE).move_to(val_box_2)
-
-            if t_metric.width > 4.0: t_metric.scale_to_fit_width(4.0)
-            if t_v1.width > 1.8: t_v1.scale_to_fit_width(1.8)
-            if t_v2.width > 1.8: t_v2.scale_to_fit_width(1.8)
-
-            self.play(
-                FadeOut(curr_m, shift=UP * 0.2), FadeOut(curr_v1, shift=UP * 0.2), FadeOut(curr_v2, shift=UP * 0.2),
-                FadeIn(t_metric, shift=UP * 0.2), FadeIn(t_v1, shift=UP * 0.2), FadeIn(t_v2, shift=UP * 0.2),
-                run_time=0.3
-            )
-
-            # --- FOCUS LOGIC ---
-            win_grp = None
-            if winner == 1:
-                win_grp = p1_grp
-                win_hud_corners = p1_hud[1]
-                win_score_obj = p1_score
-                win_val_box = val_box_1
-                lose_grp = p2_grp
-                lose_val_box = val_box_2
-                p1_points += 1
-            elif winner == 2:
-                win_grp = p2_grp
-                win_hud_corners = p2_hud[1]
-                win_score_obj = p2_score
-                win_val_box = val_box_2
-                lose_grp = p1_grp
-                lose_val_box = val_box_1
-                p2_points += 1
-
-            if win_grp:
-                win_grp.set_z_index(100)
-                lose_grp.set_z_index(0)
-
-                new_score_txt = Text(str(p1_points if winner == 1 else p2_points), font="Montserrat", weight=BOLD,
-                                     font_size=24, color=C_WIN).move_to(win_score_obj)
+            # one cached segment per round (src/segments.py): depends on this row, the scores
+            # going in and the previous round's texts it fades out
+            with segs.segment("round", metric_text, v1_text, v2_text, winner, p1_points, p2_points, curr_m, curr_v1, curr_v2):
+                t_metric = Text(metric_text, font="Montserrat", weight=BOLD, font_size=22, color=C_GOLD).move_to(metric_bg)
+                t_v1 = Text(v1_text, font="Montserrat", weight=BOLD, font_size=28, color=WHITE).move_to(val_box_1)
+                t_v2 = Text(v2_text, font="Montserrat", weight=BOLD, font_size=28, color=WHITE).move_to(val_box_2)
 
-                self.play(
-                    win_grp.animate.scale(1.15).set_opacity(1),
-                    win_hud_corners.animate.set_stroke(color=C_WIN, width=6),
-                    win_val_box.animate.set_stroke(color=C_WIN, width=6),
-                    lose_grp.animate.scale(0.9).set_opacity(0.3),
-                    lose_val_box.animate.set_opacity(0.3),
-                    Transform(win_score_obj, new_score_txt),
-                    Flash(win_score_obj, color=C_WIN, line_length=0.2, num_lines=4),
-                    run_time=0.4, rate_func=rf.ease_out_back
-                )
-                self.wait(0.6)
+                if t_metric.width > 4.0: t_metric.scale_to_fit_width(4.0)
+                if t_v1.width > 1.8: t_v1.scale_to_fit_width(1.8)
+                if t_v2.width > 1.8: t_v2.scale_to_fit_width(1.8)
 
-                # Reset
-                orig_col_win = C_P1 if winner == 1 else C_P2
                 self.play(
-                    win_grp.animate.scale(1 / 1.15),
-                    win_hud_corners.animate.set_stroke(color=orig_col_win, width=4),
-                    win_val_box.animate.set_stroke(color=orig_col_win, width=4),
-                    win_score_obj.animate.set_color(WHITE),
-                    lose_grp.animate.scale(1 / 0.9).set_opacity(1),
-                    lose_val_box.animate.set_opacity(0.9),
+                    FadeOut(curr_m, shift=UP * 0.2), FadeOut(curr_v1, shift=UP * 0.2), FadeOut(curr_v2, shift=UP * 0.2),
+                    FadeIn(t_metric, shift=UP * 0.2), FadeIn(t_v1, shift=UP * 0.2), FadeIn(t_v2, shift=UP * 0.2),
                     run_time=0.3
                 )
-            else:
-                self.wait(1.0)
+
+                # --- FOCUS LOGIC ---
+                win_grp = None
+                if winner == 1:
+                    win_grp = p1_grp
+                    win_hud_corners = p1_hud[1]
+                    win_score_obj = p1_score
+                    win_val_box = val_box_1
+                    lose_grp = p2_grp
+                    lose_val_box = val_box_2
+                    p1_points += 1
+                elif winner == 2:
+                    win_grp = p2_grp
+                    win_hud_corners = p2_hud[1]
+                    win_score_obj = p2_score
+                    win_val_box = val_box_2
+                    lose_grp = p1_grp
+                    lose_val_box = val_box_1
+                    p2_points += 1
+
+                if win_grp:
+                    win_grp.set_z_index(100)
+                    lose_grp.set_z_index(0)
+
+                    new_score_txt = Text(str(p1_points if winner == 1 else p2_points), font="Montserrat", weight=BOLD,
+                                         font_size=24, color=C_WIN).move_to(win_score_obj)
+
+                    self.play(
+                        win_grp.animate.scale(1.15).set_opacity(1),
+                        win_hud_corners.animate.set_stroke(color=C_WIN, width=6),
+                        win_val_box.animate.set_stroke(color=C_WIN, width=6),
+                        lose_grp.animate.scale(0.9).set_opacity(0.3),
+                        lose_val_box.animate.set_opacity(0.3),
+                        Transform(win_score_obj, new_score_txt),
+                        Flash(win_score_obj, color=C_WIN, line_length=0.2, num_lines=4),
+                        run_time=0.4, rate_func=rf.ease_out_back
+                    )
+                    self.wait(0.6)
+
+                    # Reset
+                    orig_col_win = C_P1 if winner == 1 else C_P2
+                    self.play(
+                        win_grp.animate.scale(1 / 1.15),
+                        win_hud_corners.animate.set_stroke(color=orig_col_win, width=4),
+                        win_val_box.animate.set_stroke(color=orig_col_win, width=4),
+                        win_score_obj.animate.set_color(WHITE),
+                        lose_grp.animate.scale(1 / 0.9).set_opacity(1),
+                        lose_val_box.animate.set_opacity(0.9),
+                        run_time=0.3
+                    )
+                else:
+                    self.wait(1.0)
 
             curr_m = t_metric
             curr_v1 = t_v1
@@ -9,7 +9,6 @@ from dataclasses import dataclass
 from typing import Tuple, List, Literal
 
 import numpy as np
-import pandas as pd
 from manim import *
 from manim import rate_functions as rf
 
@@ -18,57 +17,27 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
-# --- IMPORTS (Robust) ---
-try:
-    from src.config import BACKGROUND_COLOR
-    from src.utils import (
-        IntroManager,
-        Brand,
-        get_safe_frame,
-        make_floating_particles,
-    )
-except Exception:
-    BACKGROUND_COLOR = "#050505"
-
-    class Brand:
-        CYAN = "#00F0FF"
-        PINK = "#FF0055"
-        GREEN = "#00FF66"
-        WHITE = "#FFFFFF"
-        TEXT_MAIN = "#FFFFFF"
-        TEXT_SUB = "#B8B8B8"
-
-    config.frame_height = 16.0
-    config.frame_width = 9.0
-
-    def get_safe_frame(margin=0.60):
-        half_w = config.frame_width / 2
-        half_h = config.frame_height / 2
-        return {
-            "left": -half_w + margin,
-            "right": half_w - margin,
-            "top": half_h - margin,
-            "bottom": -half_h + margin,
-            "w": config.frame_width - (2 * margin),
-            "h": config.frame_height - (2 * margin),
-            "cx": 0.0,
-            "cy": 0.0,
-        }
-
-    def make_floating_particles(*args, **kwargs):
-        return VGroup()
-
-    class IntroManager:
-        @staticmethod
-        def play_intro(*args, **kwargs):
-            return
+# --- IMPORTS ---
+from src.config import BACKGROUND_COLOR, DATA_DIR
+from src.utils import (
+    IntroManager,
+    Brand,
+    get_safe_frame,
+    make_floating_particles,
+)
+from src.data.ingest import load_dataset, parse_meta
+from src.data.schemas import BUTTERFLY_SCHEMA
+from src.primitives import GlyphCounter
+from src.lazy import lazy_import
+
+pd = lazy_import("pandas")
 
 
 # ==========================
 # DESIGN (single vibe)
 # ==========================
 class Design:
-    BG = BACKGROUND_COLOR if "BACKGROUND_COLOR" in globals() else "#050505"
+    BG = BACKGROUND_COLOR
 
     CYAN = getattr(Brand, "CYAN", "#00F0FF")
     PINK = getattr(Brand, "PINK", "#FF0055")
@@ -132,6 +101,11 @@ class LayoutCfg:
     row_gap_min: float = 0.90
     row_gap_max: float = 1.35
 
+    # many attributes: all rows grow together from one tracker (fixed runtime)
+    parallel_min_attrs: int = 13
+    parallel_run_time: float = 3.2
+    parallel_stagger: float = 0.35  # fraction of the run spent staggering row starts
+
     z_bg: int = 0
     z_atmo: int = 1
     z_fx: int = 2
@@ -154,41 +128,16 @@ class LayoutCfg:
 def _parse_players_from_first_line(path: str) -> Tuple[str, str]:
     p1 = "ITEM A"
     p2 = "ITEM B"
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            first = f.readline().strip()
-        if first.startswith("#") and ("P1=" in first) and ("P2=" in first):
-            first = first[1:]
-            parts = [x.strip() for x in first.split(",") if x.strip()]
-            for part in parts:
-                if part.upper().startswith("P1="):
-                    p1 = part.split("=", 1)[1].strip() or p1
-                if part.upper().startswith("P2="):
-                    p2 = part.split("=", 1)[1].strip() or p2
-    except Exception:
-        pass
+    meta = parse_meta(path)
+    if "P1" in meta and "P2" in meta:
+        p1 = meta["P1"] or p1
+        p2 = meta["P2"] or p2
     return p1, p2
 
 
 def _load_butterfly_df(csv_path: str) -> pd.DataFrame:
-    df = pd.read_csv(csv_path, comment="#")
-    df.columns = [str(c).strip() for c in df.columns]
-
-    if not {"Attribute", "P1_Value", "P2_Value"}.issubset(set(df.columns)):
-        if len(df.columns) >= 3:
-            attr_col, p1_col, p2_col = df.columns[0], df.columns[1], df.columns[2]
-            df = df.rename(columns={attr_col: "Attribute", p1_col: "P1_Value", p2_col: "P2_Value"})
-        else:
-            raise ValueError(f"CSV columns mismatch. Found: {list(df.columns)}")
-
-    df = df.copy()
-    df["Attribute"] = df["Attribute"].astype(str).str.strip().str.upper()
-    df["P1_Value"] = pd.to_numeric(df["P1_Value"], errors="coerce").fillna(0.0)
-    df["P2_Value"] = pd.to_numeric(df["P2_Value"], errors="coerce").fillna(0.0)
-
-    df = df[df["Attribute"].astype(str).str.len() > 0]
-    df = df.reset_index(drop=True)
-    return df
+    # Attribute (upper) + numeric P1_Value/P2_Value, parsed once per file (src/data cache)
+    return load_dataset(csv_path, BUTTERFLY_SCHEMA).frame()
 
 
 def _format_attr_label(label: str) -> str:
@@ -246,6 +195,32 @@ def _clamp_x_into_safe(mob: Mobject, sf: dict, safe_pad: float) -> None:
     mob.move_to([x, mob.get_center()[1], 0])
 
 
+def _end_box_xs(
+    side: Literal["L", "R"],
+    track_edge_x: np.ndarray,
+    box_w: np.ndarray,
+    sf: dict,
+    policy: EndBoxPolicy,
+) -> np.ndarray:
+    """
+    _place_end_box for many rows at once: x centers of the end boxes.
+    track_edge_x is each track's outer edge (left edge for "L", right edge for "R").
+    """
+    sgn = -1.0 if side == "L" else 1.0
+    outside = track_edge_x + sgn * (box_w / 2 + policy.gap_outside)
+    inside = track_edge_x - sgn * (box_w / 2 + policy.pad_inside)
+    if policy.mode == "INSIDE":
+        return inside
+
+    lo = sf["left"] + policy.safe_pad + box_w / 2
+    hi = sf["right"] - policy.safe_pad - box_w / 2
+    if policy.mode == "OUTSIDE":
+        return np.clip(outside, lo, hi)
+
+    # AUTO
+    return np.where((outside >= lo) & (outside <= hi), outside, inside)
+
+
 def _place_end_box(
     side: Literal["L", "R"],
     end_box: VGroup,
@@ -289,7 +264,7 @@ def _place_end_box(
 
 
 # ==========================
-# ✅ NUMBER FIX (stable on Windows/Cairo): use Text + ValueTracker instead of Integer/DecimalNumber
+# ✅ NUMBER FIX (stable on Windows/Cairo): prebuilt glyph counters instead of Integer/DecimalNumber
 # ==========================
 def _fmt_compact_value(raw_value: float, spec: CompactSpec) -> str:
     """
@@ -306,6 +281,39 @@ def _fmt_compact_value(raw_value: float, spec: CompactSpec) -> str:
     return s
 
 
+def _fmt_compact_values(raw: np.ndarray, divisor: np.ndarray, plain: np.ndarray) -> List[str]:
+    """_fmt_compact_value for a whole column (same output, one NumPy pass)."""
+    v = np.asarray(raw, dtype=float) / divisor
+    ints = np.rint(v).astype(np.int64).astype(str)
+    decs = np.char.rstrip(np.char.rstrip(np.char.mod("%.1f", v), "0"), ".")
+    return np.where(plain, ints, decs).tolist()
+
+
+def _spear_path_points(
+    x_base: float,
+    y: np.ndarray,
+    length: np.ndarray,
+    tip: float,
+    h: float,
+    direction: float,
+) -> np.ndarray:
+    """
+    Closed spear outlines (flat base, pointed tip) for many rows as ONE VMobject path.
+    direction = -1 grows left, +1 grows right. Returns (n * 20, 3).
+    """
+    n = len(y)
+    xb = np.full(n, float(x_base))
+    xe = xb + direction * length
+    verts = np.zeros((n, 6, 3))
+    verts[:, :, 0] = np.stack([xb, xe, xe + direction * tip, xe, xb, xb], axis=1)
+    verts[:, :, 1] = np.stack([y + h / 2, y + h / 2, y, y - h / 2, y - h / 2, y + h / 2], axis=1)
+
+    a = verts[:, :-1]
+    b = verts[:, 1:]
+    seg = np.stack([a, a + (b - a) / 3.0, a + 2.0 * (b - a) / 3.0, b], axis=2)  # (n, 5, 4, 3)
+    return seg.reshape(-1, 3)
+
+
 def _make_tracker_text(
     tracker: ValueTracker,
     font_size: int,
@@ -316,31 +324,34 @@ def _make_tracker_text(
     stroke_color=BLACK,
     stroke_w: float = 1.0,
     stroke_op: float = 0.35,
-) -> Text:
+) -> GlyphCounter:
     """
-    Creates a Text that updates from a ValueTracker (int rounded).
-    This avoids the "numbers vanish" issue from Integer/DecimalNumber rebuilds.
+    Creates a counter that follows a ValueTracker (int rounded).
+    Glyphs are rendered once, so ticking never rebuilds text (no "numbers vanish"
+    from Integer/DecimalNumber rebuilds, no Pango call per frame).
     """
-    t = Text("0", font=font, weight=weight, font_size=font_size, color=color).set_z_index(z)
+    t = GlyphCounter("0", max_chars=6, font=font, weight=weight, font_size=font_size, color=color).set_z_index(z)
     try:
         t.set_stroke(stroke_color, width=stroke_w, opacity=stroke_op)
     except Exception:
         pass
 
-    def _upd(m: Mobject):
-        v = int(round(tracker.get_value()))
-        new = Text(str(v), font=font, weight=weight, font_size=font_size, color=color)
-        try:
-            new.set_stroke(stroke_color, width=stroke_w, opacity=stroke_op)
-        except Exception:
-            pass
-        new.set_z_index(z)
-        m.become(new)
-
-    t.add_updater(_upd)
+    t.track(tracker)
     return t
 
 
+def data_candidates() -> List[str]:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [
+        os.path.join(DATA_DIR, "butterfly_data.csv"),
+        os.path.join(project_root, "Data", "butterfly_data.csv"),
+        os.path.join(current_dir, "Data", "butterfly_data.csv"),
+        os.path.join(current_dir, "butterfly_data.csv"),
+        os.path.join(project_root, "butterfly_data.csv"),
+        "butterfly_data.csv",
+    ]
+
+
 class ButterflyChart(Scene):
     def construct(self):
         cfg = LayoutCfg()
@@ -364,14 +375,7 @@ class ButterflyChart(Scene):
         # ==========================================
         # 2) DATA
         # ==========================================
-        csv_candidates = [
-            os.path.join(project_root, "Data", "butterfly_data.csv"),
-            os.path.join(current_dir, "Data", "butterfly_data.csv"),
-            os.path.join(current_dir, "butterfly_data.csv"),
-            os.path.join(project_root, "butterfly_data.csv"),
-            "butterfly_data.csv",
-        ]
-        csv_path = next((p for p in csv_candidates if os.path.exists(p)), None)
+        csv_path = next((p for p in data_candidates() if os.path.exists(p)), None)
 
         if csv_path:
             p1_name, p2_name = _parse_players_from_first_line(csv_path)
@@ -406,6 +410,7 @@ class ButterflyChart(Scene):
             bar_h = 0.44
         if n_attr >= 17:
             bar_h = 0.40
+        parallel = n_attr >= cfg.parallel_min_attrs
 
         # ==========================================
         # 3) ATMOSPHERE
@@ -467,7 +472,7 @@ class ButterflyChart(Scene):
         scan_dot.add_updater(_scan)
 
         # ✅ CHANGED: returns (grp, ring, score_text, score_tracker)
-        def player_card(name: str, accent: str, side: str) -> Tuple[VGroup, Circle, Text, ValueTracker]:
+        def player_card(name: str, accent: str, side: str) -> Tuple[VGroup, Circle, GlyphCounter, ValueTracker]:
             plate_w = 3.10
             plate_h = 1.10
 
@@ -483,7 +488,7 @@ class ButterflyChart(Scene):
             ring.set_fill(color="#0A0A0A", opacity=1.0)
             ring.set_stroke(color=accent, width=3, opacity=0.95)
 
-            # ✅ FIX: stable score (Text + tracker)
+            # ✅ FIX: stable score (glyph counter + tracker)
             score_t = ValueTracker(0.0)
             score = _make_tracker_text(score_t, font_size=34, z=cfg.z_header + 9)
             # keep it centered in ring
@@ -584,7 +589,7 @@ class ButterflyChart(Scene):
         chips_w = max(1.0, chips_right - chips_left)
 
         chip_w = min(1.05, (chips_w - chip_gap * (n_rounds - 1)) / n_rounds)
-        chip_w = float(np.clip(chip_w, 0.55, 1.05))
+        chip_w = float(np.clip(chip_w, 0.55 if not parallel else 0.10, 1.05))
         chip_h = 0.40
 
         round_chips: List[VGroup] = []
@@ -595,6 +600,8 @@ class ButterflyChart(Scene):
 
             short = a[:6] if len(a) > 6 else a
             t = Text(short, font="Montserrat", weight=BOLD, font_size=12, color=Design.TEXT_SUB).set_z_index(cfg.z_ui + 2)
+            if t.width > chip_w * 0.86:
+                t.scale_to_fit_width(chip_w * 0.86)
             grp = VGroup(chip, t)
 
             x = chips_left + chip_w / 2 + i * (chip_w + chip_gap)
@@ -612,6 +619,10 @@ class ButterflyChart(Scene):
         avail_h = max(2.2, top_bound - bottom_bound)
 
         row_gap = float(np.clip(avail_h / (n_attr + 0.35), cfg.row_gap_min, cfg.row_gap_max))
+        if parallel:
+            # every row must fit the region at once
+            row_gap = float(min(cfg.row_gap_max, avail_h / (n_attr + 0.35)))
+            bar_h = float(min(bar_h, row_gap * 0.62))
 
         center_x = sf["cx"]
         node_w = cfg.node_w
@@ -694,8 +705,8 @@ class ButterflyChart(Scene):
         def tip_point(spear: VGroup) -> np.ndarray:
             return spear[1].get_vertices()[2]
 
-        # ✅ CHANGED: end-box uses Text+tracker; returns tracker too
-        def make_end_box(accent: str, spec: CompactSpec) -> Tuple[VGroup, Text, Text, ValueTracker]:
+        # ✅ CHANGED: end-box uses a glyph counter + tracker; returns tracker too
+        def make_end_box(accent: str, spec: CompactSpec) -> Tuple[VGroup, GlyphCounter, VGroup, ValueTracker]:
             w = _nice_endbox_width(spec, negative_possible)
             h = cfg.endbox_h
 
@@ -705,36 +716,32 @@ class ButterflyChart(Scene):
 
             val_t = ValueTracker(0.0)
 
-            num = Text("0", font="Montserrat", weight=BOLD, font_size=18, color=WHITE).set_z_index(cfg.z_value + 2)
+            # K/M/B suffix is part of the counter's glyph set (smaller, sub color, same baseline)
+            num = GlyphCounter(
+                "0",
+                max_chars=8,
+                font="Montserrat",
+                weight=BOLD,
+                font_size=18,
+                color=WHITE,
+                align="left" if spec.suffix else "center",
+                suffix=spec.suffix,
+                suffix_color=Design.TEXT_SUB,
+                suffix_scale=14 / 18,
+            ).set_z_index(cfg.z_value + 2)
             _high_contrast_text(num)
+            num.suffix_mob.set_stroke(width=0)
 
-            suffix = Text(spec.suffix, font="Montserrat", weight=BOLD, font_size=14, color=Design.TEXT_SUB).set_z_index(cfg.z_value + 2)
-
-            def _layout(m_num: Text):
-                # Keep your previous layout style (same as DecimalNumber branch)
-                if spec.suffix:
-                    m_num.next_to(box.get_left(), RIGHT, buff=cfg.endbox_text_pad).align_to(box, DOWN).shift(UP * 0.10)
-                    suffix.next_to(m_num, RIGHT, buff=0.06).align_to(m_num, DOWN).shift(UP * 0.02)
-                else:
-                    m_num.move_to(box.get_center())
-
-            def _upd_num(m: Mobject):
-                raw = float(val_t.get_value())
-                s = _fmt_compact_value(raw, spec)
-                new = Text(s, font="Montserrat", weight=BOLD, font_size=18, color=WHITE)
-                _high_contrast_text(new)
-                new.set_z_index(cfg.z_value + 2)
-                m.become(new)
-                _layout(m)
-
-            num.add_updater(_upd_num)
-            # keep suffix always on top + in correct place (layout called by num updater too)
-            suffix.add_updater(lambda m: m.set_z_index(cfg.z_value + 2))
+            # Keep your previous layout style (the counter re-lays out around this anchor)
+            if spec.suffix:
+                num.next_to(box.get_left(), RIGHT, buff=cfg.endbox_text_pad).align_to(box, DOWN).shift(UP * 0.10)
+            else:
+                num.move_to(box.get_center())
 
-            _layout(num)
+            num.track(val_t, lambda raw: _fmt_compact_value(raw, spec))
 
-            grp = VGroup(box, num, suffix)
-            return grp, num, suffix, val_t
+            grp = VGroup(box, num)
+            return grp, num, num.suffix_mob, val_t
 
         # ==========================================
         # 7) BATTLE LOOP
@@ -742,190 +749,329 @@ class ButterflyChart(Scene):
         p1_wins = 0
         p2_wins = 0
 
-        active_glow = SurroundingRectangle(round_chips[0][0], corner_radius=0.16).set_z_index(cfg.z_ui + 3)
-        active_glow.set_fill(opacity=0)
-        active_glow.set_stroke(color=WHITE, width=3, opacity=0.25)
-        self.add(active_glow)
-
-        for i, (attr, v1, v2) in enumerate(zip(attrs, p1_vals, p2_vals)):
-            y = start_y - i * row_gap
-
-            stroke_col = Design.CYAN if i % 2 == 0 else Design.PINK
-            node = make_node(attr, stroke_col).move_to([center_x, y, 0])
-
-            left_container = make_bar_container().move_to(
-                [center_x - (node_w / 2) - (bar_max_w / 2) - 0.30, y, 0]
+        if parallel:
+            # --- PARALLEL: all rows grow from ONE tracker; lengths/strings are NumPy vectors ---
+            ys = start_y - np.arange(n_attr) * row_gap
+            v1s = np.array(p1_vals, dtype=float)
+            v2s = np.array(p2_vals, dtype=float)
+            w1s = np.abs(v1s) / max_val * bar_max_w
+            w2s = np.abs(v2s) / max_val * bar_max_w
+
+            node_k = float(min(1.0, (row_gap * 0.92) / (2 * cfg.node_radius)))
+            track_w = bar_max_w + 0.35
+            left_cx = center_x - (node_w / 2) - (bar_max_w / 2) - 0.30
+            right_cx = center_x + (node_w / 2) + (bar_max_w / 2) + 0.30
+
+            specs_l = [_compact_spec_for_target(v) for v in v1s]
+            specs_r = [_compact_spec_for_target(v) for v in v2s]
+            xs_l = _end_box_xs(
+                "L", np.full(n_attr, left_cx - track_w / 2),
+                np.array([_nice_endbox_width(sp, negative_possible) for sp in specs_l]), sf, cfg.endbox_policy,
             )
-            right_container = make_bar_container().move_to(
-                [center_x + (node_w / 2) + (bar_max_w / 2) + 0.30, y, 0]
+            xs_r = _end_box_xs(
+                "R", np.full(n_attr, right_cx + track_w / 2),
+                np.array([_nice_endbox_width(sp, negative_possible) for sp in specs_r]), sf, cfg.endbox_policy,
             )
 
-            stub_l = Line(node.get_left(), left_container.get_right()).set_z_index(cfg.z_track - 1)
-            stub_r = Line(node.get_right(), right_container.get_left()).set_z_index(cfg.z_track - 1)
-            stub_l.set_stroke(color=WHITE, width=2, opacity=0.10)
-            stub_r.set_stroke(color=WHITE, width=2, opacity=0.10)
-
-            spec_l = _compact_spec_for_target(v1)
-            spec_r = _compact_spec_for_target(v2)
-
-            end_l, end_l_num, end_l_suf, end_l_t = make_end_box(Design.CYAN, spec_l)
-            end_r, end_r_num, end_r_suf, end_r_t = make_end_box(Design.PINK, spec_r)
-
-            # AUTO placement (fixes off-screen + "unknown box" clipping)
-            _place_end_box("L", end_l, left_container[0], sf, cfg.endbox_policy)
-            _place_end_box("R", end_r, right_container[0], sf, cfg.endbox_policy)
-
-            # Round start appear
-            if i == 0:
-                self.play(
-                    FadeIn(left_container, shift=LEFT * 0.18),
-                    FadeIn(right_container, shift=RIGHT * 0.18),
-                    FadeIn(node, scale=0.98),
-                    Create(stub_l),
-                    Create(stub_r),
-                    FadeIn(end_l, scale=0.98),
-                    FadeIn(end_r, scale=0.98),
-                    run_time=0.38,
-                    rate_func=rf.ease_out_cubic,
-                )
-            else:
-                self.play(
-                    FadeIn(left_container, shift=LEFT * 0.12),
-                    FadeIn(right_container, shift=RIGHT * 0.12),
-                    FadeIn(node, scale=0.98),
-                    Create(stub_l),
-                    Create(stub_r),
-                    FadeIn(end_l, scale=0.98),
-                    FadeIn(end_r, scale=0.98),
-                    active_glow.animate.become(
-                        SurroundingRectangle(round_chips[i][0], corner_radius=0.16)
-                        .set_fill(opacity=0)
-                        .set_stroke(color=WHITE, width=3, opacity=0.25)
-                        .set_z_index(cfg.z_ui + 3)
-                    ),
-                    run_time=0.34,
-                    rate_func=rf.ease_out_cubic,
-                )
-
-            # Spear targets (abs length)
-            w1 = (abs(float(v1)) / max_val) * bar_max_w
-            w2 = (abs(float(v2)) / max_val) * bar_max_w
-
-            l_start = create_spear(0.12, Design.P1_GRAD, True)
-            r_start = create_spear(0.12, Design.P2_GRAD, False)
-            l_end = create_spear(w1, Design.P1_GRAD, True)
-            r_end = create_spear(w2, Design.P2_GRAD, False)
-
-            l_start.move_to(left_container.get_right())
-            r_start.move_to(right_container.get_left())
-            l_end.move_to(l_start.get_center())
-            r_end.move_to(r_start.get_center())
-
-            self.add(l_start, r_start)
+            row_groups = []
+            ends_l, ends_r = [], []
+            for i, attr in enumerate(attrs):
+                y = float(ys[i])
+                node = make_node(attr, Design.CYAN if i % 2 == 0 else Design.PINK).scale(node_k).move_to([center_x, y, 0])
+                left_container = make_bar_container().move_to([left_cx, y, 0])
+                right_container = make_bar_container().move_to([right_cx, y, 0])
 
-            # Cinematic count-up
-            t1 = ValueTracker(0.0)
-            t2 = ValueTracker(0.0)
+                stub_l = Line(node.get_left(), left_container.get_right()).set_z_index(cfg.z_track - 1)
+                stub_r = Line(node.get_right(), right_container.get_left()).set_z_index(cfg.z_track - 1)
+                stub_l.set_stroke(color=WHITE, width=2, opacity=0.10)
+                stub_r.set_stroke(color=WHITE, width=2, opacity=0.10)
 
-            # ✅ FIX: drive end-box tracker (Text updater handles rendering/layout)
-            def upd_end_l(_, dt):
-                end_l_t.set_value(t1.get_value())
-                self.bring_to_front(end_l_num, end_l_suf, end_l)
+                end_l = make_end_box(Design.CYAN, specs_l[i])[0].move_to([float(xs_l[i]), y, 0])
+                end_r = make_end_box(Design.PINK, specs_r[i])[0].move_to([float(xs_r[i]), y, 0])
+                end_l[1].clear_updaters()  # driven by update_rows below
+                end_r[1].clear_updaters()
+                ends_l.append(end_l)
+                ends_r.append(end_r)
 
-            def upd_end_r(_, dt):
-                end_r_t.set_value(t2.get_value())
-                self.bring_to_front(end_r_num, end_r_suf, end_r)
-
-            end_l.add_updater(upd_end_l)
-            end_r.add_updater(upd_end_r)
+                row_groups.append(VGroup(left_container, right_container, stub_l, stub_r, node, end_l, end_r))
 
             self.play(
-                Transform(l_start, l_end),
-                Transform(r_start, r_end),
-                t1.animate.set_value(float(v1)),
-                t2.animate.set_value(float(v2)),
-                run_time=0.88,
-                rate_func=rf.ease_out_back,
+                LaggedStart(*[FadeIn(g, scale=0.98) for g in row_groups], lag_ratio=0.6 / max(1, n_attr)),
+                run_time=0.6,
+                rate_func=rf.ease_out_cubic,
             )
 
-            end_l.remove_updater(upd_end_l)
-            end_r.remove_updater(upd_end_r)
-
-            # Winner compare
-            winner = 0
-            if v1 > v2:
-                winner = 1
-                p1_wins += 1
-            elif v2 > v1:
-                winner = 2
-                p2_wins += 1
-
-            # Header scores (✅ FIX: animate tracker, not Text)
-            if winner == 1:
-                self.play(p1_score_t.animate.set_value(p1_wins), run_time=0.18, rate_func=rf.ease_out_cubic)
-                self.add_foreground_mobjects(p1_score)  # safe
-            elif winner == 2:
-                self.play(p2_score_t.animate.set_value(p2_wins), run_time=0.18, rate_func=rf.ease_out_cubic)
-                self.add_foreground_mobjects(p2_score)  # safe
-
-            self.bring_to_front(p1_score, p2_score)
-
-            # Meter update (live)
-            total_done = i + 1
-            p1_ratio = p1_wins / max(1, total_done)
-            p2_ratio = p2_wins / max(1, total_done)
+            sh = bar_h * 0.92
+            tip = float(np.clip(cfg.bar_tip_len * (bar_h / 0.48), 0.22, 0.36)) * min(1.0, bar_h / 0.40)
+            base_l = left_cx + track_w / 2 - 0.06
+            base_r = right_cx - track_w / 2 + 0.06
+
+            def spear_pair(grad, sheen_dir):
+                body = VMobject().set_fill(color=grad, opacity=0.92).set_stroke(width=0)
+                body.set_sheen_direction(sheen_dir).set_z_index(cfg.z_bar)
+                outline = VMobject().set_fill(opacity=0).set_stroke(color=WHITE, width=2, opacity=0.25)
+                outline.set_z_index(cfg.z_bar + 1)
+                return body, outline
+
+            l_body, l_outline = spear_pair(Design.P1_GRAD, LEFT)
+            r_body, r_outline = spear_pair(Design.P2_GRAD, RIGHT)
+
+            div_l = np.array([sp.divisor for sp in specs_l])
+            div_r = np.array([sp.divisor for sp in specs_r])
+            plain_l = np.array([sp.suffix == "" for sp in specs_l])
+            plain_r = np.array([sp.suffix == "" for sp in specs_r])
+
+            grow_t = ValueTracker(0.0)
+            starts = np.linspace(0.0, cfg.parallel_stagger, n_attr) if n_attr > 1 else np.zeros(1)
+            span = max(1e-6, 1.0 - cfg.parallel_stagger)
+
+            def update_rows(_):
+                p = np.clip((grow_t.get_value() - starts) / span, 0.0, 1.0)
+                p = 1.0 - (1.0 - p) ** 3  # ease_out_cubic, vectorised
+
+                pts_l = _spear_path_points(base_l, ys, np.maximum(0.02, w1s * p), tip, sh, -1.0)
+                pts_r = _spear_path_points(base_r, ys, np.maximum(0.02, w2s * p), tip, sh, 1.0)
+                l_body.set_points(pts_l)
+                l_outline.set_points(pts_l)
+                r_body.set_points(pts_r)
+                r_outline.set_points(pts_r)
+
+                # counters only touch glyphs when their string actually changes
+                for box, txt in zip(ends_l, _fmt_compact_values(v1s * p, div_l, plain_l)):
+                    box[1].set_text(txt)
+                for box, txt in zip(ends_r, _fmt_compact_values(v2s * p, div_r, plain_r)):
+                    box[1].set_text(txt)
+
+            spears = VGroup(l_body, l_outline, r_body, r_outline)
+            update_rows(spears)
+            self.add(spears)
+            spears.add_updater(update_rows)
+
+            self.play(grow_t.animate.set_value(1.0), run_time=cfg.parallel_run_time, rate_func=linear)
+
+            spears.remove_updater(update_rows)
+            update_rows(spears)
+
+            # results for every row at once
+            p1_wins = int(np.sum(v1s > v2s))
+            p2_wins = int(np.sum(v2s > v1s))
+
+            flashes = []
+            for i in range(n_attr):
+                chip_body = round_chips[i][0]
+                if v1s[i] > v2s[i]:
+                    ends_l[i][0].set_fill(opacity=0.72)
+                    chip_body.set_fill(color=Design.CYAN, opacity=0.22)
+                    chip_body.set_stroke(color=Design.CYAN, width=2.2, opacity=0.95)
+                    flashes.append(Flash([base_l - w1s[i] - tip, ys[i], 0], color=WHITE, line_length=0.30, num_lines=8))
+                elif v2s[i] > v1s[i]:
+                    ends_r[i][0].set_fill(opacity=0.72)
+                    chip_body.set_fill(color=Design.PINK, opacity=0.22)
+                    chip_body.set_stroke(color=Design.PINK, width=2.2, opacity=0.95)
+                    flashes.append(Flash([base_r + w2s[i] + tip, ys[i], 0], color=WHITE, line_length=0.30, num_lines=8))
+                else:
+                    chip_body.set_fill(color=WHITE, opacity=0.06)
+                    chip_body.set_stroke(color=WHITE, width=1.8, opacity=0.30)
+
             half = 2.55 / 2
-            wL = max(0.01, half * p1_ratio)
-            wR = max(0.01, half * p2_ratio)
+            wL = max(0.01, half * p1_wins / max(1, n_attr))
+            wR = max(0.01, half * p2_wins / max(1, n_attr))
 
             self.play(
+                p1_score_t.animate.set_value(p1_wins),
+                p2_score_t.animate.set_value(p2_wins),
                 p1_fill.animate.stretch_to_fit_width(wL).align_to(meter_bg, LEFT),
                 p2_fill.animate.stretch_to_fit_width(wR).align_to(meter_bg, RIGHT),
-                run_time=0.30,
-                rate_func=rf.ease_out_back,
+                *flashes,
+                run_time=0.6,
+                rate_func=rf.ease_out_cubic,
             )
-            self.bring_to_front(p1_fill, p2_fill, meter_mid)
-
-            # Timeline chip mark + pulse
-            chip_body = round_chips[i][0]
-            if winner == 1:
-                chip_body.set_fill(color=Design.CYAN, opacity=0.22)
-                chip_body.set_stroke(color=Design.CYAN, width=2.2, opacity=0.95)
-            elif winner == 2:
-                chip_body.set_fill(color=Design.PINK, opacity=0.22)
-                chip_body.set_stroke(color=Design.PINK, width=2.2, opacity=0.95)
-            else:
-                chip_body.set_fill(color=WHITE, opacity=0.06)
-                chip_body.set_stroke(color=WHITE, width=1.8, opacity=0.30)
+            self.bring_to_front(p1_score, p2_score, p1_fill, p2_fill, meter_mid)
+        else:
+            active_glow = SurroundingRectangle(round_chips[0][0], corner_radius=0.16).set_z_index(cfg.z_ui + 3)
+            active_glow.set_fill(opacity=0)
+            active_glow.set_stroke(color=WHITE, width=3, opacity=0.25)
+            self.add(active_glow)
 
-            # Winner highlight
-            if winner == 1:
-                end_l[0].set_fill(opacity=0.72)
-                self.play(
-                    Flash(tip_point(l_start), color=WHITE, line_length=0.55, num_lines=14),
-                    Indicate(end_l[0], color=Design.CYAN, scale_factor=1.02),
-                    Indicate(round_chips[i][0], color=Design.CYAN, scale_factor=1.02),
-                    run_time=0.36,
-                    rate_func=rf.ease_out_cubic,
+            for i, (attr, v1, v2) in enumerate(zip(attrs, p1_vals, p2_vals)):
+                y = start_y - i * row_gap
+
+                stroke_col = Design.CYAN if i % 2 == 0 else Design.PINK
+                node = make_node(attr, stroke_col).move_to([center_x, y, 0])
+
+                left_container = make_bar_container().move_to(
+                    [center_x - (node_w / 2) - (bar_max_w / 2) - 0.30, y, 0]
                 )
-            elif winner == 2:
-                end_r[0].set_fill(opacity=0.72)
-                self.play(
-                    Flash(tip_point(r_start), color=WHITE, line_length=0.55, num_lines=14),
-                    Indicate(end_r[0], color=Design.PINK, scale_factor=1.02),
-                    Indicate(round_chips[i][0], color=Design.PINK, scale_factor=1.02),
-                    run_time=0.36,
-                    rate_func=rf.ease_out_cubic,
+                right_container = make_bar_container().move_to(
+                    [center_x + (node_w / 2) + (bar_max_w / 2) + 0.30, y, 0]
                 )
-            else:
+
+                stub_l = Line(node.get_left(), left_container.get_right()).set_z_index(cfg.z_track - 1)
+                stub_r = Line(node.get_right(), right_container.get_left()).set_z_index(cfg.z_track - 1)
+                stub_l.set_stroke(color=WHITE, width=2, opacity=0.10)
+                stub_r.set_stroke(color=WHITE, width=2, opacity=0.10)
+
+                spec_l = _compact_spec_for_target(v1)
+                spec_r = _compact_spec_for_target(v2)
+
+                end_l, end_l_num, end_l_suf, end_l_t = make_end_box(Design.CYAN, spec_l)
+                end_r, end_r_num, end_r_suf, end_r_t = make_end_box(Design.PINK, spec_r)
+
+                # AUTO placement (fixes off-screen + "unknown box" clipping)
+                _place_end_box("L", end_l, left_container[0], sf, cfg.endbox_policy)
+                _place_end_box("R", end_r, right_container[0], sf, cfg.endbox_policy)
+
+                # Round start appear
+                if i == 0:
+                    self.play(
+                        FadeIn(left_container, shift=LEFT * 0.18),
+                        FadeIn(right_container, shift=RIGHT * 0.18),
+                        FadeIn(node, scale=0.98),
+                        Create(stub_l),
+                        Create(stub_r),
+                        FadeIn(end_l, scale=0.98),
+                        FadeIn(end_r, scale=0.98),
+                        run_time=0.38,
+                        rate_func=rf.ease_out_cubic,
+                    )
+                else:
+                    self.play(
+                        FadeIn(left_container, shift=LEFT * 0.12),
+                        FadeIn(right_container, shift=RIGHT * 0.12),
+                        FadeIn(node, scale=0.98),
+                        Create(stub_l),
+                        Create(stub_r),
+                        FadeIn(end_l, scale=0.98),
+                        FadeIn(end_r, scale=0.98),
+                        active_glow.animate.become(
+                            SurroundingRectangle(round_chips[i][0], corner_radius=0.16)
+                            .set_fill(opacity=0)
+                            .set_stroke(color=WHITE, width=3, opacity=0.25)
+                            .set_z_index(cfg.z_ui + 3)
+                        ),
+                        run_time=0.34,
+                        rate_func=rf.ease_out_cubic,
+                    )
+
+                # Spear targets (abs length)
+                w1 = (abs(float(v1)) / max_val) * bar_max_w
+                w2 = (abs(float(v2)) / max_val) * bar_max_w
+
+                l_start = create_spear(0.12, Design.P1_GRAD, True)
+                r_start = create_spear(0.12, Design.P2_GRAD, False)
+                l_end = create_spear(w1, Design.P1_GRAD, True)
+                r_end = create_spear(w2, Design.P2_GRAD, False)
+
+                l_start.move_to(left_container.get_right())
+                r_start.move_to(right_container.get_left())
+                l_end.move_to(l_start.get_center())
+                r_end.move_to(r_start.get_center())
+
+                self.add(l_start, r_start)
+
+                # Cinematic count-up
+                t1 = ValueTracker(0.0)
+                t2 = ValueTracker(0.0)
+
+                # ✅ FIX: drive end-box tracker (counter updater handles rendering/layout)
+                def upd_end_l(_, dt):
+                    end_l_t.set_value(t1.get_value())
+                    self.bring_to_front(end_l_num, end_l_suf, end_l)
+
+                def upd_end_r(_, dt):
+                    end_r_t.set_value(t2.get_value())
+                    self.bring_to_front(end_r_num, end_r_suf, end_r)
+
+                end_l.add_updater(upd_end_l)
+                end_r.add_updater(upd_end_r)
+
                 self.play(
-                    Indicate(node[1], color=WHITE, scale_factor=1.02),
-                    Indicate(round_chips[i][0], color=WHITE, scale_factor=1.02),
-                    run_time=0.28,
-                    rate_func=rf.ease_out_cubic,
+                    Transform(l_start, l_end),
+                    Transform(r_start, r_end),
+                    t1.animate.set_value(float(v1)),
+                    t2.animate.set_value(float(v2)),
+                    run_time=0.88,
+                    rate_func=rf.ease_out_back,
                 )
 
-            self.wait(0.08)
+                end_l.remove_updater(upd_end_l)
+                end_r.remove_updater(upd_end_r)
+
+                # Winner compare
+                winner = 0
+                if v1 > v2:
+                    winner = 1
+                    p1_wins += 1
+                elif v2 > v1:
+                    winner = 2
+                    p2_wins += 1
+
+                # Header scores (✅ FIX: animate tracker, not Text)
+                if winner == 1:
+                    self.play(p1_score_t.animate.set_value(p1_wins), run_time=0.18, rate_func=rf.ease_out_cubic)
+                    self.add_foreground_mobjects(p1_score)  # safe
+                elif winner == 2:
+                    self.play(p2_score_t.animate.set_value(p2_wins), run_time=0.18, rate_func=rf.ease_out_cubic)
+                    self.add_foreground_mobjects(p2_score)  # safe
+
+                self.bring_to_front(p1_score, p2_score)
+
+                # Meter update (live)
+                total_done = i + 1
+                p1_ratio = p1_wins / max(1, total_done)
+                p2_ratio = p2_wins / max(1, total_done)
+                half = 2.55 / 2
+                wL = max(0.01, half * p1_ratio)
+                wR = max(0.01, half * p2_ratio)
+
+                self.play(
+                    p1_fill.animate.stretch_to_fit_width(wL).align_to(meter_bg, LEFT),
+                    p2_fill.animate.stretch_to_fit_width(wR).align_to(meter_bg, RIGHT),
+                    run_time=0.30,
+                    rate_func=rf.ease_out_back,
+                )
+                self.bring_to_front(p1_fill, p2_fill, meter_mid)
+
+                # Timeline chip mark + pulse
+                chip_body = round_chips[i][0]
+                if winner == 1:
+                    chip_body.set_fill(color=Design.CYAN, opacity=0.22)
+                    chip_body.set_stroke(color=Design.CYAN, width=2.2, opacity=0.95)
+                elif winner == 2:
+                    chip_body.set_fill(color=Design.PINK, opacity=0.22)
+                    chip_body.set_stroke(color=Design.PINK, width=2.2, opacity=0.95)
+                else:
+                    chip_body.set_fill(color=WHITE, opacity=0.06)
+                    chip_body.set_stroke(color=WHITE, width=1.8, opacity=0.30)
+
+                # Winner highlight
+                if winner == 1:
+                    end_l[0].set_fill(opacity=0.72)
+                    self.play(
+                        Flash(tip_point(l_start), color=WHITE, line_length=0.55, num_lines=14),
+                        Indicate(end_l[0], color=Design.CYAN, scale_factor=1.02),
+                        Indicate(round_chips[i][0], color=Design.CYAN, scale_factor=1.02),
+                        run_time=0.36,
+                        rate_func=rf.ease_out_cubic,
+                    )
+                elif winner == 2:
+                    end_r[0].set_fill(opacity=0.72)
+                    self.play(
+                        Flash(tip_point(r_start), color=WHITE, line_length=0.55, num_lines=14),
+                        Indicate(end_r[0], color=Design.PINK, scale_factor=1.02),
+                        Indicate(round_chips[i][0], color=Design.PINK, scale_factor=1.02),
+                        run_time=0.36,
+                        rate_func=rf.ease_out_cubic,
+                    )
+                else:
+                    self.play(
+                        Indicate(node[1], color=WHITE, scale_factor=1.02),
+                        Indicate(round_chips[i][0], color=WHITE, scale_factor=1.02),
+                        run_time=0.28,
+                        rate_func=rf.ease_out_cubic,
+                    )
+
+                self.wait(0.08)
 
         # ==========================================
         # 8) WINNER ANNOUNCEMENT
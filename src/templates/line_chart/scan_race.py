@@ -714,7 +714,6 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 from manim import *
 from manim import rate_functions as rf
 
@@ -723,77 +722,30 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
-# --- IMPORTS (Robust) ---
-try:
-    from src.config import DATA_DIR, BACKGROUND_COLOR, Theme
-    from src.utils import (
-        Brand,
-        get_safe_frame,
-        clamp_x,
-        clamp_y,
-        make_floating_particles,
-        get_branding_border_lines,
-        get_cinematic_overlay,
-        get_rotating_watermark,
-    )
-except Exception:
-    DATA_DIR = "./Data"
-    BACKGROUND_COLOR = "#050505"
-
-    class Theme:
-        NEON_BLUE = "#00F0FF"
-        NEON_PINK = "#FF0055"
-        NEON_PURPLE = "#BD00FF"
-        NEON_GREEN = "#00FF66"
-        TEXT_MAIN = "#FFFFFF"
-        TEXT_SUB = "#B8B8B8"
-
-    class Brand:
-        CYAN = "#00F0FF"
-        PINK = "#FF0055"
-        GREEN = "#00FF66"
-        WHITE = "#FFFFFF"
-        TEXT_MAIN = "#FFFFFF"
-        TEXT_SUB = "#B8B8B8"
-
-    config.frame_height = 16.0
-    config.frame_width = 9.0
-
-    def get_safe_frame(margin=0.70):
-        half_w = config.frame_width / 2
-        half_h = config.frame_height / 2
-        return {
-            "left": -half_w + margin,
-            "right": half_w - margin,
-            "top": half_h - margin,
-            "bottom": -half_h + margin,
-            "w": config.frame_width - (2 * margin),
-            "h": config.frame_height - (2 * margin),
-            "cx": 0.0,
-            "cy": 0.0,
-        }
-
-    def clamp_x(x, mob_width=0.0, margin=0.70):
-        sf = get_safe_frame(margin)
-        half = float(mob_width) / 2
-        return float(np.clip(x, sf["left"] + half, sf["right"] - half))
-
-    def clamp_y(y, mob_height=0.0, margin=0.70):
-        sf = get_safe_frame(margin)
-        half = float(mob_height) / 2
-        return float(np.clip(y, sf["bottom"] + half, sf["top"] - half))
-
-    def make_floating_particles(*args, **kwargs):
-        return VGroup()
-
-    def get_branding_border_lines(*args, **kwargs):
-        return (VGroup(), VGroup(), VGroup(), VGroup())
-
-    def get_cinematic_overlay(*args, **kwargs):
-        return VGroup()
-
-    def get_rotating_watermark(*args, **kwargs):
-        return VGroup()
+# --- IMPORTS ---
+# The race engine (src.race_timeline, src.data streaming/ingest, src.primitives) has no
+# standalone stand-in, so this template needs the project package; no fallback block.
+from src.config import DATA_DIR, BACKGROUND_COLOR, Theme
+from src.utils import (
+    Brand,
+    get_safe_frame,
+    clamp_x,
+    clamp_y,
+    make_floating_particles,
+    get_branding_border_lines,
+    get_cinematic_overlay,
+    get_rotating_watermark,
+)
+from src.data.ingest import META_LINES, load_dataset, parse_meta
+from src.data.schemas import RACE_SCHEMA
+from src.data.stream import RANK_FINAL, RANK_PEAK, should_stream, stream_race
+from src.lazy import lazy_import
+from src.layout import resolve_label_boxes
+from src.primitives import GlyphCounter, NumberCounter, rect_path_points
+from src.race_timeline import RaceTimeline
+from src.text_prewarm import prewarm_texts, text_spec
+
+pd = lazy_import("pandas")
 
 
 # ==========================
@@ -845,33 +797,17 @@ class RaceMeta:
     topk: int = 5
     max_series: int = 10  # clean by default (user preference)
     unit_suffix: str = "T"
+    bar_rows: int = 10  # BarChartRace: ranks on screen
+    period: float = 1.0  # big (streamed) CSVs only: bucket width in years
+    agg: str = "last"  # big (streamed) CSVs only: last / mean / sum / max inside a bucket
 
 
 def _parse_meta_lines(path: str) -> Dict[str, str]:
     """
     Supports leading '#KEY=VALUE' lines until first non-# line.
-    Keys: TITLE, SUB, FEED, FOOTER, TOPK, MAX_SERIES, UNIT
+    Keys: TITLE, SUB, FEED, FOOTER, TOPK, MAX_SERIES, UNIT, BARS, PERIOD, AGG
     """
-    meta: Dict[str, str] = {}
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            for raw in f:
-                line = raw.strip()
-                if not line:
-                    continue
-                if not line.startswith("#"):
-                    break
-                line = line[1:].strip()
-                if "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                k = k.strip().upper()
-                v = v.strip()
-                if k and v:
-                    meta[k] = v
-    except Exception:
-        pass
-    return meta
+    return parse_meta(path, META_LINES)
 
 
 def _resolve_race_meta(meta: Dict[str, str]) -> RaceMeta:
@@ -888,6 +824,12 @@ def _resolve_race_meta(meta: Dict[str, str]) -> RaceMeta:
     topk = max(1, _int("TOPK", RaceMeta.topk))
     max_series = max(1, _int("MAX_SERIES", RaceMeta.max_series))
     unit_suffix = meta.get("UNIT", RaceMeta.unit_suffix)
+    bar_rows = max(1, _int("BARS", RaceMeta.bar_rows))
+    try:
+        period = max(0.0, float(meta.get("PERIOD", RaceMeta.period)))
+    except Exception:
+        period = RaceMeta.period
+    agg = meta.get("AGG", RaceMeta.agg).strip().lower()
     return RaceMeta(
         title=title,
         subtitle=subtitle,
@@ -896,11 +838,15 @@ def _resolve_race_meta(meta: Dict[str, str]) -> RaceMeta:
         topk=topk,
         max_series=max_series,
         unit_suffix=unit_suffix,
+        bar_rows=bar_rows,
+        period=period,
+        agg=agg,
     )
 
 
-def _find_race_csv() -> Optional[str]:
-    candidates = [
+def data_candidates() -> List[str]:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [
         os.path.join(DATA_DIR, "race_data.csv"),
         os.path.join(project_root, "Data", "race_data.csv"),
         os.path.join(current_dir, "Data", "race_data.csv"),
@@ -908,26 +854,42 @@ def _find_race_csv() -> Optional[str]:
         os.path.join(project_root, "race_data.csv"),
         "race_data.csv",
     ]
-    return next((p for p in candidates if os.path.exists(p)), None)
 
 
-def _load_race_df(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path, comment="#")
-    df.columns = df.columns.str.strip()
-    # year column = first column; rest numeric
-    if df.shape[1] < 2:
-        raise ValueError("race_data.csv must have at least 2 columns: Year + 1 series.")
-    # coerce numbers safely
-    for c in df.columns[1:]:
-        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0.0)
-    df[df.columns[0]] = pd.to_numeric(df[df.columns[0]], errors="coerce").fillna(0.0)
-    df = df.dropna().reset_index(drop=True)
-    return df
+def _find_race_csv() -> Optional[str]:
+    return next((p for p in data_candidates() if os.path.exists(p)), None)
+
+
+def _load_race_df(path: str, meta: RaceMeta = RaceMeta(), keep: int = 0, rank_by: str = RANK_FINAL) -> pd.DataFrame:
+    # multi-million-row exports: streamed in chunks, reduced to `keep` series x meta.period buckets
+    if keep > 0 and should_stream(path):
+        return stream_race(path, keep, period=meta.period, agg=meta.agg, rank_by=rank_by).frame()
+    # parsed + coerced once per file (src/data cache), year column first, series numeric
+    return load_dataset(path, RACE_SCHEMA).frame()
+
+
+def _demo_race_df() -> pd.DataFrame:
+    years = np.arange(2000, 2025)
+    data = {
+        "Year": years,
+        "USA": np.linspace(10, 26, 25),
+        "China": np.linspace(2, 24, 25) * 1.15,
+        "Japan": np.linspace(5, 6, 25),
+        "Germany": np.linspace(2, 5, 25),
+        "India": np.exp(np.linspace(0.5, 3.2, 25)),
+        "UK": np.linspace(1.5, 3.8, 25),
+        "France": np.linspace(1.4, 3.5, 25),
+    }
+    return pd.DataFrame(data)
 
 
 class CinematicLineRace(Scene):
+    # the dock's rank-change pulses are sampled per frame (update_dock), so a replayed
+    # play can't rebuild them: no crash resume (src/checkpoint.py)
+    resumable = False
+
     def construct(self):
-        self.camera.background_color = BACKGROUND_COLOR if "BACKGROUND_COLOR" in globals() else Design.BG
+        self.camera.background_color = BACKGROUND_COLOR
 
         csv_path = _find_race_csv()
         meta = RaceMeta()
@@ -972,21 +934,7 @@ class CinematicLineRace(Scene):
         # ==========================================
         sf = get_safe_frame(margin=0.70)
 
-        if csv_path:
-            df = _load_race_df(csv_path)
-        else:
-            years = np.arange(2000, 2025)
-            data = {
-                "Year": years,
-                "USA": np.linspace(10, 26, 25),
-                "China": np.linspace(2, 24, 25) * 1.15,
-                "Japan": np.linspace(5, 6, 25),
-                "Germany": np.linspace(2, 5, 25),
-                "India": np.exp(np.linspace(0.5, 3.2, 25)),
-                "UK": np.linspace(1.5, 3.8, 25),
-                "France": np.linspace(1.4, 3.5, 25),
-            }
-            df = pd.DataFrame(data)
+        df = _load_race_df(csv_path, meta, keep=meta.max_series) if csv_path else _demo_race_df()
 
         years = df.iloc[:, 0].values.astype(float)
         labels_all = list(df.columns[1:])
@@ -1001,6 +949,7 @@ class CinematicLineRace(Scene):
             labels = labels_all
 
         series = {c: df[c].values.astype(float) for c in labels}
+        timeline = RaceTimeline(years, df[labels].values.astype(float), labels)
 
         min_year, max_year = float(np.min(years)), float(np.max(years))
         raw_max = float(df[labels].max().max()) if labels else 0.0
@@ -1256,21 +1205,12 @@ class CinematicLineRace(Scene):
             lbl.next_to(pos, LEFT, buff=0.12)
             y_labels.add(lbl)
 
-        wm = Text(str(int(min_year)), font="Montserrat", weight=BOLD, font_size=130)
+        # year watermark: prebuilt glyphs, only re-laid out when the year changes
+        wm = GlyphCounter(str(int(min_year)), max_chars=6, font="Montserrat", weight=BOLD, font_size=130)
         wm.set_stroke(color=WHITE, width=2, opacity=0.10)
         wm.set_fill(color=WHITE, opacity=0.04)
         wm.move_to([sf["cx"], plot_center_y + 0.4, 0]).set_z_index(1)
-
-        def wm_updater(m):
-            m.become(
-                Text(str(int(self.tracker.get_value())), font="Montserrat", weight=BOLD, font_size=130)
-                .set_stroke(color=WHITE, width=2, opacity=0.10)
-                .set_fill(color=WHITE, opacity=0.04)
-                .move_to([sf["cx"], plot_center_y + 0.4, 0])
-                .set_z_index(1)
-            )
-
-        wm.add_updater(lambda m: wm_updater(m))
+        wm.track(self.tracker, lambda t: str(int(t)))
 
         self.play(
             FadeIn(ax, run_time=0.35),
@@ -1349,8 +1289,7 @@ class CinematicLineRace(Scene):
 
         def chips_group():
             t = float(self.tracker.get_value())
-            scores = [(c, interp_value(c, t)) for c in labels]
-            scores.sort(key=lambda x: x[1], reverse=True)
+            scores = timeline.scores(t)
             top = scores[:TOPK]
 
             chips = []
@@ -1375,16 +1314,16 @@ class CinematicLineRace(Scene):
 
                 chips.append([c, p, col, box, txt, cx, cy])
 
-            # vertical repel
-            chips.sort(key=lambda k: k[6], reverse=True)
-            min_gap = 0.38
-            for i in range(1, len(chips)):
-                prev = chips[i - 1]
-                cur = chips[i]
-                if prev[6] - cur[6] < min_gap:
-                    cur[6] = prev[6] - min_gap
-            for ch in chips:
-                ch[6] = clampy_to_plot(ch[6], ch[3].height)
+            # vertical repel (shared placement engine, stays inside the plot)
+            if chips:
+                pos = resolve_label_boxes(
+                    [(ch[5], ch[6], ch[3].width, ch[3].height) for ch in chips],
+                    y_min=plot_bounds["bottom"],
+                    y_max=plot_bounds["top"],
+                    gap=0.04,
+                )
+                for ch, (_, cy) in zip(chips, pos):
+                    ch[6] = float(cy)
 
             g = VGroup()
             for (c, p, col, box, txt, cx, cy) in chips:
@@ -1409,8 +1348,7 @@ class CinematicLineRace(Scene):
 
         def update_dock(m, dt):
             t = float(self.tracker.get_value())
-            scores = [(c, interp_value(c, t)) for c in labels]
-            scores.sort(key=lambda x: x[1], reverse=True)
+            scores = timeline.scores(t)
 
             for r, (c, _) in enumerate(scores):
                 self.current_ranks[c] = r
@@ -1488,3 +1426,222 @@ class CinematicLineRace(Scene):
 
 
 
+
+
+# ==========================
+# BAR RACE (same CSV + timeline as the line race)
+# ==========================
+BAR_RACE_SEC_PER_YEAR = 0.45
+BAR_RACE_MIN_SEC = 8.0
+BAR_RACE_MAX_SEC = 40.0
+BAR_RACE_NAME_FS = 18
+BAR_RACE_VALUE_FS = 20
+
+
+class BarChartRace(Scene):
+    """
+    Classic bar-chart race: bars overtake each other year by year.
+    Values, ranks and eased slot positions for every frame come precomputed from
+    RaceTimeline; a fixed pool of rows (ranks on screen + 2) is re-bound to whichever
+    series currently occupy the screen, so the frame cost doesn't grow with the CSV.
+    """
+
+    def construct(self):
+        self.camera.background_color = BACKGROUND_COLOR
+
+        csv_path = _find_race_csv()
+        meta = RaceMeta()
+        if csv_path:
+            meta = _resolve_race_meta(_parse_meta_lines(csv_path))
+
+        sf = get_safe_frame(margin=0.70)
+
+        # ==========================================
+        # 1) DATA -> TIMELINE (all per-frame arrays up front)
+        # ==========================================
+        # streamed CSVs keep 2x the on-screen rows, by peak: anything that can reach the board
+        df = _load_race_df(csv_path, meta, keep=2 * meta.bar_rows, rank_by=RANK_PEAK) if csv_path else _demo_race_df()
+        years = df.iloc[:, 0].values.astype(float)
+        labels = list(df.columns[1:])
+        timeline = RaceTimeline(years, df[labels].values.astype(float), labels)
+
+        min_year, max_year = float(np.min(years)), float(np.max(years))
+        rows_n = int(min(max(1, meta.bar_rows), len(labels)))
+        pool_n = min(len(labels), rows_n + 2)  # +2: one row leaving, one entering
+
+        fps = float(config.frame_rate)
+        run_time = float(np.clip((max_year - min_year) * BAR_RACE_SEC_PER_YEAR, BAR_RACE_MIN_SEC, BAR_RACE_MAX_SEC))
+        n_frames = int(round(run_time * fps)) + 1
+        frames = timeline.precompute(min_year, max_year, n_frames, keep=pool_n, fps=fps)
+
+        names_up = [str(c).upper() for c in labels]
+        color_map = [RACE_COLORS[i % len(RACE_COLORS)] for i in range(len(labels))]
+
+        prewarm_texts(
+            [text_spec(n, font="Montserrat", weight=BOLD, font_size=BAR_RACE_NAME_FS, color=WHITE) for n in names_up]
+        )
+
+        # ==========================================
+        # 2) FRAME + HEADER
+        # ==========================================
+        top, right, bottom, left = get_branding_border_lines(stroke_w=6, opacity=1.0)
+        overlay = get_cinematic_overlay(self, feed_text=meta.feed_text, footer_text=meta.footer_text)
+        watermark = get_rotating_watermark()
+        self.add(overlay, watermark)
+
+        grid = NumberPlane(
+            x_range=[-10, 10, 2],
+            y_range=[-16, 16, 2],
+            background_line_style={"stroke_color": Design.CYAN, "stroke_width": 1, "stroke_opacity": Design.GRID_OP},
+            axis_config={"stroke_width": 0},
+        )
+        self.add(grid)
+
+        header_y = sf["top"] - 0.75
+        title = Text(meta.title, font="Montserrat", weight=BOLD, font_size=42, color=Design.TEXT_MAIN)
+        if title.width > sf["w"]:
+            title.scale_to_fit_width(sf["w"])
+        title.move_to([sf["cx"], header_y, 0]).set_z_index(60)
+
+        underline = Line(LEFT * 2.8, RIGHT * 2.8)
+        underline.set_stroke(width=4, color=[Design.PINK, Design.CYAN])
+        underline.next_to(title, DOWN, buff=0.18).set_z_index(60)
+
+        subtitle = Text(meta.subtitle, font="Montserrat", font_size=18, color=Design.TEXT_SUB)
+        subtitle.next_to(underline, DOWN, buff=0.20).set_z_index(60)
+
+        self.play(
+            Create(top), Create(right), Create(bottom), Create(left),
+            Write(title, run_time=0.55),
+            GrowFromCenter(underline, run_time=0.55),
+            FadeIn(subtitle, shift=UP * 0.1, run_time=0.45),
+            run_time=0.75,
+            rate_func=rf.ease_out_cubic,
+        )
+
+        # ==========================================
+        # 3) LAYOUT
+        # ==========================================
+        area_top = subtitle.get_bottom()[1] - 0.45
+        area_bottom = sf["bottom"] + 0.90
+        row_h = (area_top - area_bottom) / rows_n
+        bar_h = min(0.62, row_h * 0.70)
+
+        name_w = 2.0
+        bar_x0 = sf["left"] + name_w + 0.15
+        value_gutter = 1.35
+        bar_max_w = (sf["right"] - value_gutter) - bar_x0
+
+        axis = Line([bar_x0, area_top + 0.15, 0], [bar_x0, area_bottom - 0.15, 0])
+        axis.set_stroke(color=Design.CYAN, width=2, opacity=Design.AXIS_OP).set_z_index(15)
+
+        year_txt = GlyphCounter(str(int(min_year)), max_chars=6, font="Montserrat", weight=BOLD, font_size=110, align="right")
+        year_txt.set_fill(color=WHITE, opacity=0.10).set_stroke(width=0)
+        year_anchor = np.array([sf["right"] - 0.10, area_bottom + 0.20, 0])
+        year_txt.move_to(year_anchor - [year_txt.width / 2, -year_txt.height / 2, 0]).set_z_index(5)
+
+        self.play(Create(axis), FadeIn(year_txt), run_time=0.4)
+
+        # ==========================================
+        # 4) ROW POOL
+        # ==========================================
+        def make_row():
+            bar = VMobject().set_stroke(width=0).set_z_index(20)
+            name = Text("-", font="Montserrat", weight=BOLD, font_size=BAR_RACE_NAME_FS, color=WHITE).set_z_index(22)
+            val = NumberCounter(0, num_decimal_places=1, font_size=BAR_RACE_VALUE_FS, color=WHITE).set_z_index(22)
+            grp = VGroup(bar, name, val)
+            unit = None
+            if meta.unit_suffix:
+                unit = Text(meta.unit_suffix, font="Arial", weight=BOLD, font_size=16, color=Design.TEXT_SUB)
+                grp.add(unit.set_z_index(22))
+            grp.set_opacity(0)
+            return {"series": -1, "group": grp, "bar": bar, "name": name, "val": val, "unit": unit,
+                    "shown": None, "alpha": 0.0}
+
+        rows = [make_row() for _ in range(pool_n)]
+        free = list(range(pool_n))
+        bound: Dict[int, int] = {}  # series id -> row index
+
+        def bind(row, s):
+            nm = Text(names_up[s], font="Montserrat", weight=BOLD, font_size=BAR_RACE_NAME_FS, color=WHITE)
+            if nm.width > name_w:
+                nm.scale_to_fit_width(name_w)
+            row["name"].become(nm).set_z_index(22)
+            row["bar"].set_fill(color_map[s])  # opacity: 0.92 x the row alpha, set in update_race
+            row["series"] = s
+            row["shown"] = None
+            row["alpha"] = None
+
+        frame = ValueTracker(0)
+
+        def update_race(_):
+            f = int(np.clip(round(frame.get_value()), 0, n_frames - 1))
+            vis = frames.visible[f]
+
+            # release rows whose series left the screen, then bind newcomers
+            want = set(int(s) for s in vis)
+            for s in [s for s in bound if s not in want]:
+                ri = bound.pop(s)
+                rows[ri]["group"].set_opacity(0)
+                rows[ri]["series"] = -1
+                rows[ri]["alpha"] = 0.0
+                free.append(ri)
+            for s in vis:
+                s = int(s)
+                if s not in bound:
+                    bound[s] = free.pop()
+                    bind(rows[bound[s]], s)
+
+            pos = frames.pos[f, vis]
+            ys = area_top - (pos + 0.5) * row_h
+            vals = frames.values[f, vis]
+            widths = np.clip(vals / frames.scale[f] * bar_max_w, 0.04, bar_max_w)
+            alphas = np.round(np.clip(rows_n - pos, 0.0, 1.0) * 8) / 8  # fade out below the last rank
+
+            for k, s in enumerate(vis):
+                row = rows[bound[int(s)]]
+                y = float(ys[k])
+                w = float(widths[k])
+
+                row["bar"].set_points(
+                    rect_path_points(
+                        np.array([bar_x0]), np.array([y - bar_h / 2]), np.array([bar_x0 + w]), np.array([y + bar_h / 2])
+                    )
+                )
+                row["name"].move_to([bar_x0 - 0.12 - row["name"].width / 2, y, 0])
+
+                shown = round(float(vals[k]), 1)
+                if shown != row["shown"]:
+                    row["val"].set_value(shown)
+                    row["shown"] = shown
+                row["val"].move_to([bar_x0 + w + 0.12 + row["val"].width / 2, y, 0])
+                if row["unit"] is not None:
+                    row["unit"].next_to(row["val"], RIGHT, buff=0.05)
+
+                a = float(alphas[k])
+                if a != row["alpha"]:
+                    row["bar"].set_fill(opacity=0.92 * a)
+                    for mob in row["group"][1:]:
+                        mob.set_opacity(a)
+                    row["alpha"] = a
+
+            year_txt.set_text(str(int(np.floor(frames.times[f]))))
+
+        race = VGroup(*[r["group"] for r in rows])
+        update_race(race)
+        self.add(race)
+        race.add_updater(update_race)
+
+        # ==========================================
+        # 5) LAUNCH
+        # ==========================================
+        self.play(frame.animate.set_value(n_frames - 1), run_time=run_time, rate_func=linear)
+        race.remove_updater(update_race)
+
+        leader = rows[bound[int(frames.visible[-1][0])]]
+        self.play(
+            Flash(leader["bar"].get_right(), color=WHITE, line_length=0.6, flash_radius=0.35),
+            Indicate(leader["name"], color=Design.GOLD, scale_factor=1.08),
+            run_time=0.6,
+        )
+        self.wait(2)
@@ -1,6 +1,5 @@
 import os
 import sys
-import pandas as pd
 import numpy as np
 
 from manim import *
@@ -14,6 +13,15 @@ sys.path.append(project_root)
 from src.config import DATA_DIR, ASSETS_DIR, BACKGROUND_COLOR, Theme
 from src.utils import IntroManager, get_safe_frame, make_floating_particles
 from src.data.map_coords import COORDINATES
+from src.data.ingest import load_dataset, parse_meta
+from src.data.schemas import MAP_SCHEMA
+from src.data.stream import AGG_SUM, should_stream, stream_map
+from src.layout import resolve_label_boxes
+from src.segments import SegmentCache
+from src.text_prewarm import prewarm_texts, text_spec
+from src.lazy import lazy_import
+
+pd = lazy_import("pandas")
 
 # ===========================
 # MAP CALIBRATION
@@ -40,18 +48,7 @@ def _parse_meta_first_line(path: str) -> dict:
         "UNIT": "pts",
         "MAX": "10",
     }
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            first = f.readline().strip()
-        if first.startswith("#"):
-            first = first[1:]
-            parts = [p.strip() for p in first.split(",") if p.strip()]
-            for p in parts:
-                if "=" in p:
-                    k, v = p.split("=", 1)
-                    meta[k.strip().upper()] = v.strip()
-    except Exception:
-        pass
+    meta.update(parse_meta(path))
     return meta
 
 
@@ -68,7 +65,22 @@ def _safe_int(x, default=None):
         return default
 
 
-def _pick_compare_cols(df: pd.DataFrame):
+def _format_map_value(row_obj, value, mode, unit, compare_a=None, compare_b=None) -> str:
+    iv = _safe_int(value, default=None)
+    if mode == "COMPARE" and compare_a and compare_b:
+        a = _safe_int(row_obj.get(compare_a), default=None)
+        b = _safe_int(row_obj.get(compare_b), default=None)
+        if a is None and b is None:
+            return "–"
+        a = a if a is not None else 0
+        b = b if b is not None else 0
+        return f"{a}|{b}"
+    if iv is None:
+        return "–"
+    return f"{iv}{unit}" if unit else f"{iv}"
+
+
+def _pick_compare_cols(df: "pd.DataFrame"):
     cols = {c.lower(): c for c in df.columns}
     pairs = [
         ("valuea", "valueb"),
@@ -83,6 +95,11 @@ def _pick_compare_cols(df: pd.DataFrame):
     return None, None
 
 
+def data_candidates() -> list:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [os.path.join(DATA_DIR, "map_data.csv")]
+
+
 class GeoUniversalMap(Scene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
@@ -164,7 +181,7 @@ class GeoUniversalMap(Scene):
         # ===========================
         # LOAD DATA + META
         # ===========================
-        csv_path = os.path.join(DATA_DIR, "map_data.csv")
+        csv_path = data_candidates()[0]
         if not os.path.exists(csv_path):
             raise FileNotFoundError("CRITICAL: map_data.csv nahi mila.")
 
@@ -179,19 +196,12 @@ class GeoUniversalMap(Scene):
             max_items = 10
         max_items = int(np.clip(max_items, 1, 10))
 
-        df = pd.read_csv(csv_path, comment="#")
-        df.columns = [c.strip().title() for c in df.columns]
-
-        if "Country" not in df.columns:
-            raise ValueError("CSV must have column: Country")
-
-        if "Group" not in df.columns:
-            df["Group"] = "Global"
-        if "Value" not in df.columns:
-            df["Value"] = np.nan
-
-        df["Country"] = df["Country"].astype(str).str.strip()
-        df["Group"] = df["Group"].astype(str).str.strip()
+        # Country / Group / Value (+ compare cols), parsed once per file (src/data cache);
+        # huge exports are streamed and rolled up to one row per country (AGG=sum|mean|max|last)
+        if should_stream(csv_path):
+            df = stream_map(csv_path, agg=meta.get("AGG", AGG_SUM).strip().lower()).frame()
+        else:
+            df = load_dataset(csv_path, MAP_SCHEMA).frame()
 
         df = df[df["Country"].isin(COORDINATES.keys())].copy()
         df = df.head(max_items).reset_index(drop=True)
@@ -202,6 +212,18 @@ class GeoUniversalMap(Scene):
 
         compare_a, compare_b = _pick_compare_cols(df)
 
+        # Prewarm card labels (same kwargs as make_card) before anything animates
+        card_specs = []
+        for _, row in df.iterrows():
+            col = group_color_map.get(row["Group"], Theme.NEON_BLUE)
+            val_str = _format_map_value(row, row["Value"], mode, unit, compare_a, compare_b)
+            card_specs += [
+                text_spec(str(row["Country"]).upper(), font="Montserrat", weight=BOLD, font_size=18, color=WHITE),
+                text_spec(str(row["Group"]), font="Montserrat", font_size=12, color=Theme.TEXT_SUB),
+                text_spec(val_str, font="Arial", weight=BOLD, font_size=16, color=col),
+            ]
+        prewarm_texts(card_specs)
+
         # ===========================
         # HEADER (animated)  (UNCHANGED)
         # ===========================
@@ -439,25 +461,11 @@ class GeoUniversalMap(Scene):
         vmax = float(np.nanmax(vals_numeric.values)) if np.isfinite(np.nanmax(vals_numeric.values)) else 100.0
         vmax = max(1.0, vmax)
 
-        def _format_value(row_obj, value):
-            iv = _safe_int(value, default=None)
-            if mode == "COMPARE" and compare_a and compare_b:
-                a = _safe_int(row_obj.get(compare_a), default=None)
-                b = _safe_int(row_obj.get(compare_b), default=None)
-                if a is None and b is None:
-                    return "–"
-                a = a if a is not None else 0
-                b = b if b is not None else 0
-                return f"{a}|{b}"
-            if iv is None:
-                return "–"
-            return f"{iv}{unit}" if unit else f"{iv}"
-
         def make_card(country, group, value, col, side, row_obj):
             name = Text(str(country).upper(), font="Montserrat", weight=BOLD, font_size=18, color=WHITE)
             grp = Text(str(group), font="Montserrat", font_size=12, color=Theme.TEXT_SUB)
 
-            val_str = _format_value(row_obj, value)
+            val_str = _format_map_value(row_obj, value, mode, unit, compare_a, compare_b)
 
             val_txt = Text(val_str, font="Arial", weight=BOLD, font_size=16, color=col)
             chip = RoundedRectangle(corner_radius=0.16, width=val_txt.width + 0.38, height=0.44)
@@ -554,25 +562,39 @@ class GeoUniversalMap(Scene):
             return VGroup(glow, core).set_z_index(75)
 
         # ===========================
-        # BUILD ALL (UNCHANGED)
+        # BUILD ALL (cards placed by shared label engine)
         # ===========================
         all_cards, all_lines, all_dots, meta_items = [], [], [], []
         group_dots_map = {g: [] for g in unique_groups}
 
+        # cards first: real card heights feed the placement engine (slot y = wished y)
+        built, boxes = [], []
         for (country, group, value, lat, lon, row_obj), side, slot_anchor in placed:
             col = group_color_map.get(group, Theme.NEON_BLUE)
+            card = make_card(country, group, value, col, side, row_obj)
+            if side == "L":
+                x = left_lane_x + card.width / 2 + lane_pad
+            else:
+                x = right_lane_x - card.width / 2 - lane_pad
+            built.append((country, group, lat, lon, side, col, card))
+            boxes.append((x, float(slot_anchor[1]), card.width, card.height))
+
+        card_pos = resolve_label_boxes(
+            boxes,
+            lanes=[b[4] for b in built],
+            y_min=lane_bottom,
+            y_max=lane_top,
+            gap=0.12,
+        )
+
+        for (country, group, lat, lon, side, col, card), (x, y) in zip(built, card_pos):
             p_pin = lat_lon_to_point(lat, lon)
             dot = make_dot(col, p_pin)
-            card = make_card(country, group, value, col, side, row_obj)
 
-            y = float(slot_anchor[1])
+            card.move_to([x, y, 0])
             if side == "L":
-                x = left_lane_x + card.width / 2 + lane_pad
-                card.move_to([x, y, 0])
                 card_edge = card.get_right() + LEFT * 0.05
             else:
-                x = right_lane_x - card.width / 2 - lane_pad
-                card.move_to([x, y, 0])
                 card_edge = card.get_left() + RIGHT * 0.05
 
             pts = uturn_route(p_pin, card_edge, side)
@@ -640,55 +662,60 @@ class GeoUniversalMap(Scene):
             rate_func=rf.ease_out_cubic,
         )
 
-        for dot, ln, card, (cname, gname, col) in zip(all_dots, all_lines, all_cards, meta_items):
-            glow, core = ln[0], ln[1]
+        segs = SegmentCache(self, __file__)
+        for i, (dot, ln, card, (cname, gname, col)) in enumerate(zip(all_dots, all_lines, all_cards, meta_items)):
+            # one cached segment per reveal (src/segments.py): depends on this row's pin /
+            # route / card and on everything already on screen (all pins, earlier reveals, ticker)
+            shown = [*all_lines[:i], *all_cards[:i]]
+            with segs.segment("reveal", cname, gname, col, dot, ln, card, all_dots, shown, feed_text):
+                glow, core = ln[0], ln[1]
 
-            ping = Circle(radius=0.12).move_to(dot[2].get_center()).set_z_index(72)
-            ping.set_stroke(color=col, width=6, opacity=0.35)
-            self.add(ping)
+                ping = Circle(radius=0.12).move_to(dot[2].get_center()).set_z_index(72)
+                ping.set_stroke(color=col, width=6, opacity=0.35)
+                self.add(ping)
 
-            self.play(
-                Flash(dot[2].get_center(), color=col, flash_radius=0.22, time_width=0.25),
-                dot.animate.scale(1.12),
-                ping.animate.scale(2.4).set_opacity(0),
-                run_time=0.30,
-                rate_func=rf.ease_out_cubic,
-            )
-            self.remove(ping)
-            self.play(dot.animate.scale(1.00), run_time=0.12, rate_func=rf.ease_out_cubic)
-
-            self.play(Create(core, rate_func=rf.linear), run_time=0.55)
-            self.play(FadeIn(glow), run_time=0.12)
-
-            self.play(
-                FadeIn(card, shift=UP * 0.12, scale=0.985),
-                run_time=0.45,
-                rate_func=rf.ease_out_back,
-            )
-
-            try:
-                meter_bg = card[4][0]
-                meter_fill = card[4][1]
-                final_w = getattr(card, "meter_final_width", meter_fill.width)
                 self.play(
-                    meter_fill.animate.stretch_to_fit_width(max(0.01, final_w)).align_to(meter_bg, LEFT),
-                    run_time=0.32,
+                    Flash(dot[2].get_center(), color=col, flash_radius=0.22, time_width=0.25),
+                    dot.animate.scale(1.12),
+                    ping.animate.scale(2.4).set_opacity(0),
+                    run_time=0.30,
                     rate_func=rf.ease_out_cubic,
                 )
-            except Exception:
-                pass
+                self.remove(ping)
+                self.play(dot.animate.scale(1.00), run_time=0.12, rate_func=rf.ease_out_cubic)
+
+                self.play(Create(core, rate_func=rf.linear), run_time=0.55)
+                self.play(FadeIn(glow), run_time=0.12)
 
-            try:
-                bg = card[1]
                 self.play(
-                    bg.animate.set_stroke(width=3.0, opacity=0.95),
-                    run_time=0.22,
-                    rate_func=rf.there_and_back,
+                    FadeIn(card, shift=UP * 0.12, scale=0.985),
+                    run_time=0.45,
+                    rate_func=rf.ease_out_back,
                 )
-            except Exception:
-                pass
 
-            self.wait(0.05)
+                try:
+                    meter_bg = card[4][0]
+                    meter_fill = card[4][1]
+                    final_w = getattr(card, "meter_final_width", meter_fill.width)
+                    self.play(
+                        meter_fill.animate.stretch_to_fit_width(max(0.01, final_w)).align_to(meter_bg, LEFT),
+                        run_time=0.32,
+                        rate_func=rf.ease_out_cubic,
+                    )
+                except Exception:
+                    pass
+
+                try:
+                    bg = card[1]
+                    self.play(
+                        bg.animate.set_stroke(width=3.0, opacity=0.95),
+                        run_time=0.22,
+                        rate_func=rf.there_and_back,
+                    )
+                except Exception:
+                    pass
+
+                self.wait(0.05)
 
         # =====================================================
         # ✅ STEP 3: ALLIANCE TRAFFIC / ENDING + WINNER (UNCHANGED)
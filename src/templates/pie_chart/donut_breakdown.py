@@ -1404,50 +1404,21 @@ import re
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 from manim import *
 from manim import rate_functions as rf
 
-# ==========================
-# Optional project imports
-# ==========================
-HAS_PROJECT = True
-try:
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-    sys.path.append(project_root)
-
-    from src.config import DATA_DIR, BACKGROUND_COLOR, Theme  # type: ignore
-    from src.utils import IntroManager, get_safe_frame  # type: ignore
-except Exception:
-    HAS_PROJECT = False
-    DATA_DIR = "."
-    BACKGROUND_COLOR = "#0A0A0A"
-
-    class Theme:
-        TEXT_MAIN = "#FFFFFF"
-        TEXT_SUB = "#CCCCCC"
-        TEXT_DIM = "#9AA3AD"
-        NEON_BLUE = "#00F0FF"
-        NEON_PINK = "#FF0055"
-        NEON_PURPLE = "#BD00FF"
-        NEON_ORANGE = "#FF9900"
-        NEON_GREEN = "#00FF66"
-        NEON_YELLOW = "#FFE14D"
-
-    def get_safe_frame(margin: float = 0.70) -> Dict[str, float]:
-        half_w = config.frame_width / 2
-        half_h = config.frame_height / 2
-        return {
-            "left": -half_w + margin,
-            "right": half_w - margin,
-            "top": half_h - margin,
-            "bottom": -half_h + margin,
-            "w": config.frame_width - (2 * margin),
-            "h": config.frame_height - (2 * margin),
-            "cx": 0.0,
-            "cy": 0.0,
-        }
+# --- PATH SETUP ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
+sys.path.append(project_root)
+
+# --- IMPORTS ---
+from src.config import DATA_DIR, BACKGROUND_COLOR, Theme  # noqa: E402
+from src.utils import IntroManager, get_safe_frame  # noqa: E402
+from src.layout import resolve_label_boxes  # noqa: E402
+from src.data.ingest import load_dataset, parse_meta  # noqa: E402
+from src.data.schemas import MARKET_SCHEMA  # noqa: E402
+from src.text_metrics import metrics  # noqa: E402
 
 
 # ==========================
@@ -1559,18 +1530,7 @@ def parse_meta_first_line(path: str) -> Dict[str, str]:
         "OTHERS_MIN_PCT": "0",  # if >0, auto-merge tiny segments into Others
         "USE_CSV_COLORS": "0",  # 0 = ignore CSV colors (recommended), 1 = allow CSV override
     }
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            first = f.readline().strip()
-        if first.startswith("#"):
-            first = first[1:]
-            parts = [p.strip() for p in first.split(",") if p.strip()]
-            for p in parts:
-                if "=" in p:
-                    k, v = p.split("=", 1)
-                    meta[k.strip().upper()] = v.strip()
-    except Exception:
-        pass
+    meta.update(parse_meta(path))
     return meta
 
 
@@ -1585,22 +1545,6 @@ def normalize_to_pct(values: List[float]) -> List[float]:
     return [float(v) / s * 100.0 for v in vals]
 
 
-def _safe_float(x) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        if isinstance(x, str) and x.strip() == "":
-            return None
-        if pd.isna(x):
-            return None
-        v = float(str(x).replace("%", "").replace(",", "").strip())
-        if not np.isfinite(v):
-            return None
-        return v
-    except Exception:
-        return None
-
-
 def read_market_csv(
     csv_path: str,
 ) -> Tuple[Dict[str, str], List[str], List[float], List[str], List[str]]:
@@ -1617,41 +1561,8 @@ def read_market_csv(
         cols = ["" for _ in names]  # empty = trigger presets
         return meta, names, vals, cols, groups
 
-    df = pd.read_csv(csv_path, comment="#")
-    df.columns = [str(c).strip() for c in df.columns]
-    cols_map = {c.lower().strip(): c for c in df.columns}
-
-    cat_col = cols_map.get("category") or cols_map.get("name") or cols_map.get("label") or df.columns[0]
-    val_col = cols_map.get("value") or cols_map.get("val") or cols_map.get("percent") or cols_map.get("pct") or (
-        df.columns[1] if len(df.columns) > 1 else df.columns[0]
-    )
-    col_col = cols_map.get("color") or cols_map.get("hex") or cols_map.get("colour")
-    grp_col = cols_map.get("group")
-    ord_col = cols_map.get("order")
-
-    d = df.copy()
-    d[cat_col] = d[cat_col].astype(str).str.strip()
-
-    d[val_col] = d[val_col].apply(_safe_float)
-    d = d.dropna(subset=[val_col]).copy()
-    d[val_col] = d[val_col].astype(float)
-    d = d[d[val_col] > 0].copy()
-
-    if grp_col is None:
-        d["_Group"] = "Default"
-        grp_col = "_Group"
-    else:
-        # avoid "nan" strings
-        d[grp_col] = d[grp_col].where(~pd.isna(d[grp_col]), "Default")
-        d[grp_col] = d[grp_col].astype(str).str.strip()
-        d[grp_col] = d[grp_col].replace({"": "Default", "nan": "Default", "NaN": "Default", "None": "Default"})
-        d[grp_col] = d[grp_col].fillna("Default")
-
-    if ord_col is not None:
-        d[ord_col] = pd.to_numeric(d[ord_col], errors="coerce").fillna(10_000)
-        d = d.sort_values(by=[ord_col, val_col], ascending=[True, False], kind="mergesort")
-    else:
-        d = d.sort_values(by=[val_col], ascending=False, kind="mergesort")
+    # column resolution / coercion / ordering live in MARKET_SCHEMA (cached per file)
+    ds = load_dataset(csv_path, MARKET_SCHEMA)
 
     try:
         top = int(float(meta.get("TOP", "10")))
@@ -1659,15 +1570,10 @@ def read_market_csv(
         top = 10
     top = int(np.clip(top, 2, 10))
 
-    names = d[cat_col].astype(str).tolist()
-    vals = d[val_col].astype(float).tolist()
-    groups = d[grp_col].astype(str).tolist()
-
-    if col_col is not None and col_col in d.columns:
-        rawc = d[col_col].astype(str).tolist()
-        colors = [(s.strip() if is_hex(s.strip()) else "") for s in rawc]
-    else:
-        colors = ["" for _ in names]
+    names = [str(n) for n in ds["Category"]]
+    vals = [float(v) for v in ds["Value"]]
+    colors = [str(c) for c in ds["Color"]]
+    groups = [str(g) for g in ds["Group"]]
 
     # Merge into Others if needed
     if len(names) > top:
@@ -1790,21 +1696,11 @@ def text_ellipsize_to_width(
     min_keep: int = 4,
 ) -> Text:
     base = str(s) if s is not None else ""
-    t = _safe_text(base, font=font, font_size=font_size, color=color, weight=weight)
-    if t.width <= max_width:
-        return t
-
-    raw = base
-    for _ in range(60):
-        if len(raw) <= min_keep:
-            break
-        raw = raw[:-1].rstrip()
-        cand = raw + "…"
-        t2 = _safe_text(cand, font=font, font_size=font_size, color=color, weight=weight)
-        if t2.width <= max_width:
-            return t2
-
-    # last resort: scale down
+    # cut measured on the font file (binary search); one Text for the final string
+    fitted = metrics(font, weight, font_size).fit(base, max_width, min_keep=min_keep)
+    t = _safe_text(fitted, font=font, font_size=font_size, color=color, weight=weight)
+
+    # last resort (min_keep still too wide): scale down
     if t.width > max_width and t.width > 1e-6:
         t.scale_to_fit_width(max_width)
     return t
@@ -1951,22 +1847,20 @@ def build_background(sf: Dict[str, float], center: np.ndarray, outer_r: float) -
         p.set_opacity(float(rng.uniform(0.05, 0.12)))
         drift = np.array([rng.uniform(-0.028, 0.028), rng.uniform(-0.018, 0.018), 0])
 
-        def _make_updater(v):
+        def _make_updater(start, v):
+            # position = start + v * elapsed, wrapped: the same after one big step (skipped /
+            # resumed plays, src/checkpoint.py) as after many small ones
+            elapsed = [0.0]
+            lo = np.array([fb["left"], fb["bottom"], 0.0])
+            span = np.array([fb["right"] - fb["left"], fb["top"] - fb["bottom"], 1.0])
+
             def _up(m, dt):
-                m.shift(v * dt)
-                x0, y0, _ = m.get_center()
-                if x0 < fb["left"]:
-                    m.move_to([fb["right"], y0, 0])
-                elif x0 > fb["right"]:
-                    m.move_to([fb["left"], y0, 0])
-                if y0 < fb["bottom"]:
-                    m.move_to([x0, fb["top"], 0])
-                elif y0 > fb["top"]:
-                    m.move_to([x0, fb["bottom"], 0])
+                elapsed[0] += dt
+                m.move_to(lo + np.mod(start - lo + v * elapsed[0], span) * np.array([1.0, 1.0, 0.0]))
 
             return _up
 
-        p.add_updater(_make_updater(drift))
+        p.add_updater(_make_updater(p.get_center(), drift))
         particles.add(p)
 
     g.add(tint, plate, glow, haze, vignette, grid, major, edge, hud, ticks, particles)
@@ -2257,18 +2151,17 @@ def make_callout(center: np.ndarray, outer_r: float, slice_mid: float, pop_vec:
     return VGroup(glow1, glow2, core1, core2, dot, chip).set_z_index(165)
 
 
-def _make_callout_lines_only(
+def _callout_pose(
     center_for_slice: np.ndarray,
     outer_r: float,
     slice_mid: float,
     pop_vec: np.ndarray,
     dot_pos: np.ndarray,
-    col: str,
-) -> Tuple[Line, Line, Line, Line]:
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Returns: (glow1, glow2, core1, core2)
-    Uses dot_pos (chip-side) + slice-side computed from center_for_slice.
-    This fixes "winner callout missing" / disconnect when slice is shifted (popped).
+    Returns the connector corner points (p0, p1, p2) for one slice pose.
+    Same math as make_callout, but slice-side is computed from center_for_slice,
+    so a popped slice keeps its callout attached (winner callout fix).
     """
     base_edge = center_for_slice + np.array([np.cos(slice_mid) * outer_r, np.sin(slice_mid) * outer_r, 0])
     p0 = base_edge + pop_vec * 0.55
@@ -2276,123 +2169,83 @@ def _make_callout_lines_only(
     dirx = 1 if dot_pos[0] >= center_for_slice[0] else -1
     elbow_x = center_for_slice[0] + dirx * (outer_r + 0.60)
     p1 = np.array([elbow_x, dot_pos[1], 0])
-    p2 = dot_pos
+    p2 = np.array(dot_pos, dtype=float)
+    return p0, p1, p2
 
-    core1 = Line(p0, p1)
-    core2 = Line(p1, p2)
-    for ln in (core1, core2):
-        ln.set_fill(opacity=0)
-        ln.set_z_index(165)
-        ln.set_stroke(color=col, width=3.0, opacity=0.72)
-        try:
-            ln.set_stroke(line_cap=ROUND)
-        except Exception:
-            pass
 
-    glow1 = core1.copy()
-    glow2 = core2.copy()
+def _apply_callout_pose(callout: VGroup, pose: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+    """
+    Moves the four connector lines of a make_callout() group onto a precomputed pose.
+    In-place endpoint update (no new mobjects); stroke width/opacity go back to the
+    make_callout() values, which the old become() rebuilds restored after set_opacity(1.0).
+    """
+    glow1, glow2, core1, core2 = callout[0], callout[1], callout[2], callout[3]
+    p0, p1, p2 = pose
+    for ln in (glow1, core1):
+        ln.put_start_and_end_on(p0, p1)
+    for ln in (glow2, core2):
+        ln.put_start_and_end_on(p1, p2)
+    for ln in (core1, core2):
+        ln.set_stroke(width=3.0, opacity=0.72)
     for gl in (glow1, glow2):
-        gl.set_fill(opacity=0)
-        gl.set_z_index(164)
-        gl.set_stroke(color=col, width=10.0, opacity=0.12)
-        try:
-            gl.set_stroke(line_cap=ROUND)
-        except Exception:
-            pass
-
-    return glow1, glow2, core1, core2
+        gl.set_stroke(width=10.0, opacity=0.12)
 
 
 # ==========================
-# Chip overlap resolver (SAFE: no .bounding_box attribute usage)
+# Chip overlap resolver (shared NumPy placement engine, one call)
 # ==========================
 def resolve_chip_overlaps(
     chips: List[VGroup],
     sf: Dict[str, float],
     lane_top: float,
-    max_iters: int = 28,
     pad: float = 0.06,
-    extra_push: float = 0.06,
 ) -> None:
     if len(chips) <= 1:
         return
 
-    min_y = sf["bottom"] + 0.20
-    max_y = lane_top - 0.20
-
-    def _chip_h(c: VGroup) -> float:
-        return float(c.get_top()[1] - c.get_bottom()[1])
-
-    def _clamp_chip(c: VGroup) -> None:
-        cx, cy, _ = c.get_center()
-        h = _chip_h(c)
-        lo = min_y + h / 2.0
-        hi = max_y - h / 2.0
-        cy2 = clamp(cy, lo, hi)
-        c.move_to([cx, cy2, 0])
-
-    def _aabb(c: VGroup) -> Tuple[float, float, float, float]:
-        x0 = float(c.get_left()[0]) - pad
-        x1 = float(c.get_right()[0]) + pad
-        y0 = float(c.get_bottom()[1]) - pad
-        y1 = float(c.get_top()[1]) + pad
-        return x0, x1, y0, y1
-
+    boxes = []
     for c in chips:
-        _clamp_chip(c)
-
-    for _ in range(max_iters):
-        moved = False
-
-        for i in range(len(chips)):
-            for j in range(i + 1, len(chips)):
-                a, b = chips[i], chips[j]
-                ax0, ax1, ay0, ay1 = _aabb(a)
-                bx0, bx1, by0, by1 = _aabb(b)
-
-                x_overlap = min(ax1, bx1) - max(ax0, bx0)
-                y_overlap = min(ay1, by1) - max(ay0, by0)
-
-                if x_overlap > 0 and y_overlap > 0:
-                    push = (y_overlap / 2.0) + extra_push
-                    if a.get_center()[1] <= b.get_center()[1]:
-                        a.shift(DOWN * push)
-                        b.shift(UP * push)
-                    else:
-                        a.shift(UP * push)
-                        b.shift(DOWN * push)
-
-                    _clamp_chip(a)
-                    _clamp_chip(b)
-                    moved = True
-
-        if not moved:
-            break
+        cx, cy, _ = c.get_center()
+        boxes.append((cx, cy, c.width, c.height))
+
+    pos = resolve_label_boxes(
+        boxes,
+        y_min=sf["bottom"] + 0.20,
+        y_max=lane_top - 0.20,
+        gap=pad * 2.0,
+        pad_x=pad,
+    )
+    for c, (cx, cy) in zip(chips, pos):
+        c.move_to([cx, cy, 0])
 
 
 # ==========================
 # Scene (FINAL)
 # ==========================
+def data_candidates() -> List[str]:
+    """Where this template looks for its CSV, in order (src.render_cache hashes exactly these)."""
+    return [os.path.join(DATA_DIR, "market_share.csv")]
+
+
 class DonutBreakdownFinal(Scene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
         sf = get_safe_frame(margin=0.70)
 
         # Intro (LOCKED utils.py)
-        if HAS_PROJECT:
-            try:
-                IntroManager.play_intro(
-                    self,
-                    brand_title="BIGDATA LEAK",
-                    brand_sub="SYSTEM BREACH DETECTED",
-                    feed_text="FEED_DONUT // BREAKDOWN",
-                    footer_text="CONFIDENTIAL // VERIFIED",
-                )
-            except Exception:
-                pass
+        try:
+            IntroManager.play_intro(
+                self,
+                brand_title="BIGDATA LEAK",
+                brand_sub="SYSTEM BREACH DETECTED",
+                feed_text="FEED_DONUT // BREAKDOWN",
+                footer_text="CONFIDENTIAL // VERIFIED",
+            )
+        except Exception:
+            pass
 
         # Data
-        csv_path = os.path.join(DATA_DIR, "market_share.csv")
+        csv_path = data_candidates()[0]
         meta, names, raw_vals, csv_colors, groups = read_market_csv(csv_path)
 
         # Optional: merge tiny segments into Others (only if meta asks)
@@ -2662,6 +2515,16 @@ class DonutBreakdownFinal(Scene):
             callouts.add(callout)
             callout_by_idx[i] = callout
 
+        # Focus/rest connector poses: computed once after layout, switched in place during the story
+        callout_poses: Dict[int, Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+        for i in range(len(names)):
+            unit_vec = np.array([np.cos(slice_mids[i]), np.sin(slice_mids[i]), 0])
+            dot_pos = callout_by_idx[i][4].get_center()
+            callout_poses[i] = {
+                "rest": _callout_pose(center, outer_r, slice_mids[i], unit_vec * 0.22, dot_pos),
+                "focus": _callout_pose(center + unit_vec * 0.24, outer_r, slice_mids[i], unit_vec * 0.22, dot_pos),
+            }
+
         # Header + Donut creation (parallel feel)
         self.play(Write(title), run_time=0.45, rate_func=rf.ease_out_cubic)
         self.play(
@@ -2713,8 +2576,7 @@ class DonutBreakdownFinal(Scene):
             pct_int = int(round(float(pct_vals[idx])))
             is_winner = (idx == winner_idx)
 
-            pop = np.array([np.cos(slice_mids[idx]), np.sin(slice_mids[idx]), 0]) * 0.24
-            pop_vec = np.array([np.cos(slice_mids[idx]), np.sin(slice_mids[idx]), 0]) * 0.22  # must match callout math
+            pop = np.array([np.cos(slice_mids[idx]), np.sin(slice_mids[idx]), 0]) * 0.24  # must match "focus" pose
 
             new_comm = make_commentary(center, inner_r, "SEGMENT", str(names[idx]).upper(), f"{pct_int}%", col)
             self.play(
@@ -2728,21 +2590,8 @@ class DonutBreakdownFinal(Scene):
             c = callout_by_idx[idx]
             glow1, glow2, core1, core2, dot, chip = c  # stable order
 
-            # --- RETARGET lines to current slice position (FIX: winner callout missing/disconnect) ---
-            dot_pos = dot.get_center()
-            center_for_slice = center + pop  # slice is currently shifted by pop
-            new_glow1, new_glow2, new_core1, new_core2 = _make_callout_lines_only(
-                center_for_slice=center_for_slice,
-                outer_r=outer_r,
-                slice_mid=slice_mids[idx],
-                pop_vec=pop_vec,
-                dot_pos=dot_pos,
-                col=col,
-            )
-            glow1.become(new_glow1)
-            glow2.become(new_glow2)
-            core1.become(new_core1)
-            core2.become(new_core2)
+            # --- RETARGET lines to popped slice (FIX: winner callout missing/disconnect) ---
+            _apply_callout_pose(c, callout_poses[idx]["focus"])
 
             c.set_opacity(1.0)
             self.play(
@@ -2776,19 +2625,7 @@ class DonutBreakdownFinal(Scene):
                 )
 
                 # retarget lines back to base center after slice returns
-                dot_pos = dot.get_center()
-                back_glow1, back_glow2, back_core1, back_core2 = _make_callout_lines_only(
-                    center_for_slice=center,
-                    outer_r=outer_r,
-                    slice_mid=slice_mids[idx],
-                    pop_vec=pop_vec,
-                    dot_pos=dot_pos,
-                    col=col,
-                )
-                glow1.become(back_glow1)
-                glow2.become(back_glow2)
-                core1.become(back_core1)
-                core2.become(back_core2)
+                _apply_callout_pose(c, callout_poses[idx]["rest"])
 
             else:
                 glow = sec.copy()
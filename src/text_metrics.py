@@ -0,0 +1,132 @@
+# src/text_metrics.py
+# String widths from the bundled TTFs (advance widths + kerning through FreeType), no Text().
+#
+# Fitting a label by building Text() candidates costs a Pango render + SVG parse per try.
+# Here a width is one FreeType layout call on the TTF in assets/fonts. A single Text() per
+# (font, weight) calibrates FreeType pixels -> scene units on the ink box (what Text.width
+# reports), so measured widths line up with the final mobject. Fonts without a bundled TTF
+# fall back to measuring Text() (memoised); fitting still uses a binary search.
+#
+# Kerning: Pillow lays out with libraqm when it is available (GPOS kerning, like Pango).
+# Its basic layout only knows the legacy 'kern' table; Montserrat kerns through GPOS, so
+# there widths come out slightly wide (kerning mostly tightens), i.e. fits stay on the safe side.
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+from manim import BOLD, NORMAL, Text
+
+try:
+    from src.config import FONTS_DIR
+except Exception:
+    FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "fonts")
+
+# (family lower-case, manim weight) -> bundled file
+FONT_FILES = {
+    ("montserrat", BOLD): "Montserrat-Bold.ttf",
+    ("montserrat", NORMAL): "Montserrat-Regular.ttf",
+}
+
+_CALIBRATION = "Hamburgefonstiv 0123456789"
+_REF_PX = 200  # FreeType size used for every measurement
+_REF_FS = 48  # font_size of the calibration Text()
+
+
+def _weight(weight) -> str:
+    return NORMAL if weight is None else str(weight)
+
+
+def _build(s: str, font: str, weight: str, font_size: float) -> Text:
+    try:
+        return Text(s, font=font, weight=weight, font_size=font_size)
+    except Exception:
+        return Text(s, font_size=font_size)
+
+
+@lru_cache(maxsize=None)
+def _pil_font(font: str, weight: str):
+    fname = FONT_FILES.get((str(font).lower(), weight))
+    path = os.path.join(FONTS_DIR, fname) if fname else ""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        from PIL import ImageFont
+
+        return ImageFont.truetype(path, _REF_PX)
+    except Exception:
+        return None
+
+
+def _ink_px(pil_font, s: str) -> float:
+    if not s.strip():
+        return 0.0
+    x0, _, x1, _ = pil_font.getbbox(s)
+    return float(x1 - x0)
+
+
+@lru_cache(maxsize=None)
+def _units_per_px(font: str, weight: str) -> float:
+    """Scene units per FreeType pixel at font_size=1 (widths scale linearly with font_size)."""
+    ref = _build(_CALIBRATION, font, weight, _REF_FS)
+    return float(ref.width) / max(1e-9, _ink_px(_pil_font(font, weight), _CALIBRATION) * _REF_FS)
+
+
+@lru_cache(maxsize=4096)
+def _text_width(s: str, font: str, weight: str, font_size: float) -> float:
+    return float(_build(s, font, weight, font_size).width) if s.strip() else 0.0
+
+
+class FontMetrics:
+    """Width queries for one (font, weight, font_size); get instances through metrics()."""
+
+    def __init__(self, font: str, weight=None, font_size: float = 24):
+        self.font = str(font)
+        self.weight = _weight(weight)
+        self.font_size = float(font_size)
+        self._pil = _pil_font(self.font, self.weight)
+        self._k = _units_per_px(self.font, self.weight) * self.font_size if self._pil is not None else 0.0
+
+    @property
+    def exact(self) -> bool:
+        """True when widths come from the TTF (False = Text() fallback)."""
+        return self._pil is not None
+
+    def width(self, s: str) -> float:
+        s = str(s)
+        if self._pil is None:
+            return _text_width(s, self.font, self.weight, self.font_size)
+        return _ink_px(self._pil, s) * self._k
+
+    def fit(self, s: str, max_width: float, ellipsis: str = "…", min_keep: int = 0) -> str:
+        """s itself if it fits, else the longest prefix + ellipsis that does (never shorter than min_keep)."""
+        s = str(s)
+        if self.width(s) <= max_width:
+            return s
+        lo, hi = 0, len(s) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.width(s[:mid].rstrip() + ellipsis) <= max_width:
+                lo = mid
+            else:
+                hi = mid - 1
+        return s[: max(lo, min(min_keep, len(s)))].rstrip() + ellipsis
+
+    def font_size_to_fit(self, s: str, max_width: float) -> float:
+        """Largest font_size <= this one at which s fits max_width."""
+        w = self.width(s)
+        return self.font_size if w <= max_width or w <= 1e-9 else self.font_size * max_width / w
+
+
+@lru_cache(maxsize=256)
+def metrics(font: str, weight=None, font_size: float = 24) -> FontMetrics:
+    return FontMetrics(font, weight, font_size)
+
+
+def text_width(s: str, font: str = "Montserrat", weight=None, font_size: float = 24) -> float:
+    return metrics(font, weight, font_size).width(s)
+
+
+def ellipsize_to_width(s: str, max_width: float, font: str = "Montserrat", weight=None, font_size: float = 24) -> str:
+    return metrics(font, weight, font_size).fit(s, max_width)
@@ -0,0 +1,134 @@
+# src/text_prewarm.py
+# Text prewarm: build every label a dataset will need, in parallel, before the scene animates.
+#
+# Manim's Text keys its Pango render by a hash of (string, font, weight, size, color, ...);
+# src.text_store keeps the resulting glyph paths in a packed store and reuses them on the next
+# identical Text(). Templates build labels one by one inside the animation loop, so a new
+# dataset pays every Pango render serially. prewarm_texts() renders the whole table in a
+# process pool into that store; the scene's own Text() calls then only read stored paths.
+#
+# The manifest in text_dir maps each spec (and renderer) to Manim's text hash. A spec is only
+# skipped while that hash is still in the store (or its SVG still on disk without a store):
+# compaction / cache_manager eviction drop entries, and those specs get prewarmed again.
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from manim import Text, config
+
+from src.text_store import _key as store_key
+from src.text_store import get_store
+from src.text_store import install as install_text_store
+
+# (string, sorted Text kwargs) — kwargs must match the template's Text() call exactly,
+# color included, or Manim's hash (and so the cache file) will differ.
+TextSpec = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+_MANIFEST_NAME = ".prewarm_manifest"
+_MIN_PARALLEL = 4  # below this a pool costs more than it saves
+
+
+def text_spec(text: Any, **kwargs: Any) -> TextSpec:
+    return str(text), tuple(sorted(kwargs.items()))
+
+
+def _spec_key(spec: TextSpec) -> str:
+    # the store keeps one path set per renderer (cubic vs quadratic), so the manifest does too
+    renderer = getattr(config.renderer, "value", config.renderer)
+    return hashlib.sha1(repr((renderer, spec)).encode("utf-8")).hexdigest()
+
+
+def _build_one(job: Tuple[str, TextSpec]) -> Optional[Tuple[str, str]]:
+    text_dir, (text, items) = job
+    install_text_store()  # spawned workers don't inherit the parent's hook
+    try:
+        config.text_dir = text_dir
+        t = Text(text, **dict(items))
+        name = getattr(t, "_text_hash", None)
+        return (_spec_key((text, items)), name) if name else None
+    except Exception:
+        # same fallback as the templates' _safe_text: font missing -> default font
+        try:
+            kw = {k: v for k, v in items if k in ("font_size", "color")}
+            Text(text, **kw)
+        except Exception:
+            pass
+        return None
+
+
+def _read_manifest(path: str) -> Dict[str, str]:
+    """spec key -> Manim text hash (older one-column lines are ignored: nothing to check)."""
+    out: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for ln in f:
+                spec_key, _, name = ln.strip().partition("\t")
+                if name:
+                    out[spec_key] = name
+    except Exception:
+        pass
+    return out
+
+
+def _still_built(name: str, text_dir: str) -> bool:
+    store = get_store()
+    if store is not None:
+        return store_key(name) in store
+    return os.path.isfile(os.path.join(text_dir, name + ".svg"))
+
+
+def prewarm_texts(specs: Iterable[TextSpec], max_workers: Optional[int] = None) -> int:
+    """
+    Renders every distinct spec into Manim's text cache. Specs prewarmed earlier are skipped
+    while their paths are still cached (manifest + store check). Returns how many labels were built now.
+    Never raises: a failed prewarm only means the scene renders that label itself.
+    """
+    try:
+        text_dir = str(config.get_dir("text_dir"))
+        os.makedirs(text_dir, exist_ok=True)
+    except Exception:
+        return 0
+
+    manifest = os.path.join(text_dir, _MANIFEST_NAME)
+    done = _read_manifest(manifest)
+
+    todo: List[TextSpec] = []
+    seen: Set[str] = set()
+    for spec in specs:
+        if not spec[0].strip():
+            continue
+        key = _spec_key(spec)
+        if key in seen or (key in done and _still_built(done[key], text_dir)):
+            continue
+        seen.add(key)
+        todo.append(spec)
+
+    if not todo:
+        return 0
+
+    jobs = [(text_dir, spec) for spec in todo]
+    workers = max_workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    built: List[Optional[Tuple[str, str]]] = []
+    if workers == 1 or len(jobs) < _MIN_PARALLEL:
+        built = [_build_one(j) for j in jobs]
+    else:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                built = list(pool.map(_build_one, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+        except Exception:
+            built = [_build_one(j) for j in jobs]
+
+    keys = [k for k in built if k]
+    if keys:
+        try:
+            with open(manifest, "a", encoding="utf-8") as f:
+                f.write("".join(f"{spec_key}\t{name}\n" for spec_key, name in keys))
+        except Exception:
+            pass
+    return len(keys)
@@ -0,0 +1,379 @@
+# src/text_store.py
+# Packed, memory-mapped text-path store (replaces one-SVG-per-string media/texts).
+#
+# Manim's Text() writes every distinct (string, font, size, color, ...) to its own SVG in
+# config.text_dir and, on a later run, re-reads + re-parses that file. Counters and timers mint
+# a new string per frame, so the directory grows without bound. Here the parsed glyph paths
+# of every Text go into ONE append-only float32 file, indexed by Manim's own text hash:
+#
+#   cache/text_paths/index.jsonl    header {"v", "data"} + one line per entry / LRU touch
+#   cache/text_paths/paths.<g>.bin  [n_sub x 9 style floats][sum(counts) x 3 points] per entry
+#
+# A hit is a dict lookup plus np.frombuffer() on the shared mmap (no file per string, no SVG
+# parse, no Pango). Writers append under a file lock; readers pick up other workers' entries
+# on a miss. Past max_bytes the store keeps the most recently used entries in a new data
+# generation (paths.<g+1>.bin) and swaps the index atomically, so open mmaps stay valid.
+
+from __future__ import annotations
+
+import atexit
+import json
+import mmap
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from manim import Text, VMobject, config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+TEXT_STORE_VERSION = 1
+TEXT_STORE_MAX_BYTES = 256 * 1024 * 1024
+_COMPACT_TO = 0.75  # of max_bytes, so compaction doesn't run again on the next put
+_TOUCH_FLUSH = 256  # pending LRU touches before they're written out
+
+_F32 = np.dtype("<f4")
+_STYLE = 9  # fill rgba, stroke rgba, stroke width
+
+# key -> (offset in floats, per-submobject point counts)
+Entry = Tuple[int, Tuple[int, ...]]
+
+
+def _store_dir() -> str:
+    # imported on first use, like the rest of the store
+    try:
+        from src.config import CACHE_DIR
+    except Exception:
+        CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+    return os.path.join(CACHE_DIR, "text_paths")
+
+
+@contextmanager
+def _locked(path: str):
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class TextPathStore:
+    def __init__(self, root: Optional[str] = None, max_bytes: int = TEXT_STORE_MAX_BYTES):
+        self.root = root or _store_dir()
+        self.max_bytes = int(max_bytes)
+        self.index_path = os.path.join(self.root, "index.jsonl")
+        self.lock_path = os.path.join(self.root, ".lock")
+        os.makedirs(self.root, exist_ok=True)
+
+        self._entries: Dict[str, Entry] = {}
+        self._used: Dict[str, float] = {}
+        self._touched: Dict[str, float] = {}
+        self._data_name = ""
+        self._index_id: Tuple[int, int] = (-1, -1)
+        self._index_pos = 0
+        self._mm: Optional[mmap.mmap] = None
+        self.hits = 0
+        self.misses = 0
+        self._refresh()
+
+    # ---------------- index ----------------
+    def _data_path(self, name: Optional[str] = None) -> str:
+        return os.path.join(self.root, name or self._data_name)
+
+    def _create(self) -> None:
+        with _locked(self.lock_path):
+            if not os.path.exists(self.index_path):
+                self._write_index("paths.1.bin", [])
+
+    def _write_index(self, data_name: str, lines: Sequence[str]) -> None:
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"v": TEXT_STORE_VERSION, "data": data_name}) + "\n")
+            f.writelines(lines)
+        open(self._data_path(data_name), "ab").close()
+        os.replace(tmp, self.index_path)
+
+    def _refresh(self) -> None:
+        """Reads index lines other processes appended; full reload after a compaction swapped it."""
+        try:
+            st = os.stat(self.index_path)
+        except FileNotFoundError:
+            self._create()
+            st = os.stat(self.index_path)
+
+        if (st.st_dev, st.st_ino) != self._index_id:
+            self._entries.clear()
+            self._index_pos = 0
+            self._close_mm()
+            self._index_id = (st.st_dev, st.st_ino)
+        if st.st_size <= self._index_pos:
+            return
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_pos)
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1  # only whole lines; a writer may be mid-append
+        for line in chunk[:end].splitlines():
+            rec = json.loads(line)
+            if "data" in rec:
+                if rec.get("v") != TEXT_STORE_VERSION:
+                    raise ValueError(f"text store version {rec.get('v')} != {TEXT_STORE_VERSION}")
+                self._data_name = rec["data"]
+            elif "o" in rec:
+                self._entries[rec["k"]] = (int(rec["o"]), tuple(rec["c"]))
+                self._used.setdefault(rec["k"], float(rec["u"]))
+            elif rec["k"] in self._entries:
+                self._used[rec["k"]] = max(self._used.get(rec["k"], 0.0), float(rec["u"]))
+        self._index_pos += end
+
+    # ---------------- data ----------------
+    def _close_mm(self) -> None:
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass  # arrays still viewing it; the mapping goes away with them
+            self._mm = None
+
+    def _view(self, offset: int, count: int) -> np.ndarray:
+        if count == 0:
+            return np.zeros(0, dtype=_F32)  # Text("") has no paths (and mmap can't map an empty file)
+        need = (offset + count) * _F32.itemsize
+        if self._mm is None or len(self._mm) < need:
+            self._close_mm()
+            with open(self._data_path(), "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(self._mm, dtype=_F32, count=count, offset=offset * _F32.itemsize)
+
+    def _arrays(self, entry: Entry) -> Tuple[np.ndarray, np.ndarray]:
+        offset, counts = entry
+        n = len(counts)
+        flat = self._view(offset, n * _STYLE + 3 * sum(counts))
+        return flat[: n * _STYLE].reshape(n, _STYLE), flat[n * _STYLE :].reshape(-1, 3)
+
+    # ---------------- public ----------------
+    def __contains__(self, key: str) -> bool:
+        if key not in self._entries:
+            self._refresh()
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[List[VMobject]]:
+        """Fresh submobjects (own float64 points) for key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._refresh()
+            entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        try:
+            style, points = self._arrays(entry)
+        except (OSError, ValueError):
+            # another process compacted: our entry's data file is gone / shorter than our
+            # mapping -> reload the new index and read the entry from the new generation
+            self._refresh()
+            entry = self._entries.get(key)
+            try:
+                if entry is None:
+                    raise KeyError(key)
+                style, points = self._arrays(entry)
+            except (OSError, ValueError, KeyError):
+                self.misses += 1
+                return None
+        mobs: List[VMobject] = []
+        start = 0
+        for row, n in zip(style, entry[1]):
+            m = VMobject()
+            m.points = points[start : start + n].astype(np.float64)
+            m.fill_rgbas = row[None, 0:4].astype(np.float64)
+            m.stroke_rgbas = row[None, 4:8].astype(np.float64)
+            m.stroke_width = float(row[8])
+            mobs.append(m)
+            start += n
+        self.hits += 1
+        self._touch(key)
+        return mobs
+
+    def put(self, key: str, mobs: Sequence[VMobject]) -> bool:
+        """Appends the mobjects' paths + style under key. False when they can't be stored."""
+        try:
+            style = np.zeros((len(mobs), _STYLE), dtype=_F32)
+            for i, m in enumerate(mobs):
+                style[i, 0:4] = np.asarray(m.fill_rgbas, dtype=float)[0]
+                style[i, 4:8] = np.asarray(m.stroke_rgbas, dtype=float)[0]
+                style[i, 8] = float(m.stroke_width or 0.0)
+            points = [np.asarray(m.points, dtype=_F32).reshape(-1, 3) for m in mobs]
+        except Exception:
+            return False
+        counts = [len(p) for p in points]
+        blob = style.tobytes() + b"".join(p.tobytes() for p in points)
+
+        now = time.time()
+        with _locked(self.lock_path):
+            self._refresh()
+            if key not in self._entries:
+                with open(self._data_path(), "ab") as f:
+                    offset = f.tell() // _F32.itemsize
+                    f.write(blob)
+                rec = {"k": key, "o": offset, "c": counts, "u": now}
+                with open(self.index_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+            size = os.path.getsize(self._data_path())
+        self._used[key] = now
+        if size > self.max_bytes:
+            self.compact()
+        return True
+
+    def _touch(self, key: str) -> None:
+        self._used[key] = self._touched[key] = time.time()
+        if len(self._touched) >= _TOUCH_FLUSH:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes pending LRU touches (hits) so other processes / compaction see them."""
+        if not self._touched:
+            return
+        lines = "".join(json.dumps({"k": k, "u": u}, separators=(",", ":")) + "\n" for k, u in self._touched.items())
+        self._touched.clear()
+        try:
+            with _locked(self.lock_path), open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            pass
+
+    def compact(self, target_bytes: Optional[int] = None) -> int:
+        """Keeps the most recently used entries that fit target_bytes; returns how many were dropped."""
+        target = int(self.max_bytes * _COMPACT_TO if target_bytes is None else target_bytes)
+        self.flush()
+        with _locked(self.lock_path):
+            self._refresh()
+            old_data = self._data_path()
+            if target_bytes is None and os.path.getsize(old_data) <= self.max_bytes:
+                return 0  # another worker compacted while we waited for the lock
+            gen = int(self._data_name.split(".")[1]) + 1
+            new_name = f"paths.{gen}.bin"
+
+            lines: List[str] = []
+            kept = 0
+            with open(self._data_path(new_name), "wb") as out:
+                for key in sorted(self._entries, key=lambda k: self._used.get(k, 0.0), reverse=True):
+                    style, points = self._arrays(self._entries[key])
+                    blob = style.tobytes() + points.tobytes()
+                    if out.tell() + len(blob) > target:
+                        continue
+                    rec = {"k": key, "o": out.tell() // _F32.itemsize, "c": list(self._entries[key][1]), "u": self._used.get(key, 0.0)}
+                    out.write(blob)
+                    lines.append(json.dumps(rec, separators=(",", ":")) + "\n")
+                    kept += 1
+            dropped = len(self._entries) - kept
+            self._write_index(new_name, lines)
+            self._refresh()
+        try:
+            os.remove(old_data)
+        except OSError:
+            pass  # still mapped on Windows; the next compaction's cleanup is harmless to skip
+        return dropped
+
+    def stats(self) -> Dict[str, float]:
+        self._refresh()
+        try:
+            size = os.path.getsize(self._data_path())
+        except OSError:
+            size = 0
+        return {"entries": len(self._entries), "bytes": size, "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+
+# ============================================================
+# ✅ MANIM HOOK
+# ============================================================
+_STORE: Optional[TextPathStore] = None
+_ORIG: Dict[str, object] = {}
+
+
+def get_store() -> Optional[TextPathStore]:
+    global _STORE
+    if _STORE is None:
+        try:
+            _STORE = TextPathStore()
+        except Exception:
+            return None  # read-only checkout / bad index: plain Manim behaviour
+        atexit.register(_STORE.flush)
+    return _STORE
+
+
+def _key(svg_name: str) -> str:
+    # Manim's text hash covers string + style; paths differ per renderer (cubic vs quadratic)
+    return f"{getattr(config.renderer, 'value', config.renderer)}:{Path(svg_name).stem}"
+
+
+def _text2svg(self, color):
+    store = get_store()
+    name = self._text2hash(color)
+    self._text_hash = name  # src.text_prewarm records it to check the store later
+    if store is not None and _key(name) in store:
+        self._svg_color = color  # in case the entry is gone by generate_mobject (compacted meanwhile)
+        return str(config.get_dir("text_dir") / (name + ".svg"))  # never written; generate_mobject reads the store
+    return _ORIG["_text2svg"](self, color)
+
+
+def _generate_mobject(self) -> None:
+    store = get_store()
+    key = _key(str(self.file_name))
+    mobs = store.get(key) if store is not None else None
+    if mobs is not None:
+        _note(True)
+        self.add(*mobs)
+        return
+    _note(False)
+    if not os.path.exists(self.file_name) and hasattr(self, "_svg_color"):
+        # _text2svg skipped Pango because the store had this text; it no longer does
+        _ORIG["_text2svg"](self, self._svg_color)
+        _ORIG["remove_last_M"](self.file_name)
+    _ORIG["generate_mobject"](self)
+    if store is not None and store.put(key, self.submobjects):
+        try:
+            os.remove(self.get_file_path())
+        except OSError:
+            pass
+
+
+def _note(hit: bool) -> None:
+    from src.cache_manager import manager  # only once a Text is actually built
+
+    manager().note("text_paths", hit)
+
+
+def _remove_last_M(file_name) -> None:
+    if os.path.exists(file_name):
+        _ORIG["remove_last_M"](file_name)
+
+
+def install() -> None:
+    """Routes Text() through the store. Idempotent."""
+    if _ORIG:
+        return
+    from manimpango import PangoUtils
+
+    _ORIG["_text2svg"] = Text._text2svg
+    _ORIG["generate_mobject"] = Text.generate_mobject
+    _ORIG["remove_last_M"] = PangoUtils.remove_last_M
+    Text._text2svg = _text2svg
+    Text.generate_mobject = _generate_mobject
+    PangoUtils.remove_last_M = staticmethod(_remove_last_M)
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from src.templates.chart_folder.butterfly_chart import (
+    _compact_spec_for_target,
+    _fmt_compact_value,
+    _fmt_compact_values,
+)
+
+VALUES = [0, 0.4, 0.5, 1.5, 2.5, 7, 999.4, -12.6, 1000, 1049, 1050, 12_345, 99_950, 999_999, -45_600,
+          1_000_000, 2_500_000, 123_456_789, 1_000_000_000, 7_250_000_000, -3_000_000_000]
+
+
+@pytest.mark.parametrize("target", [900, 50_000, 5_000_000, 5_000_000_000])
+def test_vector_matches_scalar(target):
+    spec = _compact_spec_for_target(target)
+    raw = np.array(VALUES, dtype=float)
+    divisor = np.full(len(raw), spec.divisor)
+    plain = np.full(len(raw), spec.suffix == "")
+    assert _fmt_compact_values(raw, divisor, plain) == [_fmt_compact_value(v, spec) for v in raw]
+
+
+def test_mixed_specs_per_row():
+    targets = [10, 20_000, 30_000_000, 40_000_000_000]
+    specs = [_compact_spec_for_target(t) for t in targets]
+    raw = np.array([7.6, 12_340, 4_560_000, 1_250_000_000], dtype=float)
+    divisor = np.array([sp.divisor for sp in specs])
+    plain = np.array([sp.suffix == "" for sp in specs])
+    assert _fmt_compact_values(raw, divisor, plain) == [_fmt_compact_value(v, sp) for v, sp in zip(raw, specs)]
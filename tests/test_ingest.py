@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from src.data import ingest
+from src.data.ingest import META_FIRST_LINE, META_LINES, Schema, load_dataset, parse_meta
+
+
+@pytest.fixture
+def data_cache(tmp_path, monkeypatch):
+    """Private NPZ dir + empty memo; records cache-manager hits instead of touching cache/."""
+    events = []
+    monkeypatch.setattr(ingest, "DATA_CACHE_DIR", str(tmp_path / "data"))
+    monkeypatch.setattr(ingest, "_MEMO", {})
+    monkeypatch.setattr(ingest, "cache_hit", lambda cls, path: events.append("hit"))
+    monkeypatch.setattr(ingest, "cache_miss", lambda cls: events.append("miss"))
+    monkeypatch.setattr(ingest, "cache_put", lambda cls, path: events.append("put"))
+    return events
+
+
+def _csv(tmp_path, text, name="in.csv"):
+    p = tmp_path / name
+    p.write_text(text, encoding="utf-8")
+    return str(p)
+
+
+def _counting(normalize):
+    calls = []
+
+    def wrapped(df):
+        calls.append(1)
+        return normalize(df)
+
+    return wrapped, calls
+
+
+def test_parse_meta_first_line(tmp_path):
+    path = _csv(tmp_path, "#title=Top Scorers, unit = goals,bad\nName,Value\nA,1\n")
+    assert parse_meta(path, META_FIRST_LINE) == {"TITLE": "Top Scorers", "UNIT": "goals"}
+
+
+def test_parse_meta_lines(tmp_path):
+    path = _csv(tmp_path, "#TITLE=Race, with comma\n\n#subtitle = 2000-2020\n#EMPTY=\nDate,A\n#LATE=x\n")
+    assert parse_meta(path, META_LINES) == {"TITLE": "Race, with comma", "SUBTITLE": "2000-2020"}
+
+
+def test_parse_meta_missing_file(tmp_path):
+    assert parse_meta(str(tmp_path / "nope.csv")) == {}
+
+
+def test_npz_round_trip(tmp_path, data_cache):
+    path = _csv(tmp_path, "#TITLE=Demo\nName,Value,Flag\nA,1.5,True\nB,2,False\n")
+    norm, calls = _counting(lambda df: df)
+    schema = Schema("t", 1, norm)
+
+    first = load_dataset(path, schema)
+    assert data_cache == ["miss", "put"]
+
+    ingest._MEMO.clear()
+    again = load_dataset(path, schema)
+    assert data_cache == ["miss", "put", "hit"]
+    assert len(calls) == 1
+
+    assert again.meta == first.meta == {"TITLE": "Demo"}
+    assert again.names == first.names == ["Name", "Value", "Flag"]
+    for n in first.names:
+        assert again[n].dtype == first[n].dtype
+        assert np.array_equal(again[n], first[n])
+    assert not again["Value"].flags.writeable
+    assert again.frame().equals(first.frame())
+
+
+def test_schema_version_invalidates(tmp_path, data_cache):
+    path = _csv(tmp_path, "Name,Value\nA,1\nB,2\n")
+    v1, calls1 = _counting(lambda df: df)
+    v2, calls2 = _counting(lambda df: df.assign(Value=df["Value"] * 10))
+
+    assert list(load_dataset(path, Schema("t", 1, v1))["Value"]) == [1, 2]
+    assert list(load_dataset(path, Schema("t", 2, v2))["Value"]) == [10, 20]
+    assert (len(calls1), len(calls2)) == (1, 1)
+
+    # both versions stay cached side by side
+    ingest._MEMO.clear()
+    assert list(load_dataset(path, Schema("t", 1, v1))["Value"]) == [1, 2]
+    assert list(load_dataset(path, Schema("t", 2, v2))["Value"]) == [10, 20]
+    assert (len(calls1), len(calls2)) == (1, 1)
+
+
+def test_changed_file_invalidates(tmp_path, data_cache):
+    path = _csv(tmp_path, "Name,Value\nA,1\n")
+    schema = Schema("t", 1, lambda df: df)
+    assert list(load_dataset(path, schema)["Value"]) == [1]
+    _csv(tmp_path, "Name,Value\nA,1\nB,22\n")
+    assert list(load_dataset(path, schema)["Value"]) == [1, 22]
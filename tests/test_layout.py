@@ -0,0 +1,58 @@
+import numpy as np
+
+from src.layout import resolve_label_boxes
+
+
+def _overlaps(centers, boxes, gap=0.0):
+    b = np.asarray(boxes, dtype=float)
+    pairs = []
+    for i in range(len(b)):
+        for j in range(i + 1, len(b)):
+            dx = abs(centers[i, 0] - centers[j, 0]) < (b[i, 2] + b[j, 2]) / 2.0
+            dy = abs(centers[i, 1] - centers[j, 1]) < (b[i, 3] + b[j, 3]) / 2.0 + gap - 1e-9
+            if dx and dy:
+                pairs.append((i, j))
+    return pairs
+
+
+def test_stacked_labels_do_not_overlap():
+    boxes = [(0.0, 0.0, 1.0, 0.4), (0.1, 0.05, 1.0, 0.4), (-0.1, -0.02, 1.0, 0.4), (0.0, 0.1, 1.0, 0.3)]
+    out = resolve_label_boxes(boxes, gap=0.05)
+    assert out.shape == (4, 2)
+    assert _overlaps(out, boxes, gap=0.05) == []
+    # only y moves
+    assert np.allclose(out[:, 0], [b[0] for b in boxes])
+
+
+def test_separate_boxes_stay_put():
+    boxes = [(-3.0, 0.0, 1.0, 0.4), (3.0, 0.0, 1.0, 0.4), (0.0, 2.0, 1.0, 0.4)]
+    out = resolve_label_boxes(boxes)
+    assert np.allclose(out, [b[:2] for b in boxes])
+
+
+def test_band_is_respected():
+    boxes = [(0.0, 0.9, 1.0, 0.4), (0.0, 0.95, 1.0, 0.4), (0.0, 1.0, 1.0, 0.4)]
+    out = resolve_label_boxes(boxes, y_min=-1.0, y_max=1.0, gap=0.02)
+    assert _overlaps(out, boxes, gap=0.02) == []
+    assert np.all(out[:, 1] + 0.2 <= 1.0 + 1e-9)
+    assert np.all(out[:, 1] - 0.2 >= -1.0 - 1e-9)
+
+
+def test_lanes_only_collide_within_a_lane():
+    boxes = [(0.0, 0.0, 1.0, 0.4), (0.0, 0.0, 1.0, 0.4), (0.0, 0.05, 1.0, 0.4), (0.0, 0.05, 1.0, 0.4)]
+    lanes = ["L", "R", "L", "R"]
+    out = resolve_label_boxes(boxes, lanes=lanes)
+    for lane in ("L", "R"):
+        idx = [i for i, ln in enumerate(lanes) if ln == lane]
+        assert _overlaps(out[idx], [boxes[i] for i in idx]) == []
+    # mirrored lanes resolve to the same stack
+    assert np.allclose(out[[0, 2]], out[[1, 3]])
+
+
+def test_deterministic():
+    rng = np.random.default_rng(3)
+    boxes = np.column_stack([rng.uniform(-2, 2, 30), rng.uniform(-3, 3, 30), np.full(30, 0.8), np.full(30, 0.25)])
+    a = resolve_label_boxes(boxes, gap=0.03, y_min=-4, y_max=4)
+    b = resolve_label_boxes(boxes.copy(), gap=0.03, y_min=-4, y_max=4)
+    assert np.array_equal(a, b)
+    assert _overlaps(a, boxes, gap=0.03) == []